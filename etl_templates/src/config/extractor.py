@@ -1,16 +1,29 @@
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
+from pd_extractor import RETW_ENCODINGS, RETW_PROFILES
+
 from .base import BaseConfigComponent
 
 @dataclass
 class ExtractorConfigData:
     """Configuration settings for the Extractor.
 
-    Specifies the folder for extractor output.
+    Specifies the folder for extractor output, the number of worker processes used for extraction,
+    the number of worker processes used for transforming the mappings of a single document,
+    whether RETW files of unchanged models are reused from previous versions, the encoding of the RETW files,
+    whether attributes and entities are stored once in a catalog of the RETW files and the extraction profile
+    that determines which fields are written.
     """
 
     folder_output: str = "RETW"
+    workers: int = 1
+    workers_mappings: int = 1
+    cache: bool = True
+    encoding: str = "jsonl"
+    normalize: bool = True
+    profile: str = "full"
 
 
 class ExtractorConfig(BaseConfigComponent):
@@ -42,4 +55,123 @@ class ExtractorConfig(BaseConfigComponent):
         """
         folder = self.path_intermediate / self._data.folder_output
         self.create_dir(folder)
-        return folder
\ No newline at end of file
+        return folder
+
+    @property
+    def workers(self) -> int:
+        """
+        Geeft het aantal processen dat gebruikt wordt voor het extraheren van de Power Designer documenten.
+        Een waarde van 0 of lager betekent dat alle beschikbare processorkernen gebruikt worden.
+
+        Returns:
+            int: Het aantal worker processen, minimaal 1.
+        """
+        workers = self._data.workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return workers
+
+    @property
+    def workers_mappings(self) -> int:
+        """
+        Geeft het aantal processen dat per Power Designer document gebruikt wordt voor het transformeren van de mappings.
+        Een waarde van 0 of lager betekent dat alle beschikbare processorkernen gebruikt worden.
+
+        Returns:
+            int: Het aantal worker processen, minimaal 1.
+        """
+        workers = self._data.workers_mappings
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return workers
+
+    @property
+    def cache(self) -> bool:
+        """
+        Geeft aan of RETW-bestanden van ongewijzigde Power Designer documenten hergebruikt worden uit eerdere versies.
+
+        Returns:
+            bool: True als de extractie cache gebruikt wordt.
+        """
+        return self._data.cache
+
+    @property
+    def encoding(self) -> str:
+        """
+        Geeft de encoding van de RETW-bestanden: 'jsonl' of 'msgpack' voor RETW v2, of 'json' voor het oorspronkelijke formaat.
+
+        Returns:
+            str: De encoding van de RETW-bestanden.
+
+        Raises:
+            ValueError: Indien de encoding onbekend is.
+        """
+        if self._data.encoding not in RETW_ENCODINGS:
+            raise ValueError(
+                f"Onbekende RETW encoding '{self._data.encoding}', kies uit: {', '.join(RETW_ENCODINGS)}"
+            )
+        return self._data.encoding
+
+    @property
+    def normalize(self) -> bool:
+        """
+        Geeft aan of attributen en entiteiten eenmalig in een catalogus van de RETW-bestanden worden opgenomen.
+
+        Returns:
+            bool: True als de RETW-bestanden genormaliseerd worden geschreven, anders False.
+        """
+        return self._data.normalize
+
+    @property
+    def profile(self) -> str:
+        """
+        Geeft het extractieprofiel: 'full' voor alle velden of 'lean' voor alleen de velden die de afnemers van de RETW-bestanden gebruiken.
+
+        Returns:
+            str: Het extractieprofiel.
+
+        Raises:
+            ValueError: Indien het profiel onbekend is.
+        """
+        if self._data.profile not in RETW_PROFILES:
+            raise ValueError(
+                f"Onbekend RETW profiel '{self._data.profile}', kies uit: {', '.join(RETW_PROFILES)}"
+            )
+        return self._data.profile
+
+    @property
+    def suffix_output(self) -> str:
+        """
+        Geeft de bestandsextensie van de RETW-bestanden die bij de encoding hoort.
+
+        Returns:
+            str: De bestandsextensie, bijvoorbeeld '.jsonl'.
+        """
+        return RETW_ENCODINGS[self.encoding]
+
+    @property
+    def paths_output_previous(self) -> list[Path]:
+        """
+        Geeft de extractie-outputfolders van eerdere versies van deze run, de nieuwste eerst.
+        Versies zonder extractie-outputfolder worden overgeslagen.
+
+        Returns:
+            list[Path]: De paden naar de extractie-outputfolders van eerdere versies.
+        """
+        folder_versions = self.path_intermediate.parent
+        versions = sorted(
+            [
+                folder
+                for folder in folder_versions.iterdir()
+                if folder.is_dir()
+                and folder.name.startswith("v")
+                and folder != self.path_intermediate
+            ],
+            key=lambda folder: list(map(int, folder.name[1:].split("."))),
+            reverse=True,
+        )
+        return [
+            version / self._data.folder_output
+            for version in versions
+            if (version / self._data.folder_output).is_dir()
+        ]
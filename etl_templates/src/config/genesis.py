@@ -167,6 +167,12 @@ class GenesisConfig(BaseConfigApplication[GenesisConfigData]):
             "folder": "Submap binnen de root waar PowerDesigner bestanden staan",
             "files": "Lijst van PowerDesigner .ldm-bestanden",
             "extractor": "Instellingen voor extractie uit RETW",
+            "workers": "Aantal processen voor de extractie of het inlezen van de RETW-bestanden (1 is sequentieel, 0 is alle processorkernen)",
+            "workers_mappings": "Aantal processen voor de transformatie van mappings per document (1 is sequentieel, 0 is alle processorkernen)",
+            "cache": "Hergebruik RETW-bestanden van ongewijzigde modellen uit eerdere versies",
+            "encoding": "Encoding van de RETW-bestanden: 'jsonl' of 'msgpack' (RETW v2) of 'json' (oorspronkelijk formaat)",
+            "normalize": "Neem attributen en entiteiten eenmalig op in een catalogus van de RETW-bestanden (alleen RETW v2)",
+            "profile": "Extractieprofiel: 'full' voor alle velden of 'lean' voor alleen de velden die Integrator en Generator gebruiken",
             "integrator": "Instellingen voor integratie uit RETW",
             "generator": "Instellingen voor genereren van DDL/ETL",
             "publisher": "Instellingen voor publicatie van scripts",
@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -7,10 +8,11 @@ from .base import BaseConfigComponent
 class IntegratorConfigData:
     """Configuration settings for the Integrator.
 
-    Specifies the folder for Integrator output.
+    Specifies the folder for Integrator output and the number of worker processes used for reading the RETW files.
     """
 
     folder_output: str = "RETW"
+    workers: int = 1
 
 
 class IntegratorConfig(BaseConfigComponent):
@@ -42,4 +44,18 @@ class IntegratorConfig(BaseConfigComponent):
         """
         folder = self.path_intermediate / self._data.folder_output
         self.create_dir(folder)
-        return folder
\ No newline at end of file
+        return folder
+
+    @property
+    def workers(self) -> int:
+        """
+        Geeft het aantal processen dat gebruikt wordt voor het inlezen van de RETW-bestanden.
+        Een waarde van 0 of lager betekent dat alle beschikbare processorkernen gebruikt worden.
+
+        Returns:
+            int: Het aantal worker processen, minimaal 1.
+        """
+        workers = self._data.workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return workers
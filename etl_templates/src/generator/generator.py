@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from integrator import DagImplementation
 
 from logtools import get_logger
@@ -5,6 +7,7 @@ from logtools import get_logger
 from .ddl_entities import DDLEntities
 from .ddl_views_source import DDLSourceViews
 from .ddl_views_source_aggr import DDLSourceViewsAggr
+from .template_fields import get_template_fields
 
 logger = get_logger(__name__)
 
@@ -58,3 +61,14 @@ class DDLGenerator:
             path_output=self.path_output, platform=self.platform
         )
         generator_entities.generate_ddls(entities=entities)
+
+    def get_template_fields(self) -> dict[str, set[str]]:
+        """
+        Geeft per template van het platform de velden die het template uit de entiteiten en mappings leest.
+
+        Returns:
+            dict[str, set[str]]: De gebruikte veldnamen per template.
+        """
+        return get_template_fields(
+            dir_templates=Path(__file__).parent / "templates" / self.platform
+        )
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, nodes
+from logtools import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_template_fields(dir_templates: Path) -> dict[str, set[str]]:
+    """Bepaalt per template welke velden het template uit de aangeboden data leest.
+
+    De templates worden geparsed en alle attributen (`entity.Code`), subscripts (`entity['Code']`) en
+    controles op aanwezigheid (`'Expression' in mapping`) worden verzameld. Hiermee kan gecontroleerd
+    worden of de velden die een template gebruikt in de RETW-bestanden aanwezig zijn.
+
+    Args:
+        dir_templates (Path): De directory met de templates van een platform.
+
+    Returns:
+        dict[str, set[str]]: De gebruikte veldnamen per template.
+    """
+    environment = Environment(loader=FileSystemLoader(dir_templates))
+    templates_fields = {}
+    for name_template in environment.list_templates(extensions=["sql", "jinja"]):
+        source, _, _ = environment.loader.get_source(environment, name_template)
+        templates_fields[name_template] = _get_fields(environment.parse(source))
+    return templates_fields
+
+
+def _get_fields(template: nodes.Template) -> set[str]:
+    """Verzamelt de veldnamen die in een geparsed template gebruikt worden.
+
+    Args:
+        template (nodes.Template): Het geparsede template.
+
+    Returns:
+        set[str]: De gebruikte veldnamen.
+    """
+    fields = set()
+    for node in template.find_all((nodes.Getattr, nodes.Getitem, nodes.Compare)):
+        if isinstance(node, nodes.Getattr):
+            fields.add(node.attr)
+        elif isinstance(node, nodes.Getitem):
+            if isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
+                fields.add(node.arg.value)
+        elif (
+            isinstance(node.expr, nodes.Const)
+            and isinstance(node.expr.value, str)
+            and node.ops[0].op in ("in", "notin")
+        ):
+            fields.add(node.expr.value)
+    return fields
@@ -1,6 +1,7 @@
 from .dag_builder import DagBuilder, EntityRef, MappingRef, VertexType
 from .dag_etl_simulator import EtlSimulator, FailureStrategy
 from .dag_implementation import DagImplementation, DeadlockPrevention
+from .dag_reachability import DagReachability
 from .dag_reporting import DagReporting
 
 __all__ = [
@@ -14,5 +15,6 @@ __all__ = [
     "FailureStrategy",
     "DagImplementation",
     "DeadlockPrevention",
+    "DagReachability",
     "DagReporting",
 ]
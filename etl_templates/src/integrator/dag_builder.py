@@ -1,20 +1,43 @@
 import hashlib
-import json
 from collections import namedtuple
-from copy import deepcopy
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
 
 import igraph as ig
+import orjson
 from logtools import get_logger
+from pd_extractor import (
+    Attribute,
+    AttributeMapping,
+    Composition,
+    from_RETW,
+    read_RETW,
+)
 from tqdm import tqdm
 
+from .dag_reachability import DagReachability
+
 logger = get_logger(__name__)
 
 EntityRef = namedtuple("EntityRef", ("CodeModel", "CodeEntity"))
 MappingRef = namedtuple("MappingRef", ("CodeModel", "CodeMapping"))
 
+# Zware velden van entiteiten en mappings die niet nodig zijn voor de topologie van de graaf
+PAYLOAD_KEYS = ("Attributes", "AttributeMapping", "SourceComposition")
+# Compacte objecten waarin de items van de zware velden worden geladen
+_PAYLOAD_TYPES = {
+    "Attributes": Attribute,
+    "AttributeMapping": AttributeMapping,
+    "SourceComposition": Composition,
+}
+# Tijdelijke sleutels waaronder de gecodeerde payload en de bronentiteiten uit de worker komen
+_KEY_PAYLOAD = "PayloadRETW"
+_KEY_ENTITIES_SOURCE = "EntitiesSourceRETW"
+# Graaf attribuut waarin de index van de knopen per naam wordt bewaard
+_KEY_INDEX_NAMES = "index_names"
+
 
 class VertexType(Enum):
     """Enumeratie van de typen knopen in de graaf.
@@ -62,6 +85,69 @@ class NoFlowError(Exception):
         super().__init__(self.message)
 
 
+def _read_RETW_topology(file_RETW: str) -> dict:
+    """Leest een RETW bestand en zet de zware velden van de entiteiten en mappings apart.
+
+    De velden uit PAYLOAD_KEYS worden per entiteit van het document model en per mapping als gecodeerde payload
+    opgeslagen, zodat het opbouwen van de topologie niet op het decoderen van deze velden hoeft te wachten. De
+    bronentiteiten van een mapping, die knopen in de graaf worden, blijven wel beschikbaar. Wordt ook in worker
+    processen uitgevoerd.
+
+    Args:
+        file_RETW (str): RETW bestand met modellen en/of mappings
+
+    Returns:
+        dict: De inhoud van het RETW bestand zonder de zware velden
+    """
+    dict_RETW = read_RETW(file_RETW)
+    for model in dict_RETW.get("Models", []):
+        if model.get("IsDocumentModel") is True:
+            for entity in model.get("Entities", []):
+                _split_payload(item=entity)
+    for mapping in dict_RETW.get("Mappings", []):
+        mapping[_KEY_ENTITIES_SOURCE] = [
+            source["Entity"] for source in mapping.get("SourceComposition", [])
+        ]
+        _split_payload(item=mapping)
+    return dict_RETW
+
+
+def _split_payload(item: dict) -> None:
+    """Verplaatst de zware velden van een entiteit of mapping naar een gecodeerde payload.
+
+    Args:
+        item (dict): De entiteit of mapping
+    """
+    if payload := {key: item.pop(key) for key in PAYLOAD_KEYS if key in item}:
+        item[_KEY_PAYLOAD] = orjson.dumps(payload)
+
+
+def _project_edges(
+    edges_first: list[tuple[int, int]], edges_second: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Bepaalt de verbindingen van het product van twee ijle incidentiematrices.
+
+    Beide matrices worden als lijst van verbindingen (rij, kolom) opgegeven. Het product bevat een verbinding (i, j)
+    als er een k is waarvoor (i, k) in de eerste en (k, j) in de tweede lijst voorkomt. De kosten zijn evenredig
+    aan het aantal verbindingen.
+
+    Args:
+        edges_first (list[tuple[int, int]]): De verbindingen van de eerste matrix.
+        edges_second (list[tuple[int, int]]): De verbindingen van de tweede matrix.
+
+    Returns:
+        list[tuple[int, int]]: De unieke verbindingen van het product, in volgorde van de eerste matrix.
+    """
+    rows_second = {}
+    for k, j in edges_second:
+        rows_second.setdefault(k, []).append(j)
+    return list(
+        dict.fromkeys(
+            (i, j) for i, k in edges_first for j in rows_second.get(k, ())
+        )
+    )
+
+
 class DagBuilder:
     """Genereert en beheert gerichte acyclische grafen (DAG's) die ETL-processen representeren.
 
@@ -82,13 +168,19 @@ class DagBuilder:
         self.mappings: dict = {}
         self.edges: list = []
         self.dag: ig.Graph = None
+        self.workers: int = 1
+        self.payloads_lazy: bool = False
+        self._payloads: dict = {}
+        self._views: dict = {}
+        self._reachability: dict = {}
         self._progress_description = "Integreren van PD bestanden"
 
     def build_dag(self, files_RETW: str | list):
         """Genereert een graaf met alle mappings, entiteiten en RETW bestanden.
 
         Bouwt een igraph graaf met de verzamelde mappings, entiteiten en bestanden als knopen,
-        en legt de verbindingen tussen de knopen aan.
+        en legt de verbindingen tussen de knopen aan. De graaf wordt eerst zonder de zware velden
+        (PAYLOAD_KEYS) opgebouwd; deze worden daarna geladen, of bij payloads_lazy pas bij aanroep van load_payloads.
 
         Args:
             files_RETW (str|list): Enkel RETW bestandspad of lijst van RETW-bestandspaden met mappings.
@@ -108,6 +200,116 @@ class DagBuilder:
         edges = list(self.edges)
         self.dag = ig.Graph.DictList(vertices=vertices, edges=edges, directed=True)
         self._add_dag_statistics()
+        self._invalidate_views()
+        if not self.payloads_lazy:
+            self.load_payloads()
+
+    def load_payloads(self) -> None:
+        """Laadt de zware velden (PAYLOAD_KEYS) van de entiteiten en mappings in de graaf.
+
+        De payloads worden alleen de eerste keer gedecodeerd, naar compacte objecten (zie pd_extractor.retw_domain);
+        afnemers die enkel de topologie van de graaf gebruiken hoeven deze functie niet aan te roepen.
+
+        Raises:
+            ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
+        """
+        if not self.dag:
+            raise ErrorDagNotBuilt
+        if not self._payloads:
+            return
+        payloads = {
+            id_vertex: {
+                key: from_RETW(_PAYLOAD_TYPES[key], value)
+                for key, value in orjson.loads(payload).items()
+            }
+            for id_vertex, payload in self._payloads.items()
+        }
+        self._payloads = {}
+        # Alle velden krijgen een kolom, ook als ze nergens voorkomen (bijvoorbeeld zonder modellen bij een extractie van alleen mappings)
+        for key in PAYLOAD_KEYS:
+            self.dag.vs[key] = [
+                payloads.get(id_vertex, {}).get(key)
+                for id_vertex in self.dag.vs["name"]
+            ]
+        self._add_payload_derived()
+        self._invalidate_views()
+
+    def _add_payload_derived(self) -> None:
+        """Verrijkt de knopen met afgeleide informatie uit de zware velden, nadat deze zijn geladen."""
+        pass
+
+    def _invalidate_views(self) -> None:
+        """Vergeet de afgeleide grafen en bereikbaarheidsindexen, zodat ze bij de volgende aanvraag opnieuw worden opgebouwd.
+
+        Moet aangeroepen worden na iedere wijziging van de knopen of hun attributen in de volledige graaf.
+        """
+        self._views = {}
+        self._reachability = {}
+
+    def _get_view(self, key: tuple, build_view) -> ig.Graph:
+        """Geeft een afgeleide graaf terug, die alleen bij de eerste aanvraag wordt opgebouwd.
+
+        De afgeleide graaf deelt de attribuutwaarden (waaronder de payloads) met de volledige graaf. Afnemers krijgen
+        een ondiepe kopie, zodat ze knopen en attributen kunnen aanpassen zonder de bewaarde graaf te wijzigen.
+
+        Args:
+            key (tuple): Sleutel waaronder de afgeleide graaf wordt bewaard.
+            build_view (Callable[[], ig.Graph]): Functie die de afgeleide graaf opbouwt.
+
+        Returns:
+            ig.Graph: Een kopie van de afgeleide graaf.
+
+        Raises:
+            ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
+        """
+        if not self.dag:
+            raise ErrorDagNotBuilt
+        if key not in self._views:
+            self._views[key] = build_view()
+        return self._views[key].copy()
+
+    def _get_edges_by_type(self) -> dict[str, list[tuple[int, int]]]:
+        """Geeft de verbindingen van de graaf als (bron, doel) indices, gegroepeerd per type verbinding.
+
+        Returns:
+            dict[str, list[tuple[int, int]]]: De verbindingen per EdgeType naam.
+        """
+        edges = {type_edge.name: [] for type_edge in EdgeType}
+        for edge, type_edge in zip(self.dag.get_edgelist(), self.dag.es["type"]):
+            edges[type_edge].append(edge)
+        return edges
+
+    def _build_projection(
+        self, idx_vertices: list[int], edges: list[tuple[int, int]]
+    ) -> ig.Graph:
+        """Bouwt in één keer een graaf van een deel van de knopen met nieuwe verbindingen.
+
+        De knopen nemen hun attributen, bij verwijzing, over uit de volledige graaf. De verbindingen krijgen, net als
+        bij ig.Graph.DictList, de namen van hun bron- en doelknoop als attributen 'source' en 'target'.
+
+        Args:
+            idx_vertices (list[int]): De indices van de knopen in de volledige graaf.
+            edges (list[tuple[int, int]]): De verbindingen tussen de knopen, als indices in de volledige graaf.
+
+        Returns:
+            ig.Graph: De geprojecteerde graaf.
+        """
+        position = {idx: pos for pos, idx in enumerate(idx_vertices)}
+        vertex_attrs = {}
+        for attribute in self.dag.vs.attributes():
+            values = self.dag.vs[attribute]
+            vertex_attrs[attribute] = [values[idx] for idx in idx_vertices]
+        names = self.dag.vs["name"]
+        return ig.Graph(
+            n=len(idx_vertices),
+            edges=[(position[source], position[target]) for source, target in edges],
+            directed=True,
+            vertex_attrs=vertex_attrs,
+            edge_attrs={
+                "source": [names[source] for source, _ in edges],
+                "target": [names[target] for _, target in edges],
+            },
+        )
 
     def _add_RETW_files(self, files_RETW: list) -> bool:
         """Verwerk meerdere RETW-bestanden.
@@ -122,35 +324,56 @@ class DagBuilder:
         """
         # Make sure added files are unique
         files_RETW = list(dict.fromkeys(files_RETW))
-
-        # Process files
-        for file_RETW in tqdm(
-            files_RETW, desc=self._progress_description, colour="#b6d7a8", leave=False
-        ):
-            # Add file to parser
-            if not self._add_RETW_file(file_RETW=file_RETW):
-                logger.error(f"Failed to add RETW file '{file_RETW}'")
-                return False
+        progress = {
+            "desc": self._progress_description,
+            "colour": "#b6d7a8",
+            "leave": False,
+        }
+        workers = min(self.workers, len(files_RETW))
+        if workers <= 1:
+            for file_RETW in tqdm(files_RETW, **progress):
+                if not self._add_RETW_file(file_RETW=file_RETW):
+                    logger.error(f"Failed to add RETW file '{file_RETW}'")
+                    return False
+            return True
+
+        # Decode files concurrently, add them to the graph in the original order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_read_RETW_topology, file_RETW)
+                for file_RETW in files_RETW
+            ]
+            for file_RETW, future in tqdm(
+                zip(files_RETW, futures), total=len(futures), **progress
+            ):
+                if not self._add_RETW_file(file_RETW=file_RETW, future=future):
+                    logger.error(f"Failed to add RETW file '{file_RETW}'")
+                    executor.shutdown(cancel_futures=True)
+                    return False
         return True
 
-    def _add_RETW_file(self, file_RETW: str) -> bool:
-        """Laadt een RETW json bestand
+    def _add_RETW_file(self, file_RETW: str, future: Future | None = None) -> bool:
+        """Laadt een RETW bestand, in het oorspronkelijke JSON formaat (v1) of als RETW v2 (JSON Lines of msgpack)
 
         Args:
             file_RETW (str): RETW bestand met modellen en/of mappings
+            future (Future | None): Het resultaat van het gelijktijdig inlezen van het RETW bestand, indien
+                niet opgegeven wordt het bestand hier ingelezen.
 
         Returns:
             bool: Geeft aan of alle RETW-bestand is verwerkt.
         """
         try:
-            with open(file_RETW) as file:
-                dict_RETW = json.load(file)
+            if future is None:
+                dict_RETW = _read_RETW_topology(file_RETW)
+            else:
+                dict_RETW = future.result()
             logger.info(f"RETW bestand '{file_RETW}' toegevoegd")
         except FileNotFoundError:
             logger.error(f"Kon RETW bestand '{file_RETW}' niet vinden.")
             return False
-        except json.JSONDecodeError:
-            logger.error(f"Invalide JSON content in het RETW bestand '{file_RETW}'")
+        except ValueError:
+            logger.error(f"Invalide content in het RETW bestand '{file_RETW}'")
             return False
 
         # Add file node information
@@ -254,6 +477,123 @@ class DagBuilder:
         code_model, code_mapping = mapping_ref
         return self._stable_hash(key=code_model + code_mapping)
 
+    def get_vertex_index(self, name: int, dag: ig.Graph | None = None) -> int:
+        """Geeft de index van een knoop op basis van zijn naam.
+
+        De index per naam wordt eenmalig per graaf opgebouwd en bij de graaf bewaard, zodat het opzoeken van
+        een knoop geen doorloop over alle knopen vereist. Dit geldt ook voor afgeleide grafen, zoals de ETL-graaf
+        of de simulatiegraaf. Als de knopen van een graaf zijn gewijzigd, wordt de index opnieuw opgebouwd.
+
+        Args:
+            name (int): De naam (stabiele hash-ID) van de knoop.
+            dag (ig.Graph | None): De graaf waarin gezocht wordt; bij None de opgebouwde graaf.
+
+        Returns:
+            int: De index van de knoop in de graaf.
+
+        Raises:
+            ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
+            ValueError: Als de graaf geen knoop met deze naam bevat.
+        """
+        if dag is None:
+            if not self.dag:
+                raise ErrorDagNotBuilt
+            dag = self.dag
+        index = dag[_KEY_INDEX_NAMES] if _KEY_INDEX_NAMES in dag.attributes() else {}
+        idx = index.get(name)
+        if idx is None or idx >= dag.vcount() or dag.vs[idx]["name"] != name:
+            # De index wordt vervangen en niet aangepast, omdat afgeleide grafen hem kunnen delen
+            index = {name_vertex: idx for idx, name_vertex in enumerate(dag.vs["name"])}
+            dag[_KEY_INDEX_NAMES] = index
+            idx = index.get(name)
+            if idx is None:
+                raise ValueError(f"Geen knoop met naam '{name}' in de graaf")
+        return idx
+
+    def get_entity_index(self, entity_ref: EntityRef, dag: ig.Graph | None = None) -> int:
+        """Geeft de index van de knoop van een entiteit.
+
+        Args:
+            entity_ref (EntityRef): Een namedtuple met de code van het model en de code van de entiteit.
+            dag (ig.Graph | None): De graaf waarin gezocht wordt; bij None de opgebouwde graaf.
+
+        Returns:
+            int: De index van de knoop van de entiteit.
+
+        Raises:
+            ValueError: Als de graaf de entiteit niet bevat.
+        """
+        return self.get_vertex_index(name=self.get_entity_id(entity_ref), dag=dag)
+
+    def get_mapping_index(self, mapping_ref: MappingRef, dag: ig.Graph | None = None) -> int:
+        """Geeft de index van de knoop van een mapping.
+
+        Args:
+            mapping_ref (MappingRef): Een namedtuple met de code van het model en de code van de mapping.
+            dag (ig.Graph | None): De graaf waarin gezocht wordt; bij None de opgebouwde graaf.
+
+        Returns:
+            int: De index van de knoop van de mapping.
+
+        Raises:
+            ValueError: Als de graaf de mapping niet bevat.
+        """
+        return self.get_vertex_index(name=self.get_mapping_id(mapping_ref), dag=dag)
+
+    def get_reachability(self, etl: bool = False) -> DagReachability:
+        """Geeft de bereikbaarheidsindex van de graaf, die alleen bij de eerste aanvraag wordt opgebouwd.
+
+        Args:
+            etl (bool, optional): Geeft de index van de ETL-graaf (zie get_dag_ETL) in plaats van de volledige graaf;
+                de knopen van iedere ETL-graaf hebben dezelfde indices. Standaard False.
+
+        Returns:
+            DagReachability: De bereikbaarheidsindex.
+
+        Raises:
+            ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
+        """
+        if not self.dag:
+            raise ErrorDagNotBuilt
+        if etl not in self._reachability:
+            dag = self.get_dag_ETL() if etl else self.dag
+            self._reachability[etl] = DagReachability(dag)
+        return self._reachability[etl]
+
+    def get_ancestors(self, ref: EntityRef | MappingRef) -> list[int]:
+        """Geeft de indices van alle directe en indirecte voorgangers van een entiteit of mapping in de graaf.
+
+        Args:
+            ref (EntityRef | MappingRef): De entiteit of mapping.
+
+        Returns:
+            list[int]: De oplopende indices van de voorgangers.
+
+        Raises:
+            ValueError: Als de graaf de entiteit of mapping niet bevat.
+        """
+        return self.get_reachability().ancestors(self._get_ref_index(ref))
+
+    def get_descendants(self, ref: EntityRef | MappingRef) -> list[int]:
+        """Geeft de indices van alle directe en indirecte opvolgers van een entiteit of mapping in de graaf.
+
+        Args:
+            ref (EntityRef | MappingRef): De entiteit of mapping.
+
+        Returns:
+            list[int]: De oplopende indices van de opvolgers.
+
+        Raises:
+            ValueError: Als de graaf de entiteit of mapping niet bevat.
+        """
+        return self.get_reachability().descendants(self._get_ref_index(ref))
+
+    def _get_ref_index(self, ref: EntityRef | MappingRef) -> int:
+        """Geeft de index van de knoop van een entiteit of mapping."""
+        if isinstance(ref, MappingRef):
+            return self.get_mapping_index(ref)
+        return self.get_entity_index(ref)
+
     def _add_model_entities(self, file_RETW: str, dict_RETW: dict) -> None:
         """Voegt model entiteiten toe aan de graaf.
 
@@ -267,6 +607,10 @@ class DagBuilder:
         Returns:
             None
         """
+        if "Models" not in dict_RETW:
+            # Een extractie van alleen mappings bevat geen modellen
+            logger.info(f"Geen modellen in het RETW bestand '{file_RETW}'")
+            return
         # Determine document model
         model = [
             model for model in dict_RETW["Models"] if model["IsDocumentModel"] is True
@@ -292,6 +636,8 @@ class DagBuilder:
                     "FileRETW": str(file_RETW),
                 }
             )
+            if payload := entity.pop(_KEY_PAYLOAD, None):
+                self._payloads[id_entity] = payload
             dict_entity = {id_entity: entity}
 
             self.entities.update(dict_entity)
@@ -327,6 +673,9 @@ class DagBuilder:
                     "type": VertexType.MAPPING.name,
                 }
             )
+            entities_source = mapping_RETW.pop(_KEY_ENTITIES_SOURCE, [])
+            if payload := mapping_RETW.pop(_KEY_PAYLOAD, None):
+                self._payloads[id_mapping] = payload
             mapping = {id_mapping: mapping_RETW}
             self.mappings.update(mapping)
             edge_mapping_file = {
@@ -340,30 +689,31 @@ class DagBuilder:
                 "FileRETW": str(file_RETW),
             }
             self.edges.append(edge_mapping_file)
-            self._add_mapping_sources(id_mapping=id_mapping, mapping=mapping_RETW)
+            self._add_mapping_sources(
+                id_mapping=id_mapping, mapping=mapping_RETW, entities_source=entities_source
+            )
             self._add_mapping_target(id_mapping=id_mapping, mapping=mapping_RETW)
 
-    def _add_mapping_sources(self, id_mapping: int, mapping: dict) -> None:
+    def _add_mapping_sources(
+        self, id_mapping: int, mapping: dict, entities_source: list[dict]
+    ) -> None:
         """Voegt bronentiteiten van een mapping toe aan de graaf.
 
-        Extraheert de bronentiteiten uit de mapping, voegt deze als knopen toe aan de graaf,
+        Voegt de bronentiteiten uit de broncompositie van de mapping als knopen toe aan de graaf,
         en maakt verbindingen tussen de bronentiteiten en de mapping.
 
         Args:
             id_mapping (int): Unieke identifier van de mapping.
             mapping (dict): Dictionary met mapping-gegevens.
+            entities_source (list[dict]): De entiteiten uit de broncompositie van de mapping.
 
         Returns:
             None
         """
-        has_source_compositions = "SourceComposition" in mapping
-        if has_source_compositions:
-            has_source_compositions = len(mapping["SourceComposition"]) > 0
-        if not has_source_compositions:
+        if not entities_source:
             logger.error(f"No source entities for mapping '{mapping['Name']}'")
             return
-        for source in mapping["SourceComposition"]:
-            source_entity = source["Entity"]
+        for source_entity in entities_source:
             if (
                 "Stereotype" in source_entity
                 and source_entity["Stereotype"] == "mdde_FilterBusinessRule"
@@ -432,83 +782,103 @@ class DagBuilder:
         Returns:
             None
         """
-        self._stats_mapping_run_level()
-        self._stats_entity_level()
+        self._stats_levels()
         self._mappings_share_target()
 
-    def _stats_mapping_run_level(self):
-        """Bepaalt en wijst run-levels toe aan mappings in de graaf.
+    def _stats_levels(self):
+        """Bepaalt en wijst run-levels toe aan mappings en ETL-niveaus aan entiteiten in de graaf.
 
-        Bereken voor elke mapping het aantal voorafgaande mappings en wijs een run-level toe op basis van afhankelijkheden.
-        Dit helpt bij het bepalen van de uitvoeringsvolgorde van mappings in het ETL-proces.
+        Het run-level van een mapping is de lengte van het langste pad van voorafgaande mappings: een mapping
+        zonder voorafgaande mappings krijgt run-level 0. Het ETL-niveau van een entiteit is het hoogste run-level
+        van de mappings die de entiteit vullen plus één, of 0 als de entiteit door geen enkele mapping wordt gevuld.
+        Het run-level van een mapping is daarmee het hoogste ETL-niveau van zijn bronentiteiten. Beide worden in
+        één doorloop over de knopen in topologische volgorde bepaald en in één keer aan de graaf toegevoegd.
 
         Returns:
             None
         """
-        # For each node calculate the number of mapping nodes before the current node
-        dag_mappings = self.get_dag_mappings()
-        dag_mappings.vs["qty_preceding"] = [
-            len(dag_mappings.subcomponent(dag_mappings.vs[i], mode="in")) - 1
-            for i in range(dag_mappings.vcount())
-        ]
+        qty_vertices = self.dag.vcount()
+        types = self.dag.vs["type"]
+        adjacency_in = self.dag.get_adjlist(mode="in")
+        levels = [None] * qty_vertices
+
+        order = self.dag.topological_sorting(mode="out")
+        if len(order) < qty_vertices:
+            logger.error(
+                "De graaf bevat een cyclische afhankelijkheid tussen mappings, de run-levels zijn niet betrouwbaar"
+            )
+            in_order = set(order)
+            order.extend(idx for idx in range(qty_vertices) if idx not in in_order)
+
+        type_mapping = VertexType.MAPPING.name
+        type_entity = VertexType.ENTITY.name
+        for idx in order:
+            type_vertex = types[idx]
+            if type_vertex == type_entity:
+                # Het hoogste run-level van de vullende mappings plus één
+                levels[idx] = max(
+                    (
+                        levels[idx_pred] + 1
+                        for idx_pred in adjacency_in[idx]
+                        if types[idx_pred] == type_mapping
+                        and levels[idx_pred] is not None
+                    ),
+                    default=0,
+                )
+            elif type_vertex == type_mapping:
+                # Het hoogste ETL-niveau van de bronentiteiten
+                levels[idx] = max(
+                    (
+                        levels[idx_pred]
+                        for idx_pred in adjacency_in[idx]
+                        if types[idx_pred] == type_entity
+                        and levels[idx_pred] is not None
+                    ),
+                    default=0,
+                )
 
-        dag_mappings.vs.select(qty_preceding_eq=0)["run_level"] = 0
-        # Set run_levels iterating from lowest preceding number of mappings to highest
-        vs_processing = [
-            vx
-            for vx in dag_mappings.vs.select(run_level_eq=0)
-            if len(dag_mappings.neighbors(vx, mode="out")) > 0
+        self.dag.vs["run_level"] = [
+            level if type_vertex == type_mapping else None
+            for level, type_vertex in zip(levels, types)
+        ]
+        self.dag.vs["etl_level"] = [
+            level if type_vertex == type_entity else None
+            for level, type_vertex in zip(levels, types)
         ]
-
-        for vx in vs_processing:
-            vs_successors = dag_mappings.neighbors(vx, mode="out")
-            dag_mappings.vs[vs_successors]["run_level"] = vx["run_level"] + 1
-            vs_processing.extend(dag_mappings.vs[vs_successors])
-
-        # Adding run levels to the DAG with mappings and entities
-        for vx in dag_mappings.vs:
-            self.dag.vs.select(name_eq=vx["name"])["run_level"] = vx["run_level"]
-
-    def _stats_entity_level(self):
-        """Bepaalt en wijst ETL-niveaus toe aan entiteiten in de graaf.
-
-        Voor elke entiteit wordt het hoogste run-level van de inkomende mappings bepaald en het ETL-niveau van de entiteit hierop gebaseerd.
-        Dit helpt bij het structureren van de volgorde waarin entiteiten in het ETL-proces worden verwerkt.
-
-        Returns:
-            None
-        """
-        vs_entities = self.dag.vs.select(type_eq=VertexType.ENTITY.name)
-        for vx in vs_entities:
-            vs_mappings = [
-                self.dag.vs[idx]
-                for idx in self.dag.neighbors(vx, mode="in")
-                if self.dag.vs[idx]["type"] == VertexType.MAPPING.name
-            ]
-            if vs_mappings:
-                run_level_max = max(vx["run_level"] for vx in vs_mappings) + 1
-            else:
-                run_level_max = 0
-            vx["etl_level"] = run_level_max
 
     def _mappings_share_target(self) -> None:
         """Bepaalt of meerdere mappings dezelfde doelentiteit delen.
 
-        Voor elke mapping wordt gecontroleerd of de doelentiteit door meer dan één mapping wordt gebruikt,
-        en wordt deze informatie opgeslagen in het attribuut 'multi_mapping' van de mapping.
+        Voor elke mapping wordt gecontroleerd of de doelentiteit door meer dan één mapping wordt gevuld,
+        en wordt deze informatie opgeslagen in het attribuut 'multi_mapping' van de mapping. De mappings per
+        doelentiteit worden in één doorloop over de edges verzameld.
 
         Returns:
             None
         """
-        vs_mappings = self.dag.vs.select(type_eq=VertexType.MAPPING.name)
-        for vx in vs_mappings:
-            vx_entity_target = self.dag.neighbors(vx, mode="out")
-            if vx_entity_target:
-                vx_entity_target = vx_entity_target[0]
+        type_target = EdgeType.ENTITY_TARGET.name
+        entity_target = {}
+        mappings_entity = {}
+        for (idx_mapping, idx_entity), type_edge in zip(
+            self.dag.get_edgelist(), self.dag.es["type"]
+        ):
+            if type_edge == type_target:
+                entity_target[idx_mapping] = idx_entity
+                # Een mapping die in meerdere RETW-bestanden voorkomt telt één keer
+                mappings_entity.setdefault(idx_entity, set()).add(idx_mapping)
+
+        multi_mapping = []
+        for idx, type_vertex in enumerate(self.dag.vs["type"]):
+            if type_vertex != VertexType.MAPPING.name:
+                multi_mapping.append(None)
+            elif idx in entity_target:
+                multi_mapping.append(len(mappings_entity[entity_target[idx]]) > 1)
             else:
-                logger.error(f"Mapping heeft geen doelentiteit '{vx["Name"]}'")
-            qty_mappings = len(self.dag.neighbors(vx_entity_target, mode="in"))
-            vx["multi_mapping"] = qty_mappings > 1
+                logger.error(
+                    f"Mapping heeft geen doelentiteit '{self.dag.vs[idx]['Name']}'"
+                )
+                multi_mapping.append(False)
+        self.dag.vs["multi_mapping"] = multi_mapping
 
     def get_dag_total(self) -> ig.Graph:
         """Geeft de volledige gegenereerde graaf (DAG) terug.
@@ -542,14 +912,17 @@ class DagBuilder:
             ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
         """
         logger.info(f"Creating a graph for the file, '{file_retw}'")
-        if not self.dag:
-            raise ErrorDagNotBuilt
-        dag = self.dag.copy()
-        vx_file = dag.vs.select(FileRETW_eq=file_retw)
-        vx_file_graph = dag.subcomponent(vx_file[0], mode="out")
-        vx_delete = [i for i in dag.vs.indices if i not in vx_file_graph]
-        dag.delete_vertices(vx_delete)
-        return dag
+        return self._get_view(
+            key=("file", file_retw),
+            build_view=lambda: self._build_view_file(file_retw=file_retw),
+        )
+
+    def _build_view_file(self, file_retw: str) -> ig.Graph:
+        """Bouwt de subgraaf van alle knopen die vanuit een RETW-bestand bereikbaar zijn."""
+        idx_file = self.dag.vs.select(FileRETW_eq=file_retw)[0].index
+        return self.dag.induced_subgraph(
+            sorted([idx_file] + self.get_reachability().descendants(idx_file))
+        )
 
     def get_dag_file_dependencies(self, include_entities: bool = True) -> ig.Graph:
         """Genereert een afhankelijkheidsgraaf tussen RETW-bestanden.
@@ -566,148 +939,61 @@ class DagBuilder:
         Raises:
             ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
         """
-        if not self.dag:
-            raise ErrorDagNotBuilt
-        dag = self.dag.copy()
-
-        vs_files = dag.vs.select(type_eq=VertexType.FILE_RETW.name)
-        dict_vertices = {}
-        lst_edges = []
-
-        for vx_file in vs_files:
-            dict_vertices |= {vx_file["name"]: vx_file.attributes()}
-            vs_mappings = self._get_mappings_for_file(dag=dag, vx_file=vx_file)
-            for vx_mapping in vs_mappings:
-                vs_source_entities = self._get_source_entities_for_mapping(
-                    dag=dag, vx_mapping=vx_mapping
-                )
-                for vx_source_entity in vs_source_entities:
-                    vx_file_source = self._get_file_source_for_entity(
-                        dag=dag, vx_source_entity=vx_source_entity, vx_file=vx_file
-                    )
-                    if not vx_file_source:
-                        continue
-                    vx_file_source = vx_file_source[0]
-                    dict_vertices |= {
-                        vx_file_source["name"]: vx_file_source.attributes()
-                    }
-                    if include_entities:
-                        dict_vertices |= {
-                            vx_source_entity["name"]: vx_source_entity.attributes()
-                        }
-                        lst_edges.extend(
-                            self._make_entity_edges(
-                                vx_file_source=vx_file_source,
-                                vx_source_entity=vx_source_entity,
-                                vx_file=vx_file,
-                            )
-                        )
-                    else:
-                        lst_edges.append(
-                            self._make_file_edge(
-                                vx_file_source=vx_file_source, vx_file=vx_file
-                            )
-                        )
-
-        dag_dependencies = ig.Graph.DictList(
-            vertices=list(dict_vertices.values()), edges=lst_edges, directed=True
+        return self._get_view(
+            key=("file_dependencies", include_entities),
+            build_view=lambda: self._build_view_file_dependencies(
+                include_entities=include_entities
+            ),
         )
-        return dag_dependencies
 
-    def _get_mappings_for_file(
-        self, dag: ig.Graph, vx_file: ig.Vertex
-    ) -> list[ig.Vertex]:
-        """Geeft alle mappings terug die direct verbonden zijn aan een RETW-bestand.
+    def _build_view_file_dependencies(self, include_entities: bool) -> ig.Graph:
+        """Bouwt de afhankelijkheidsgraaf tussen RETW-bestanden uit de verbindingen van de volledige graaf.
 
-        Zoekt naar alle mapping knopen die als opvolgers van het opgegeven RETW-bestand in de graaf voorkomen.
-        Dit wordt gebruikt om te bepalen welke mappings bij een specifiek bestand horen.
+        Een bestand hangt af van een ander bestand als een van zijn mappings een entiteit als bron gebruikt die in
+        het andere bestand is gedefinieerd. De bronentiteiten per bestand zijn het product van de verbindingen
+        bestand→mapping en mapping→bronentiteit.
 
         Args:
-            dag (ig.Graph): De graaf waarin gezocht wordt.
-            vx_file (ig.Vertex): Het RETW-bestand waarvoor mappings worden gezocht.
+            include_entities (bool): Of de bronentiteiten als tussenliggende knopen worden opgenomen.
 
         Returns:
-            list[ig.Vertex]: Een lijst van mapping knopen die bij het bestand horen.
-        """
-        return [
-            vs
-            for vs in dag.vs(dag.successors(vx_file))
-            if vs["type"] == VertexType.MAPPING.name
-        ]
-
-    def _get_source_entities_for_mapping(
-        self, dag: ig.Graph, vx_mapping: ig.Vertex
-    ) -> list[ig.Vertex]:
-        """Geeft alle bron-entiteiten terug voor een mapping.
-
-        Deze functie zoekt alle entiteiten die direct verbonden zijn als bron aan de opgegeven mapping,
-        zodat afhankelijkheden tussen mappings en entiteiten inzichtelijk worden.
-
-        Args:
-            dag (ig.Graph): De graaf waarin gezocht wordt.
-            vx_mapping (ig.Vertex): De mapping waarvoor bron-entiteiten worden gezocht.
-
-        Returns:
-            list: Een lijst van bron-entiteit knopen.
-        """
-        vs_first_order = dag.vs(dag.neighborhood(vx_mapping, mode="in"))
-        return [vx for vx in vs_first_order if vx["type"] == VertexType.ENTITY.name]
-
-    def _get_file_source_for_entity(
-        self, dag: ig.Graph, vx_source_entity: ig.Vertex, vx_file: ig.Vertex
-    ) -> list[ig.Vertex]:
-        """Geeft het bronbestand van een entiteit terug, exclusief het opgegeven doelbestand.
-
-        Zoekt naar het RETW-bestand dat als bron dient voor de opgegeven entiteit, waarbij het doelbestand wordt uitgesloten.
-        Dit wordt gebruikt om afhankelijkheden tussen verschillende RETW-bestanden via gedeelde entiteiten te bepalen.
-
-        Args:
-            dag (ig.Graph): De graaf waarin gezocht wordt.
-            vx_source_entity (ig.Vertex): De bronentiteit waarvoor het bronbestand wordt gezocht.
-            vx_file (ig.Vertex): Het doelbestand dat uitgesloten moet worden.
-
-        Returns:
-            list[ig.Vertex]: Een lijst met het bronbestand als igraph Vertex, exclusief het doelbestand.
+            ig.Graph: De afhankelijkheidsgraaf tussen RETW-bestanden.
         """
-        return [
-            vx
-            for vx in dag.vs(dag.neighborhood(vx_source_entity.index, mode="in"))
-            if vx["type"] == VertexType.FILE_RETW.name and vx["name"] != vx_file["name"]
+        edges = self._get_edges_by_type()
+        mappings_entity = [
+            (idx_mapping, idx_entity)
+            for idx_entity, idx_mapping in edges[EdgeType.ENTITY_SOURCE.name]
         ]
-
-    def _make_entity_edges(
-        self, vx_file_source: ig.Vertex, vx_source_entity: ig.Vertex, vx_file: ig.Vertex
-    ) -> tuple[dict]:
-        """Maakt edges tussen een bronbestand, een bronentiteit en een doelbestand.
-
-        Genereert een tuple van dictionary's die de verbindingen voorstellen van het bronbestand naar de bronentiteit,
-        en van de bronentiteit naar het doelbestand. Dit wordt gebruikt om afhankelijkheden via entiteiten te modelleren.
-
-        Args:
-            vx_file_source (ig.Vertex): Het bronbestand als igraph Vertex.
-            vx_source_entity (ig.Vertex): De bronentiteit als igraph Vertex.
-            vx_file (ig.Vertex): Het doelbestand als igraph Vertex.
-
-        Returns:
-            tuple[dict]: Een tuple met twee dictionary's die de edges voorstellen.
-        """
-        return (
-            {
-                "source": vx_file_source["name"],
-                "target": vx_source_entity["name"],
-            },
-            {
-                "source": vx_source_entity["name"],
-                "target": vx_file["name"],
-            },
+        file_entities = _project_edges(
+            edges_first=edges[EdgeType.FILE_MAPPING.name],
+            edges_second=mappings_entity,
         )
-
-    def _make_file_edge(self, vx_file_source, vx_file):
-        """Maakt een directe edge tussen twee RETW-bestanden."""
-        return {
-            "source": vx_file_source["name"],
-            "target": vx_file["name"],
+        # An entity can be defined in several files, the first other file is taken as its source
+        files_source = {}
+        for idx_file, idx_entity in sorted(edges[EdgeType.FILE_ENTITY.name]):
+            files_source.setdefault(idx_entity, []).append(idx_file)
+        edges_dependencies = {}
+        for idx_file, idx_entity in file_entities:
+            idx_file_source = next(
+                (idx for idx in files_source.get(idx_entity, ()) if idx != idx_file),
+                None,
+            )
+            if idx_file_source is None:
+                continue
+            if include_entities:
+                edges_dependencies[(idx_file_source, idx_entity)] = None
+                edges_dependencies[(idx_entity, idx_file)] = None
+            else:
+                edges_dependencies[(idx_file_source, idx_file)] = None
+        idx_vertices = {
+            idx
+            for idx, type_vertex in enumerate(self.dag.vs["type"])
+            if type_vertex == VertexType.FILE_RETW.name
         }
+        idx_vertices.update(idx for edge in edges_dependencies for idx in edge)
+        return self._build_projection(
+            idx_vertices=sorted(idx_vertices), edges=list(edges_dependencies)
+        )
 
     def get_dag_of_entity(self, entity: EntityRef) -> ig.Graph:
         """Genereert een subgraaf voor een specifieke entiteit.
@@ -724,20 +1010,22 @@ class DagBuilder:
         Raises:
             ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
         """
-        if not self.dag:
-            raise ErrorDagNotBuilt
-
-        dag = deepcopy(self.dag)
+        return self._get_view(
+            key=("entity", EntityRef(*entity)),
+            build_view=lambda: self._build_view_entity(entity=entity),
+        )
 
-        # Extract graph for relevant entity
-        id_entity = self.get_entity_id(entity)
-        vx_entity = dag.vs.select(name=id_entity)[0]
-        vs_entity_graph = dag.subcomponent(vx_entity, mode="in") + dag.subcomponent(
-            vx_entity, mode="out"
+    def _build_view_entity(self, entity: EntityRef) -> ig.Graph:
+        """Bouwt de subgraaf van alle voorgangers en opvolgers van een entiteit."""
+        idx_entity = self.get_entity_index(entity)
+        reachability = self.get_reachability()
+        return self.dag.induced_subgraph(
+            sorted(
+                reachability.ancestors(idx_entity)
+                + [idx_entity]
+                + reachability.descendants(idx_entity)
+            )
         )
-        vs_delete = [i for i in dag.vs.indices if i not in vs_entity_graph]
-        dag.delete_vertices(vs_delete)
-        return dag
 
     def get_dag_ETL(self) -> ig.Graph:
         """Genereert een graaf van alleen entiteiten en mappings voor het ETL-proces.
@@ -751,12 +1039,17 @@ class DagBuilder:
         Raises:
             ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
         """
-        if not self.dag:
-            raise ErrorDagNotBuilt
-        dag = deepcopy(self.dag)
-        vs_files = dag.vs.select(type_eq=VertexType.FILE_RETW.name)
-        dag.delete_vertices(vs_files)
-        return dag
+        return self._get_view(key=("ETL",), build_view=self._build_view_ETL)
+
+    def _build_view_ETL(self) -> ig.Graph:
+        """Bouwt de subgraaf van alle knopen behalve de RETW-bestanden."""
+        return self.dag.induced_subgraph(
+            [
+                idx
+                for idx, type_vertex in enumerate(self.dag.vs["type"])
+                if type_vertex != VertexType.FILE_RETW.name
+            ]
+        )
 
     def get_dag_mappings(self) -> ig.Graph:
         """Genereert een graaf van alleen mappings en hun onderlinge afhankelijkheden.
@@ -770,86 +1063,24 @@ class DagBuilder:
         Raises:
             ErrorDagNotBuilt: Als de graaf nog niet is opgebouwd.
         """
-        if not self.dag:
-            raise ErrorDagNotBuilt
-        dag = deepcopy(self.dag)
-
-        dict_vertices = {}
-        lst_edges = []
-
-        vs_mappings = dag.vs.select(type_eq=VertexType.MAPPING.name)
-        for vx_mapping in vs_mappings:
-            dict_vertices |= {vx_mapping["name"]: vx_mapping.attributes()}
-            edges_source = self._add_source_entity_edges(dag=dag, vx_mapping=vx_mapping)
-            lst_edges.extend(edges_source)
-            edge_target = self._add_target_entity_edges(dag=dag, vx_mapping=vx_mapping)
-            lst_edges.extend(edge_target)
-        lst_edges = [dict(t) for t in {tuple(d.items()) for d in lst_edges}]
-        lst_vertices = list(dict_vertices.values())
-        dag_mappings = ig.Graph.DictList(
-            vertices=lst_vertices, edges=lst_edges, directed=True
-        )
-        return dag_mappings
-
-    def _add_source_entity_edges(
-        self, dag: ig.Graph, vx_mapping: ig.Vertex
-    ) -> list[dict]:
-        """Voegt edges toe van mappings die bron-entiteiten vullen.
+        return self._get_view(key=("mappings",), build_view=self._build_view_mappings)
 
-        Deze functie zoekt voor elke bron-entiteit van de mapping naar mappings die deze entiteit vullen,
-        en voegt edges toe van deze mappings naar de huidige mapping om afhankelijkheden inzichtelijk te maken.
+    def _build_view_mappings(self) -> ig.Graph:
+        """Bouwt de graaf van mappings, met een verbinding van iedere mapping naar de mappings die haar doelentiteit als bron gebruiken.
 
-        Args:
-            dag (ig.Graph): De graaf waarin gezocht wordt.
-            vx_mapping (ig.Vertex): De mapping waarvoor bron-entiteiten worden verwerkt.
-            lst_edges (list): De lijst waarin de edges worden toegevoegd.
-
-        Returns:
-            None
-        """
-        lst_edges = []
-        vs_entities_source = dag.vs(dag.neighbors(vx_mapping, mode="in"))
-        for vx_entity_source in vs_entities_source:
-            idx_mapping_inputs = dag.neighbors(vx_entity_source, mode="in")
-            for idx_mapping_input in idx_mapping_inputs:
-                vs_mapping_input = dag.vs[idx_mapping_input]
-                if vs_mapping_input["type"] == VertexType.MAPPING.name:
-                    lst_edges.append(
-                        {
-                            "source": vs_mapping_input["name"],
-                            "target": vx_mapping["name"],
-                        }
-                    )
-        return lst_edges
-
-    def _add_target_entity_edges(
-        self, dag: ig.Graph, vx_mapping: ig.Vertex
-    ) -> list[dict]:
-        """Voegt edges toe van een mapping naar mappings die afhankelijk zijn van hun doeleenheid.
-
-        Deze functie zoekt mappings die dezelfde doeleenheid delen en voegt edges toe van de huidige mapping naar deze mappings,
-        zodat afhankelijkheden tussen mappings via entiteiten inzichtelijk worden.
-
-        Args:
-            dag (ig.Graph): De graaf waarin gezocht wordt.
-            vx_mapping (ig.Vertex): De mapping waarvan de doeleenheid wordt gebruikt.
-            lst_edges (list): De lijst waarin de edges worden toegevoegd.
-
-        Returns:
-            list: De bijgewerkte lijst met edges.
+        De verbindingen zijn het product van de verbindingen mapping→doelentiteit en entiteit→afnemende mapping.
         """
-
-        vx_entity_target = dag.vs(dag.neighbors(vx_mapping, mode="out"))[0]
-        vs_mappings_target = dag.vs(dag.neighbors(vx_entity_target, mode="out"))
-        lst_edges = [
-            {
-                "source": vx_mapping["name"],
-                "target": vx_mapping_target["name"],
-            }
-            for vx_mapping_target in vs_mappings_target
-            if vx_mapping_target["type"] == VertexType.MAPPING.name
+        edges = self._get_edges_by_type()
+        idx_mappings = [
+            idx
+            for idx, type_vertex in enumerate(self.dag.vs["type"])
+            if type_vertex == VertexType.MAPPING.name
         ]
-        return lst_edges
+        edges_mappings = _project_edges(
+            edges_first=edges[EdgeType.ENTITY_TARGET.name],
+            edges_second=edges[EdgeType.ENTITY_SOURCE.name],
+        )
+        return self._build_projection(idx_vertices=idx_mappings, edges=edges_mappings)
 
     def get_entities(self) -> list[dict]:
         """Geeft een lijst terug van alle entiteit-knopen in de huidige DAG.
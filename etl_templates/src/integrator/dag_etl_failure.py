@@ -37,8 +37,7 @@ class EtlFailure(DagReporting):
             return
         for mapping_ref in mapping_refs:
             try:
-                id_mapping = self.get_mapping_id(mapping_ref)
-                vx_failed = dag.vs.select(name=id_mapping)[0]
+                vx_failed = dag.vs[self.get_mapping_index(mapping_ref, dag=dag)]
             except ValueError:
                 code_model, code_entity = mapping_ref
                 logger.error(f"Can't find entity '{code_model}.{code_entity}' in ETL flow!")
@@ -64,8 +63,7 @@ class EtlFailure(DagReporting):
             return
         for entity_ref in entity_refs:
             try:
-                id_entity = self.get_entity_id(entity_ref)
-                vx_failed = dag.vs.select(name=id_entity)[0]
+                vx_failed = dag.vs[self.get_entity_index(entity_ref, dag=dag)]
             except ValueError:
                 code_model, code_entity = entity_ref
                 logger.error(f"Can't find entity '{code_model}.{code_entity}' in ETL flow!")
@@ -86,8 +84,7 @@ class EtlFailure(DagReporting):
         Returns:
             None
         """
-        ids_affected = dag.subcomponent(vx_failed, mode="out")
-        ids_affected.remove(vx_failed.index)
+        ids_affected = self.get_reachability(etl=True).descendants(vx_failed.index)
         self.impact.append(
             {"failed": vx_failed["name"], "affected": dag.vs(ids_affected)["name"]}
         )
@@ -105,10 +102,14 @@ class EtlFailure(DagReporting):
             ig.Graph: The formatted ETL DAG with highlighted failures and affected nodes.
         """
         for failure in self.impact:
-            dag.vs.select(name=failure["failed"])["color"] = "red"
-            dag.vs.select(name=failure["failed"])["shape"] = "star"
-            for affected in failure["affected"]:
-                dag.vs.select(name=affected)["color"] = "red"
+            vx_failed = dag.vs[self.get_vertex_index(failure["failed"], dag=dag)]
+            vx_failed["color"] = "red"
+            vx_failed["shape"] = "star"
+            idxs_affected = [
+                self.get_vertex_index(affected, dag=dag)
+                for affected in failure["affected"]
+            ]
+            dag.vs[idxs_affected]["color"] = "red"
         return dag
 
     def get_report_fallout(self) -> list[dict]:
@@ -123,7 +124,12 @@ class EtlFailure(DagReporting):
         result = []
         dag = self.get_dag_ETL()
         for failure in self.impact:
-            vs_affected = dag.vs.select(name_in=failure["affected"])
+            vs_affected = dag.vs[
+                sorted(
+                    self.get_vertex_index(affected, dag=dag)
+                    for affected in failure["affected"]
+                )
+            ]
             mappings_data = [
                 vx.attributes()
                 for vx in vs_affected
@@ -134,7 +140,7 @@ class EtlFailure(DagReporting):
                 for vx in vs_affected
                 if vx["type"] == VertexType.ENTITY.name
             ]
-            failed = [vx.attributes() for vx in dag.vs.select(name=failure["failed"])][0]
+            failed = dag.vs[self.get_vertex_index(failure["failed"], dag=dag)].attributes()
             result.append(
                 {
                     "failed": failed,
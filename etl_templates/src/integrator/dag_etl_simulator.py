@@ -7,6 +7,7 @@ from logtools import get_logger
 
 from .dag_builder import MappingRef
 from .dag_implementation import DeadlockPrevention
+from .dag_reachability import DagReachability
 from .dag_reporting import (
     DagReporting,
     VertexType,
@@ -55,6 +56,10 @@ class EtlSimulator(DagReporting):
         }
         self.color_entity = "lemonchiffon"
         self.vs_mapping_failed: list[MappingRef] = []
+        # Bitset van de mappings in de simulatie-DAG, om de bereikbaarheid tot mappings te beperken
+        self._mask_mappings: int = 0
+        # De simulatie gebruikt alleen de topologie van de graaf
+        self.payloads_lazy = True
 
     def build_dag(self, files_RETW: list[Path]) -> None:
         """Bouwt de ETL-DAG op basis van de opgegeven RETW-bestanden.
@@ -69,8 +74,12 @@ class EtlSimulator(DagReporting):
         """
         super().build_dag(files_RETW)
         self._dag_run_level_stages(deadlock_prevention=DeadlockPrevention.TARGET)
+        # A copy of the ETL graph, so its vertex indices match get_reachability(etl=True)
         self.dag_simulation = self.dag_simulation = self.get_dag_ETL()
         self.dag_simulation = self._dag_node_hierarchy_level(dag=self.dag_simulation)
+        self._mask_mappings = DagReachability.mask(
+            self.dag_simulation.vs.select(type_eq=VertexType.MAPPING.name).indices
+        )
         for vx in self.dag_simulation.vs.select(type_eq=VertexType.MAPPING.name):
             vx["run_status"] = MappingStatus.DNR
             vx["is_aggregate"] = (
@@ -92,10 +101,10 @@ class EtlSimulator(DagReporting):
         """
         for mapping_ref in mapping_refs:
             try:
-                id_mapping = self.get_mapping_id(mapping_ref)
-                self.vs_mapping_failed.append(
-                    self.dag_simulation.vs.select(name=id_mapping)[0]
+                idx_mapping = self.get_mapping_index(
+                    mapping_ref, dag=self.dag_simulation
                 )
+                self.vs_mapping_failed.append(self.dag_simulation.vs[idx_mapping])
             except (ValueError, IndexError):
                 code_model, code_entity = mapping_ref
                 logger.error(
@@ -184,8 +193,9 @@ class EtlSimulator(DagReporting):
             if vx in self.vs_mapping_failed:
                 vx["run_status"] = MappingStatus.NOK
             else:
-                id_vs = self.dag_simulation.subcomponent(vx, mode="in")
-                id_vs = [id_vx for id_vx in id_vs if id_vx != vx.index]
+                id_vs = self.get_reachability(etl=True).ancestors(
+                    vx.index, within=self._mask_mappings
+                )
                 status_predecessors = [
                     self.dag_simulation.vs[id_vx]["run_status"] for id_vx in id_vs
                 ]
@@ -274,12 +284,9 @@ class EtlSimulator(DagReporting):
         Returns:
             ig.VertexSeq: Een VertexSeq van opvolgende mapping-knooppunten.
         """
-        id_vs_successors = [
-            id_vx
-            for id_vx in self.dag_simulation.subcomponent(vx_mapping, mode="out")
-            if id_vx != vx_mapping.index
-            and self.dag_simulation.vs[id_vx]["type"] == VertexType.MAPPING.name
-        ]
+        id_vs_successors = self.get_reachability(etl=True).descendants(
+            vx_mapping.index, within=self._mask_mappings
+        )
         return self.dag_simulation.vs.select(id_vs_successors)
 
     def _get_preceeding_mappings(self, vx_mapping: ig.Vertex) -> ig.VertexSeq:
@@ -293,12 +300,9 @@ class EtlSimulator(DagReporting):
         Returns:
             ig.VertexSeq: Een VertexSeq van voorgaande mapping-knooppunten.
         """
-        id_vs_predecessors = [
-            id_vx
-            for id_vx in self.dag_simulation.subcomponent(vx_mapping, mode="in")
-            if id_vx != vx_mapping.index
-            and self.dag_simulation.vs[id_vx]["type"] == VertexType.MAPPING.name
-        ]
+        id_vs_predecessors = self.get_reachability(etl=True).ancestors(
+            vx_mapping.index, within=self._mask_mappings
+        )
         return self.dag_simulation.vs.select(id_vs_predecessors)
 
     def _format_failure_impact(self, dag: ig.Graph) -> None:
@@ -380,13 +384,14 @@ class EtlSimulator(DagReporting):
             if vx["run_status"]
             in [MappingStatus.NOK, MappingStatus.DNR, MappingStatus.OKR]
         ]
-        id_vs_dag = [vx.index for vx in self.dag_simulation.vs]
-        id_vs_components = []
-        for vx in vs_affected:
-            ids_affected = self.dag_simulation.subcomponent(vx, mode="all")
-            id_vs_components.extend(ids_affected)
-
-        ids_delete = list(set(id_vs_dag) - set(id_vs_components))
+        # Components are weakly connected, so they are determined once for all affected vertices
+        membership = self.dag_simulation.connected_components(mode="weak").membership
+        components_affected = {membership[vx.index] for vx in vs_affected}
+        ids_delete = [
+            id_vx
+            for id_vx, component in enumerate(membership)
+            if component not in components_affected
+        ]
         dag = deepcopy(self.dag_simulation)
         dag.delete_vertices(ids_delete)
         return dag
@@ -50,17 +50,29 @@ class DagImplementation(DagBuilder):
     def _add_dag_derived(self) -> None:
         """Verrijkt de DAG met extra informatie voor entiteiten en mappings.
 
-        Deze functie voegt entiteit-type, modelinformatie en hash-keys toe aan de knopen in de DAG.
+        Deze functie voegt entiteit-type en modelinformatie toe aan de knopen in de DAG.
         """
         for vx in self.dag.vs:
             # Add data to entities
             if vx["type"] == VertexType.ENTITY.name:
                 self._entity_add_type(vx_entity=vx)
                 self._entity_set_rowcount_estimate(vx_entity=vx)
-                self._entity_translate_datatypes(vx_entity=vx)
             # Add data to mappings
             if vx["type"] == VertexType.MAPPING.name:
                 self._mapping_add_model(vx_mapping=vx)
+        self._invalidate_views()
+
+    def _add_payload_derived(self) -> None:
+        """Verrijkt de DAG met informatie die afgeleid wordt uit de attributen en attribuut mappings.
+
+        Deze functie voegt SQL-datatypes en hash-keys toe aan de knopen in de DAG, zodra de zware velden zijn geladen.
+        """
+        for vx in self.dag.vs:
+            # Add data to entities
+            if vx["type"] == VertexType.ENTITY.name:
+                self._entity_translate_datatypes(vx_entity=vx)
+            # Add data to mappings
+            if vx["type"] == VertexType.MAPPING.name:
                 self._mapping_workaround_source_layer_name_instead_of_code(vx_mapping=vx)
                 self._translate_aggregate_functions(vx_mapping=vx)
                 self._mapping_add_hashkey(vx_mapping=vx)
@@ -135,9 +147,9 @@ class DagImplementation(DagBuilder):
         # Sorteer prefixes op lengte, zodat langere matches eerst komen
         prefixes = sorted(type_mapping.keys(), key=len, reverse=True)
         for attribute in vx_entity["Attributes"]:
-            data_type = attribute["DataType"]
-            length = attribute.get("Length")
-            precision = attribute.get("Precision", 0)
+            data_type = attribute.DataType
+            length = getattr(attribute, "Length", None)
+            precision = getattr(attribute, "Precision", 0)
 
             # Vind eerste prefix die overeenkomt
             datatype = next(
@@ -148,7 +160,7 @@ class DagImplementation(DagBuilder):
                 ),
                 data_type,
             )
-            attribute["DataTypeSQL"] = datatype
+            attribute.DataTypeSQL = datatype
 
     def _mapping_add_model(self, vx_mapping: ig.Vertex) -> None:
         """Voegt modelinformatie toe aan een mapping op basis van de doelentiteit.
@@ -202,14 +214,15 @@ class DagImplementation(DagBuilder):
             hash_attrib = f"{separator}"
             if "Expression" in attr_mapping:
                 # FIXME: Creates incorrect hashkey for aggregate views, but they are not used in the generator for source view aggregates
-                hash_attrib = f"{hash_attrib}{attr_mapping['Expression']}"
+                hash_attrib = f"{hash_attrib}{attr_mapping.Expression}"
             else:
-                entity_alias = attr_mapping["AttributesSource"]["EntityAlias"]
+                attribute_source = attr_mapping.AttributesSource
+                entity_alias = attribute_source.EntityAlias
                 # FIXME: Workaround for source layer implementation on name instead of code
-                if attr_mapping["AttributesSource"]["is_on_name"]:
-                    attr_source = attr_mapping["AttributesSource"]["Name"]
+                if attribute_source.is_on_name:
+                    attr_source = attribute_source.Name
                 else:
-                    attr_source = attr_mapping["AttributesSource"]["Code"]
+                    attr_source = attribute_source.Code
                 hash_attrib = f"{hash_attrib}{entity_alias}.[{attr_source}]"
             x_hashkey = x_hashkey + hash_attrib
         vx_mapping["X_Hashkey"] = f"{x_hashkey},'{vx_mapping['DataSource']}'))"
@@ -346,9 +359,13 @@ class DagImplementation(DagBuilder):
         # All mapping nodes
         vs_mapping = self.dag.vs.select(type_eq=VertexType.MAPPING.name)
 
+        # Group the mappings by run level in a single pass
+        mappings_run_level = {}
+        for mapping in vs_mapping:
+            mappings_run_level.setdefault(mapping["run_level"], []).append(mapping)
+
         # Determine run stages of mappings by run level
-        run_levels = sorted({node["run_level"] for node in vs_mapping})
-        for run_level in run_levels:
+        for run_level in sorted(mappings_run_level):
             # Find run_level mappings and corresponding source entities
             if deadlock_prevention == DeadlockPrevention.SOURCE:
                 mappings = [
@@ -356,12 +373,12 @@ class DagImplementation(DagBuilder):
                         "mapping": mapping["name"],
                         "entity": self.dag.predecessors(mapping),
                     }
-                    for mapping in vs_mapping.select(run_level_eq=run_level)
+                    for mapping in mappings_run_level[run_level]
                 ]
             elif deadlock_prevention == DeadlockPrevention.TARGET:
                 mappings = [
                     {"mapping": mapping["name"], "entity": self.dag.successors(mapping)}
-                    for mapping in vs_mapping.select(run_level_eq=run_level)
+                    for mapping in mappings_run_level[run_level]
                 ]
             # Create graph of mapping conflicts (mappings that draw on the same sources)
             graph_conflicts = self._dag_ETL_run_levels_conflicts_graph(mappings)
@@ -369,8 +386,11 @@ class DagImplementation(DagBuilder):
             order = graph_conflicts.vertex_coloring_greedy(method="colored_neighbors")
             # Apply them back to the DAG
             dict_level_stages |= dict(zip(graph_conflicts.vs["name"], order))
-            for k, v in dict_level_stages.items():
-                self.dag.vs.select(name=k)["run_level_stage"] = v
+        run_level_stages = [None] * self.dag.vcount()
+        for name, stage in dict_level_stages.items():
+            run_level_stages[self.get_vertex_index(name)] = stage
+        self.dag.vs["run_level_stage"] = run_level_stages
+        self._invalidate_views()
 
     def _dag_ETL_run_levels_conflicts_graph(self, mapping_sources: dict) -> ig.Graph:
         """Genereert een conflictgrafiek voor mappings op basis van gedeelde entiteiten.
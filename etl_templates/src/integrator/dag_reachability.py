@@ -0,0 +1,148 @@
+from collections.abc import Iterable
+
+import igraph as ig
+import numpy as np
+
+
+def _to_indices(mask: int) -> list[int]:
+    """Zet een bitset om naar de oplopende lijst van indices van de gezette bits.
+
+    Args:
+        mask (int): De bitset, waarin bit i staat voor de knoop met index i.
+
+    Returns:
+        list[int]: De indices van de gezette bits.
+    """
+    bytes_mask = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    bits = np.unpackbits(np.frombuffer(bytes_mask, dtype=np.uint8), bitorder="little")
+    return np.flatnonzero(bits).tolist()
+
+
+class DagReachability:
+    """Bereikbaarheidsindex met de voorgangers en opvolgers van iedere knoop van een graaf.
+
+    De index wordt in één doorloop in topologische volgorde opgebouwd, waarbij de voorgangers en opvolgers van
+    iedere knoop als bitset (een int) worden bewaard. Daarna kost een vraag naar de voorgangers of opvolgers geen
+    doorloop van de graaf meer, wat impactanalyses met veel vragen versnelt. Knopen in een cyclus delen hun
+    voorgangers en opvolgers, zodat de uitkomst gelijk is aan die van `subcomponent`.
+
+    De index hoort bij de topologie van de graaf op het moment van aanmaken; na het toevoegen of verwijderen van
+    knopen of verbindingen moet een nieuwe index aangemaakt worden.
+    """
+
+    def __init__(self, dag: ig.Graph):
+        """Bouwt de bereikbaarheidsindex voor een graaf.
+
+        Args:
+            dag (ig.Graph): De gerichte graaf waarvoor de index wordt opgebouwd.
+        """
+        components = dag.connected_components(mode="strong")
+        self._membership: list[int] = components.membership
+        qty_components = len(components)
+        members = [0] * qty_components
+        for idx, component in enumerate(self._membership):
+            members[component] |= 1 << idx
+        successors = [set() for _ in range(qty_components)]
+        for source, target in dag.get_edgelist():
+            component_source = self._membership[source]
+            component_target = self._membership[target]
+            if component_source != component_target:
+                successors[component_source].add(component_target)
+        dag_components = ig.Graph(
+            n=qty_components,
+            edges=[
+                (component, successor)
+                for component, component_successors in enumerate(successors)
+                for successor in component_successors
+            ],
+            directed=True,
+        )
+        order = dag_components.topological_sorting(mode="out")
+
+        # Each component includes its own members, the queried vertex itself is masked out per query
+        self._descendants = list(members)
+        for component in reversed(order):
+            for successor in successors[component]:
+                self._descendants[component] |= self._descendants[successor]
+        self._ancestors = list(members)
+        for component in order:
+            for successor in successors[component]:
+                self._ancestors[successor] |= self._ancestors[component]
+
+    @staticmethod
+    def mask(indices: Iterable[int]) -> int:
+        """Zet knopen om naar een bitset, waarmee de uitkomst van een vraag beperkt kan worden (zie `within`).
+
+        Args:
+            indices (Iterable[int]): De indices van de knopen.
+
+        Returns:
+            int: De bitset met een gezette bit voor iedere knoop.
+        """
+        mask = 0
+        for idx in indices:
+            mask |= 1 << idx
+        return mask
+
+    def ancestors(self, idx: int, within: int = -1) -> list[int]:
+        """Geeft de directe en indirecte voorgangers van een knoop.
+
+        Args:
+            idx (int): De index van de knoop.
+            within (int, optional): Bitset (zie `mask`) van de knopen waartoe de uitkomst beperkt wordt. Standaard alle knopen.
+
+        Returns:
+            list[int]: De oplopende indices van de voorgangers, zonder de knoop zelf.
+        """
+        return _to_indices(self._ancestors[self._membership[idx]] & within & ~(1 << idx))
+
+    def descendants(self, idx: int, within: int = -1) -> list[int]:
+        """Geeft de directe en indirecte opvolgers van een knoop.
+
+        Args:
+            idx (int): De index van de knoop.
+            within (int, optional): Bitset (zie `mask`) van de knopen waartoe de uitkomst beperkt wordt. Standaard alle knopen.
+
+        Returns:
+            list[int]: De oplopende indices van de opvolgers, zonder de knoop zelf.
+        """
+        return _to_indices(self._descendants[self._membership[idx]] & within & ~(1 << idx))
+
+    def count_ancestors(self, idx: int) -> int:
+        """Geeft het aantal directe en indirecte voorgangers van een knoop, zonder de knoop zelf."""
+        return self._ancestors[self._membership[idx]].bit_count() - 1
+
+    def count_descendants(self, idx: int) -> int:
+        """Geeft het aantal directe en indirecte opvolgers van een knoop, zonder de knoop zelf."""
+        return self._descendants[self._membership[idx]].bit_count() - 1
+
+    def ancestors_all(self, indices: Iterable[int]) -> list[int]:
+        """Geeft de knopen die voorganger zijn van tenminste één van de opgegeven knopen.
+
+        Args:
+            indices (Iterable[int]): De indices van de knopen.
+
+        Returns:
+            list[int]: De oplopende indices van de voorgangers, zonder de opgegeven knopen zelf.
+        """
+        return self._combine(masks=self._ancestors, indices=indices)
+
+    def descendants_all(self, indices: Iterable[int]) -> list[int]:
+        """Geeft de knopen die opvolger zijn van tenminste één van de opgegeven knopen.
+
+        Args:
+            indices (Iterable[int]): De indices van de knopen.
+
+        Returns:
+            list[int]: De oplopende indices van de opvolgers, zonder de opgegeven knopen zelf.
+        """
+        return self._combine(masks=self._descendants, indices=indices)
+
+    def _combine(self, masks: list[int], indices: Iterable[int]) -> list[int]:
+        """Voegt de bitsets van de componenten van de opgegeven knopen samen, zonder de knopen zelf."""
+        mask = 0
+        mask_indices = 0
+        for idx in indices:
+            mask |= masks[self._membership[idx]]
+            mask_indices |= 1 << idx
+        return _to_indices(mask & ~mask_indices)
@@ -6,10 +6,12 @@ from pathlib import Path
 import igraph as ig
 import networkx as nx
 from logtools import get_logger
+from pd_extractor import to_RETW
 from pyvis.network import Network
 
 from .dag_builder import EntityRef, NoFlowError, VertexType
 from .dag_implementation import DagImplementation
+from .dag_reachability import DagReachability
 
 logger = get_logger(__name__)
 
@@ -103,14 +105,17 @@ class DagReporting(DagImplementation):
         """
         dag_nx = nx.DiGraph()
         # Convert nodes
-        lst_nodes_igraph = graph.get_vertex_dataframe().to_dict("records")
+        lst_nodes_igraph = [
+            {key: to_RETW(value) for key, value in node.items()}
+            for node in graph.get_vertex_dataframe().to_dict("records")
+        ]
         lst_nodes = []
         lst_nodes.extend((node["name"], node) for node in lst_nodes_igraph)
         dag_nx.add_nodes_from(lst_nodes)
 
-        # Convert edges
-        lst_edges = []
-        lst_edges.extend((edge["source"], edge["target"]) for edge in graph.es)
+        # Convert edges, by the names of their vertices, so derived graphs don't need source/target edge attributes
+        names = graph.vs["name"]
+        lst_edges = [(names[source], names[target]) for source, target in graph.get_edgelist()]
         dag_nx.add_edges_from(lst_edges)
         return dag_nx
 
@@ -248,8 +253,10 @@ class DagReporting(DagImplementation):
             ig.Graph: De DAG met toegevoegde 'level' attributen voor alle knopen.
         """
         # Getting the number of preceding nodes to determine where to start
-        for i in range(dag.vcount()):
-            dag.vs[i]["qty_predecessors"] = len(dag.subcomponent(dag.vs[i], mode="in"))
+        reachability = DagReachability(dag)
+        dag.vs["qty_predecessors"] = [
+            reachability.count_ancestors(i) + 1 for i in range(dag.vcount())
+        ]
 
         # Calculating levels
         id_vertices = deque(
@@ -413,9 +420,8 @@ class DagReporting(DagImplementation):
         dag = self.get_dag_of_entity(entity=entity)  # Visualization
         dag = self._set_visual_attributes(dag=dag)
         # Recolor requested entity
-        id_entity = self.get_entity_id(entity_ref=entity)
-        vx_entity = dag.vs.select(name=id_entity)[0]
-        dag.vs[vx_entity.index]["color"] = "#f296bf"
+        idx_entity = self.get_entity_index(entity_ref=entity, dag=dag)
+        dag.vs[idx_entity]["color"] = "#f296bf"
         self.plot_graph_html(dag=dag, file_html=file_html)
 
     def get_entities_without_definition(self) -> list[dict]:
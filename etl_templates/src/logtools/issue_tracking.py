@@ -52,6 +52,14 @@ class IssueTrackingHandler(logging.Handler):
         """
         return self.issues
 
+    def add_issues(self, issues: list) -> None:
+        """Voegt issues toe die elders zijn verzameld, bijvoorbeeld in een worker proces.
+
+        Args:
+            issues: Een lijst met issue dictionaries.
+        """
+        self.issues.extend(issues)
+
     def write_csv(self, file_csv: str) -> None:
         """Exporteer de gelogde issues naar een CSV bestand.
 
@@ -3,6 +3,7 @@ import sys
 from pathlib import Path
 
 from orchestrator_genesis import ExtractionIssuesFound, Orchestrator
+from pd_extractor import EXTRACT_SCOPES
 
 BOLD_GREEN = "\x1b[1;32m"
 BOLD_RED = "\x1b[1;31m"
@@ -31,10 +32,28 @@ def main():
     parser.add_argument(
         "-s", "--skip", action="store_true", help="Sla DevOps deployment over"
     )
+    parser.add_argument(
+        "--scope",
+        choices=EXTRACT_SCOPES,
+        default="all",
+        help="Extraheer alles, alleen de modellen of alleen de mappings (DevOps deployment wordt dan overgeslagen)",
+    )
+    parser.add_argument(
+        "-m",
+        "--mapping",
+        action="append",
+        dest="mappings",
+        metavar="NAAM",
+        help="Extraheer alleen deze mapping; kan meerdere keren opgegeven worden",
+    )
     args = parser.parse_args()
+    if args.mappings and args.scope == "models":
+        parser.error("--mapping kan niet gecombineerd worden met --scope models")
     genesis = Orchestrator(file_config=Path(args.config_file))
     try:
-        genesis.start_processing(skip_devops=args.skip)
+        genesis.start_processing(
+            skip_devops=args.skip, scope=args.scope, mappings=args.mappings
+        )
     except ExtractionIssuesFound as e:
         print(f"{BOLD_RED}{e}{RESET}", file=sys.stdout)
     else:
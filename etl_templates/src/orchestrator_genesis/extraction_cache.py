@@ -0,0 +1,166 @@
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import pd_extractor
+from logtools import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExtractionCache:
+    """Cache voor RETW-bestanden van ongewijzigde Power Designer documenten.
+
+    Per RETW-bestand wordt in een manifest vastgelegd van welke inhoud van het Power Designer document
+    (SHA-256 hash), welke versie van de extractor code en welke extractor instellingen het is gemaakt, samen
+    met de issues die tijdens de extractie zijn gelogd. Als een document en de extractor niet zijn gewijzigd ten opzichte van een eerdere
+    versie-map, wordt het RETW-bestand uit die map hergebruikt in plaats van het document opnieuw te extraheren.
+
+    Het manifest staat naast de extractie-outputfolder in de versie-map, zodat afnemers die de extractie-outputfolder
+    inlezen of kopiëren (Integrator, Morningstar, DevOps) alleen RETW-bestanden aantreffen.
+    """
+
+    SUFFIX_MANIFEST = ".extraction_cache"
+
+    def __init__(
+        self, path_output: Path, paths_previous: list[Path], settings: dict | None = None
+    ):
+        """Initialiseert de extractie cache.
+
+        Args:
+            path_output (Path): De extractie-outputfolder van de huidige run.
+            paths_previous (list[Path]): De extractie-outputfolders van eerdere runs, nieuwste eerst.
+            settings (dict | None): De extractor instellingen die de inhoud van de RETW-bestanden bepalen.
+        """
+        self.path_output = Path(path_output)
+        self.paths_previous = paths_previous
+        self.settings = settings or {}
+        self.version_extractor = self._determine_version_extractor()
+        self._manifest = self._read_manifest(self.path_output)
+        self._hashes = {}
+
+    def _determine_version_extractor(self) -> str:
+        """Bepaalt de versie van de extractor code als hash over de broncode van de pd_extractor package.
+
+        Returns:
+            str: De hash van de extractor code.
+        """
+        hasher = hashlib.sha256()
+        path_package = Path(pd_extractor.__file__).parent
+        for file_source in sorted(path_package.rglob("*.py")):
+            hasher.update(file_source.relative_to(path_package).as_posix().encode())
+            hasher.update(file_source.read_bytes())
+        return hasher.hexdigest()
+
+    def _path_manifest(self, path: Path) -> Path:
+        """Geeft het pad van het manifest van een extractie-outputfolder, naast de folder in de versie-map.
+
+        Args:
+            path (Path): De extractie-outputfolder.
+
+        Returns:
+            Path: Het pad van het manifest, bijvoorbeeld 'v00.01.00/RETW.extraction_cache'.
+        """
+        return path.parent / f"{path.name}{self.SUFFIX_MANIFEST}"
+
+    def _read_manifest(self, path: Path) -> dict:
+        """Leest het manifest van een extractie-outputfolder.
+
+        Args:
+            path (Path): De extractie-outputfolder.
+
+        Returns:
+            dict: Het manifest, of een lege dictionary als deze niet bestaat of onleesbaar is.
+        """
+        file_manifest = self._path_manifest(path)
+        if not file_manifest.exists():
+            return {}
+        try:
+            with open(file_manifest, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Extractie cache manifest '{file_manifest}' kan niet gelezen worden: {e}")
+            return {}
+
+    def _hash_file(self, file_pd_ldm: Path) -> str:
+        """Berekent de SHA-256 hash van de inhoud van een Power Designer document.
+
+        Args:
+            file_pd_ldm (Path): Het Power Designer LDM-bestand.
+
+        Returns:
+            str: De hash van de inhoud van het bestand.
+        """
+        if file_pd_ldm not in self._hashes:
+            hasher = hashlib.sha256()
+            with open(file_pd_ldm, "rb") as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            self._hashes[file_pd_ldm] = hasher.hexdigest()
+        return self._hashes[file_pd_ldm]
+
+    def _is_match(self, entry: dict | None, file_pd_ldm: Path) -> bool:
+        """Controleert of een manifest regel overeenkomt met het huidige document, de huidige extractor en de instellingen.
+
+        Args:
+            entry (dict | None): De regel uit het manifest.
+            file_pd_ldm (Path): Het Power Designer LDM-bestand.
+
+        Returns:
+            bool: True als het document, de extractor en de instellingen ongewijzigd zijn.
+        """
+        return (
+            entry is not None
+            and entry.get("version_extractor") == self.version_extractor
+            and entry.get("settings", {}) == self.settings
+            and entry.get("hash") == self._hash_file(file_pd_ldm)
+        )
+
+    def restore(self, file_pd_ldm: Path, path_file_RETW: Path) -> list | None:
+        """Hergebruikt een eerder geëxtraheerd RETW-bestand als het document en de extractor ongewijzigd zijn.
+
+        Args:
+            file_pd_ldm (Path): Het Power Designer LDM-bestand.
+            path_file_RETW (Path): Het pad van het RETW-bestand in de huidige run.
+
+        Returns:
+            list | None: De issues die bij de oorspronkelijke extractie zijn gelogd, of None als er geen bruikbaar RETW-bestand is.
+        """
+        name = path_file_RETW.name
+        entry = self._manifest.get(name)
+        if self._is_match(entry, file_pd_ldm) and path_file_RETW.exists():
+            return entry.get("issues", [])
+        for path_previous in self.paths_previous:
+            entry = self._read_manifest(path_previous).get(name)
+            path_file_previous = path_previous / name
+            if self._is_match(entry, file_pd_ldm) and path_file_previous.exists():
+                shutil.copy2(path_file_previous, path_file_RETW)
+                self._manifest[name] = entry
+                logger.info(
+                    f"'{file_pd_ldm}' is ongewijzigd, RETW-bestand hergebruikt uit '{path_file_previous}'"
+                )
+                return entry.get("issues", [])
+        return None
+
+    def store(self, file_pd_ldm: Path, path_file_RETW: Path, issues: list) -> None:
+        """Legt een nieuw geëxtraheerd RETW-bestand vast in het manifest.
+
+        Args:
+            file_pd_ldm (Path): Het Power Designer LDM-bestand.
+            path_file_RETW (Path): Het pad van het geschreven RETW-bestand.
+            issues (list): De issues die tijdens de extractie zijn gelogd.
+        """
+        self._manifest[path_file_RETW.name] = {
+            "file_pd_ldm": str(file_pd_ldm),
+            "hash": self._hash_file(file_pd_ldm),
+            "version_extractor": self.version_extractor,
+            "settings": self.settings,
+            "issues": issues,
+        }
+
+    def write(self) -> None:
+        """Schrijft het manifest van de extractie-outputfolder van de huidige run."""
+        file_manifest = self._path_manifest(self.path_output)
+        with open(file_manifest, "w", encoding="utf-8") as file:
+            json.dump(self._manifest, file, indent=4)
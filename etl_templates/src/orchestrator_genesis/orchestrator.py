@@ -1,5 +1,6 @@
 import functools
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from config import GenesisConfig
@@ -7,10 +8,12 @@ from deploy_mdde import DeploymentMDDE
 from generator import DDLGenerator
 from integrator import DagImplementation, DagReporting, DeadlockPrevention
 from logtools import get_logger, issue_tracker
-from pd_extractor import PDDocument
+from pd_extractor import RETW_FIELDS_PRUNED_LEAN, PDDocument, read_RETW
 from repository_manager import SqlRepositoryManager
 from tqdm import tqdm
 
+from .extraction_cache import ExtractionCache
+
 logger = get_logger(__name__)
 
 BOLD_BLUE = "\x1b[1;34m"
@@ -20,6 +23,60 @@ BOLD_YELLOW = "\x1b[1;33m"
 RESET = "\x1b[0m"
 
 
+def _extract_document(
+    file_pd_ldm: Path,
+    path_file_RETW: Path,
+    workers_mappings: int = 1,
+    encoding: str = "jsonl",
+    normalize: bool = True,
+    profile: str = "full",
+    scope: str = "all",
+    mappings: list[str] | None = None,
+) -> tuple[Path | None, list]:
+    """Extraheert een enkel Power Designer document naar een RETW-bestand.
+
+    Deze functie staat op moduleniveau zodat deze ook in een worker proces uitgevoerd kan worden. De issues
+    die tijdens de extractie gelogd worden, worden teruggegeven zodat ze in het hoofdproces aan de
+    issue tracker kunnen worden toegevoegd.
+
+    Args:
+        file_pd_ldm (Path): Het Power Designer LDM-bestand.
+        path_file_RETW (Path): Het pad van het te schrijven RETW-bestand.
+        workers_mappings (int): Aantal processen waarmee de mappings van het document getransformeerd worden.
+        encoding (str): De encoding van het RETW-bestand.
+        normalize (bool): Of attributen en entiteiten eenmalig in een catalogus worden opgenomen.
+        profile (str): Het extractieprofiel dat bepaalt welke velden geschreven worden.
+        scope (str): De extractiescope: 'all', 'models' of 'mappings'.
+        mappings (list[str] | None): Namen van de te extraheren mappings; bij None alle mappings.
+
+    Returns:
+        tuple[Path | None, list]: Het pad naar het RETW-bestand (None bij een fout) en de gelogde issues.
+    """
+    idx_issues = len(issue_tracker.issues)
+    try:
+        document = PDDocument(
+            file_pd_ldm=file_pd_ldm, workers_mappings=workers_mappings
+        )
+        document.extract_to_json(
+            path_file_output=path_file_RETW,
+            encoding=encoding,
+            normalize=normalize,
+            profile=profile,
+            scope=scope,
+            mappings=mappings,
+        )
+        logger.info(
+            f"Het logisch data model en mappings van '{file_pd_ldm}' geëxtraheerd en geschreven naar '{path_file_RETW}'"
+        )
+    except (IOError, OSError, ValueError) as e:
+        logger.error(
+            f"Fout bij extractie van Power Designer bestand '{file_pd_ldm}': {e}",
+            exc_info=True,
+        )
+        path_file_RETW = None
+    return path_file_RETW, issue_tracker.issues[idx_issues:]
+
+
 class ExtractionIssuesFound(Exception):
     """Exceptie die optreedt wanneer er 'breaking issues' zijn aangetroffen in de geëxtraheerde Power Designer modellen en/of mappings."""
 
@@ -52,13 +109,22 @@ class Orchestrator:
         )
         self.step_current = next(self.process_steps)
 
-    def start_processing(self, skip_devops: bool = False) -> None:
+    def start_processing(
+        self,
+        skip_devops: bool = False,
+        scope: str = "all",
+        mappings: list[str] | None = None,
+    ) -> None:
         """Start het Genesis verwerkingsproces.
 
         Orkestreert extractie, afhankelijkheidsanalyse, codegeneratie en repository-operaties voor het ETL-proces.
+        Bij een gedeeltelijke extractie (alleen modellen, alleen mappings of een selectie van mappings) wordt
+        alleen code voor dat deel gegenereerd en worden de DevOps repository-operaties overgeslagen.
 
         Args:
             skip_devops (bool): Indien True, worden DevOps repository-operaties overgeslagen.
+            scope (str): De extractiescope: 'all', 'models' of 'mappings'.
+            mappings (list[str] | None): Namen van de te extraheren mappings; bij None alle mappings.
 
         Returns:
             None
@@ -68,7 +134,7 @@ class Orchestrator:
             file=sys.stdout,
         )
         # Extraheert data uit de Power Designer ldm bestanden
-        files_RETW = self._extract_to_json()
+        files_RETW = self._extract_to_json(scope=scope, mappings=mappings)
         # Integreer alle data uit de verschillende bestanden
         dag_etl = self._integrate_files(files_RETW=files_RETW)
         # Genereer code voor doelschema's en mappings
@@ -76,12 +142,16 @@ class Orchestrator:
         # Genereer code voor ETL deployment
         self._generate_mdde_deployment(dag_etl=dag_etl)
         # Voegt gegenereerde code en database objecten toe aan het repository
-        if not skip_devops:
-            self._add_to_repository()
-        else:
+        if skip_devops:
             logger.info(
                 "Repository afhandeling is overgeslagen door de 'skip_devops' flag."
             )
+        elif scope != "all" or mappings is not None:
+            logger.info(
+                "Repository afhandeling is overgeslagen omdat niet het volledige model is geëxtraheerd."
+            )
+        else:
+            self._add_to_repository()
 
     @staticmethod
     def detect_issues(func: callable) -> callable:
@@ -158,46 +228,181 @@ class Orchestrator:
         return wrapper
 
     @detect_issues
-    def _extract_to_json(self) -> list[Path]:
+    def _extract_to_json(
+        self, scope: str = "all", mappings: list[str] | None = None
+    ) -> list[Path]:
         """
         Extraheert data uit Power Designer bestanden en schrijft deze naar JSON-bestanden.
 
         Deze functie verwerkt de opgegeven Power Designer bestanden, extraheert het logisch datamodel en mappings,
-        en slaat de resultaten op als JSON-bestanden in de opgegeven output directory.
+        en slaat de resultaten op als JSON-bestanden in de opgegeven output directory. Als er meer dan één worker is
+        geconfigureerd worden de bestanden parallel in aparte processen geëxtraheerd; de issues uit deze processen
+        worden samengevoegd in de issue tracker. Documenten die sinds een eerdere versie niet zijn gewijzigd worden
+        niet opnieuw geëxtraheerd, maar het eerder geschreven RETW-bestand wordt hergebruikt.
+
+        Args:
+            scope (str): De extractiescope: 'all', 'models' of 'mappings'.
+            mappings (list[str] | None): Namen van de te extraheren mappings; bij None alle mappings.
 
         Returns:
             list[Path]: Lijst van paden naar de geëxtraheerde JSON-bestanden.
         """
 
-        lst_files_RETW = []
         # Extractie van data uit Power Designer bestanden
         if not self.config.power_designer.files:
             raise ValueError(
                 "Configuratiefout: geen PowerDesigner-bestanden opgegeven. Genesis verwerking kan niet worden gestart."
             )
+        if self.config.extractor.profile == "lean":
+            self._check_profile_lean()
         files_pd_ldm = self.config.power_designer.files
-        for file_pd_ldm in tqdm(
-            files_pd_ldm,
-            desc="Extracten Power Designer bestanden",
-            colour="#d7f5cb",
-            disable=not sys.stdout.isatty(),
+        paths_RETW = {
+            file_pd_ldm: self.config.extractor.path_output
+            / f"{file_pd_ldm.stem}{self.config.extractor.suffix_output}"
+            for file_pd_ldm in files_pd_ldm
+        }
+        cache = None
+        if self.config.extractor.cache:
+            cache = ExtractionCache(
+                path_output=self.config.extractor.path_output,
+                paths_previous=self.config.extractor.paths_output_previous,
+                settings={
+                    "normalize": self.config.extractor.normalize,
+                    "profile": self.config.extractor.profile,
+                    "scope": scope,
+                    "mappings": sorted(mappings) if mappings is not None else None,
+                },
+            )
+        files_extracted = set()
+        files_to_extract = []
+        for file_pd_ldm, path_file_RETW in paths_RETW.items():
+            issues = cache.restore(file_pd_ldm, path_file_RETW) if cache else None
+            if issues is None:
+                files_to_extract.append(file_pd_ldm)
+            else:
+                issue_tracker.add_issues(issues)
+                files_extracted.add(file_pd_ldm)
+
+        for file_pd_ldm, issues in self._extract_documents(
+            files_pd_ldm=files_to_extract,
+            paths_RETW=paths_RETW,
+            scope=scope,
+            mappings=mappings,
         ):
-            try:
-                document = PDDocument(file_pd_ldm=file_pd_ldm)
-                path_file_RETW = (
-                    self.config.extractor.path_output / f"{file_pd_ldm.stem}.json"
+            files_extracted.add(file_pd_ldm)
+            if cache:
+                cache.store(file_pd_ldm, paths_RETW[file_pd_ldm], issues=issues)
+        if cache:
+            cache.write()
+
+        lst_files_RETW = [
+            paths_RETW[file_pd_ldm]
+            for file_pd_ldm in files_pd_ldm
+            if file_pd_ldm in files_extracted
+        ]
+        if mappings is not None:
+            self._check_mappings_found(files_RETW=lst_files_RETW, mappings=mappings)
+        return lst_files_RETW
+
+    def _check_mappings_found(self, files_RETW: list[Path], mappings: list[str]) -> None:
+        """
+        Controleert of alle geselecteerde mappings in een van de geëxtraheerde documenten zijn gevonden.
+
+        Voor elke mapping die in geen enkel document voorkomt wordt een error gelogd, zodat een tikfout in een
+        mapping naam niet tot een lege verwerking leidt.
+
+        Args:
+            files_RETW (list[Path]): De geëxtraheerde RETW-bestanden.
+            mappings (list[str]): De namen van de geselecteerde mappings.
+        """
+        names_found = set()
+        for file_RETW in files_RETW:
+            for mapping in read_RETW(file_RETW).get("Mappings", []):
+                names_found.add(mapping["Name"])
+        for name in mappings:
+            if name not in names_found and name.replace(" ", "_") not in names_found:
+                logger.error(f"Mapping '{name}' is in geen van de documenten gevonden")
+
+    def _check_profile_lean(self) -> None:
+        """
+        Controleert of de generator templates geen velden gebruiken die in het 'lean' extractieprofiel worden weggelaten.
+
+        Voor elk template dat zo'n veld gebruikt wordt een error gelogd, zodat de verwerking stopt voordat
+        er RETW-bestanden zonder deze velden worden geschreven.
+        """
+        templates_fields = DDLGenerator(params=self.config.generator).get_template_fields()
+        for name_template, fields in templates_fields.items():
+            if fields_pruned := sorted(fields & RETW_FIELDS_PRUNED_LEAN):
+                logger.error(
+                    f"Template '{name_template}' gebruikt de velden {', '.join(fields_pruned)} die in het 'lean' extractieprofiel worden weggelaten, gebruik het profiel 'full'"
                 )
-                document.extract_to_json(path_file_output=path_file_RETW)
-                logger.info(
-                    f"Het logisch data model en mappings van '{file_pd_ldm}' geëxtraheerd en geschreven naar '{path_file_RETW}'"
+
+    def _extract_documents(
+        self,
+        files_pd_ldm: list[Path],
+        paths_RETW: dict[Path, Path],
+        scope: str = "all",
+        mappings: list[str] | None = None,
+    ) -> list[tuple[Path, list]]:
+        """Extraheert de opgegeven Power Designer documenten, sequentieel of met een process pool.
+
+        Args:
+            files_pd_ldm (list[Path]): De te extraheren Power Designer LDM-bestanden.
+            paths_RETW (dict[Path, Path]): Het RETW-bestandspad per Power Designer LDM-bestand.
+            scope (str): De extractiescope: 'all', 'models' of 'mappings'.
+            mappings (list[str] | None): Namen van de te extraheren mappings; bij None alle mappings.
+
+        Returns:
+            list[tuple[Path, list]]: De succesvol geëxtraheerde Power Designer LDM-bestanden met de daarbij gelogde issues.
+        """
+        extracted = []
+        workers = min(self.config.extractor.workers, len(files_pd_ldm))
+        workers_mappings = self.config.extractor.workers_mappings
+        encoding = self.config.extractor.encoding
+        normalize = self.config.extractor.normalize
+        profile = self.config.extractor.profile
+        progress = {
+            "desc": "Extracten Power Designer bestanden",
+            "colour": "#d7f5cb",
+            "disable": not sys.stdout.isatty(),
+            "total": len(files_pd_ldm),
+        }
+        if workers > 1:
+            logger.info(f"Extractie van {len(files_pd_ldm)} bestanden met {workers} processen")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    _extract_document,
+                    files_pd_ldm,
+                    [paths_RETW[file_pd_ldm] for file_pd_ldm in files_pd_ldm],
+                    [workers_mappings] * len(files_pd_ldm),
+                    [encoding] * len(files_pd_ldm),
+                    [normalize] * len(files_pd_ldm),
+                    [profile] * len(files_pd_ldm),
+                    [scope] * len(files_pd_ldm),
+                    [mappings] * len(files_pd_ldm),
                 )
-                lst_files_RETW.append(path_file_RETW)
-            except (IOError, OSError, ValueError) as e:
-                logger.error(
-                    f"Fout bij extractie van Power Designer bestand '{file_pd_ldm}': {e}",
-                    exc_info=True,
+                for file_pd_ldm, (path_file_RETW, issues) in tqdm(
+                    zip(files_pd_ldm, results), **progress
+                ):
+                    # Issues uit de worker processen samenvoegen voor de detect_issues controle
+                    issue_tracker.add_issues(issues)
+                    if path_file_RETW is not None:
+                        extracted.append((file_pd_ldm, issues))
+        else:
+            for file_pd_ldm in tqdm(files_pd_ldm, **progress):
+                path_file_RETW, issues = _extract_document(
+                    file_pd_ldm=file_pd_ldm,
+                    path_file_RETW=paths_RETW[file_pd_ldm],
+                    workers_mappings=workers_mappings,
+                    encoding=encoding,
+                    normalize=normalize,
+                    profile=profile,
+                    scope=scope,
+                    mappings=mappings,
                 )
-        return lst_files_RETW
+                if path_file_RETW is not None:
+                    extracted.append((file_pd_ldm, issues))
+        return extracted
 
     @detect_issues
     def _integrate_files(self, files_RETW: list[Path]) -> DagImplementation:
@@ -215,6 +420,7 @@ class Orchestrator:
         """
         logger.info("Create ETL Dag with implementation information")
         dag = DagReporting()
+        dag.workers = self.config.integrator.workers
         dag.build_dag(files_RETW=files_RETW)
         self._visualize_etl_flow(dag)
         self._visualize_file_dependencies(dag)
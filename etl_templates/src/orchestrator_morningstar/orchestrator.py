@@ -5,6 +5,7 @@ from pathlib import Path
 from integrator import EtlSimulator
 from logtools import get_logger
 from config import MorningstarConfig
+from pd_extractor import RETW_SUFFIXES
 from reporter import MorningstarReport
 
 logger = get_logger(__name__)
@@ -52,7 +53,7 @@ class Orchestrator:
         files_RETW = [
             file_RETW
             for file_RETW in self.config.path_input.iterdir()
-            if file_RETW.is_file and file_RETW.suffix == ".json"
+            if file_RETW.is_file() and file_RETW.suffix in RETW_SUFFIXES
         ]
         self.dag.build_dag(files_RETW=files_RETW)
         return self.dag
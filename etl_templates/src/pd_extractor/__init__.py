@@ -1 +1,21 @@
-from .document import PDDocument
\ No newline at end of file
+from .document import EXTRACT_SCOPES, PDDocument
+from .retw import (
+    RETW_ENCODINGS,
+    RETW_SUFFIXES,
+    iter_RETW_records,
+    read_RETW,
+    write_RETW,
+)
+from .retw_domain import (
+    Attribute,
+    AttributeMapping,
+    Composition,
+    Entity,
+    JoinCondition,
+    Mapping,
+    Model,
+    RETWObject,
+    from_RETW,
+    to_RETW,
+)
+from .retw_profile import RETW_FIELDS_PRUNED_LEAN, RETW_PROFILES, prune_RETW
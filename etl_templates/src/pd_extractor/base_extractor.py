@@ -30,6 +30,30 @@ class BaseExtractor:
                 return default
         return current
 
+    def _get_nested_items(self, data: dict, keys: list[str]) -> list:
+        """Zoekt naar alle geneste waardes in een dictionary, waarbij lijsten onderweg worden doorlopen.
+
+        Collecties worden bij het inlezen altijd als lijst opgenomen (zie `DocumentReader`). Met deze
+        functie kan een pad door zo'n collectie heen gevolgd worden; de waardes van alle objecten in
+        de collectie worden in volgorde samengevoegd.
+
+        Args:
+            data (dict): De dictionary waarin gezocht wordt.
+            keys (list[str]): Lijst van sleutels die de geneste structuur aangeven.
+
+        Returns:
+            list: De gevonden geneste waardes, of een lege lijst als de sleutels niet gevonden worden.
+        """
+        items = [data]
+        for key in keys:
+            found = []
+            for item in items:
+                if isinstance(item, dict) and key in item:
+                    value = item[key]
+                    found.extend(value if isinstance(value, list) else [value])
+            items = found
+        return items
+
     def _has_nested(self, data: dict, keys: list[str]) -> bool:
         """Controleert of een reeks geneste sleutels aanwezig is in een dictionary.
 
@@ -44,17 +68,22 @@ class BaseExtractor:
         """
         return self._get_nested(data, keys, default=object()) is not object()
 
-    def determine_reference_type(self, data: dict) -> str | None:
-        """Bepaalt het type referentie in de opgegeven dictionary.
+    def get_reference(self, data: dict | None) -> str | None:
+        """Haalt de 'Ref' op uit een referentie naar een entiteit, shortcut of attribuut.
 
-        Deze functie zoekt naar bekende referentie types in de dictionary en retourneert
-        de eerste die wordt gevonden.
+        De referentie wordt in één opzoeking per bekend referentie type bepaald, zonder het volledige
+        pad naar de 'Ref' per type opnieuw te doorlopen. Het object waarnaar verwezen wordt kan
+        vervolgens via de `DocumentIndex` of een lookup op 'Id' worden opgehaald.
 
         Args:
-            data (dict): De dictionary waarin gezocht wordt naar een referentie type.
+            data (dict | None): De dictionary die de referentie bevat, bijvoorbeeld de inhoud van 'c:Content'.
 
         Returns:
-            str or None: Het gevonden referentie type of None als geen type wordt gevonden.
+            str or None: De 'Ref' van het object waarnaar verwezen wordt of None als er geen referentie is.
         """
-        possible_values = ["o:Entity", "o:Shortcut", "o:EntityAttribute"]
-        return next((v for v in possible_values if v in data), None)
+        if not isinstance(data, dict):
+            return None
+        for type_reference in ("o:Entity", "o:Shortcut", "o:EntityAttribute"):
+            if reference := data.get(type_reference):
+                return reference.get("Ref")
+        return None
@@ -1,4 +1,7 @@
+import re
 from datetime import datetime
+from functools import lru_cache
+
 from logtools import get_logger
 
 from .base_extractor import BaseExtractor
@@ -14,129 +17,115 @@ class BaseTransformer(BaseExtractor):
 
     def __init__(self, file_pd_ldm: str):
         super().__init__(file_pd_ldm=file_pd_ldm)
-        self._timestamp_fields = ["a:CreationDate", "a:ModificationDate"]
+        self._timestamp_fields = frozenset(["CreationDate", "ModificationDate"])
 
-    def clean_keys(self, content: dict | list) -> dict | list:
-        """Removes special prefixes from dictionary keys for easier access and manipulation.
+    def _convert_values_datetime(self, d: dict | list, convert_keys: frozenset) -> dict | list:
+        """Converteert alle (geneste) dictionary records met een van de opgegeven namen die een Unix timestamp bevatten naar een datetime object
 
-        This function processes a dictionary or list of dictionaries, removing leading '@' and 'a:' from keys to standardize them.
+        Alle sleutels worden in dezelfde doorloop geconverteerd. Waardes die al geconverteerd zijn blijven ongemoeid.
+        De input wordt niet aangepast; dictionaries en lijsten worden als nieuwe objecten opgebouwd.
 
         Args:
-            content (dict or list): The dictionary or list of dictionaries to clean.
+            d (dict | list): Dictionary of lijst die de timestamp waardes bevat
+            convert_keys (frozenset): De namen van de sleutels die een timestamp waarde bevatten
 
         Returns:
-            dict or list: The cleaned dictionary or list of dictionaries with standardized keys.
+            dict | list: Een kopie van de dictionary of lijst met geconverteerde timestamps
         """
-        objects = [content] if isinstance(content, dict) else content
-        for obj in objects:
-            attrs = [key for key in list(obj.keys()) if key[:1] == "@"]
-            for attr in attrs:
-                obj[attr[1:]] = obj.pop(attr)
-            attrs = [key for key in list(obj.keys()) if key[:2] == "a:"]
-            for attr in attrs:
-                obj[attr[2:]] = obj.pop(attr)
-        result = objects[0] if isinstance(content, dict) else objects
-        return result
-
-    def _convert_values_datetime(self, d: dict, convert_key: str) -> dict:
-        """Converteert alle (geneste) dictionary records met een specifieke waarde van de naam die een Unix timestamp bevatten naar een datetime object
+        if isinstance(d, dict):
+            return {
+                key: datetime.fromtimestamp(int(value))
+                if key in convert_keys and isinstance(value, str)
+                else self._convert_values_datetime(value, convert_keys)
+                for key, value in d.items()
+            }
+        elif isinstance(d, list):
+            return [self._convert_values_datetime(item, convert_keys) for item in d]
+        return d
+
+    def convert_timestamps(self, pd_content: dict | list) -> dict | list:
+        """Converteert alle unix time integers naar een datetime object op basis van de lijst van attribuutnamen gespecificeerd in de constructor
 
         Args:
-            d (dict): Dictionary die de timestamp waarde bevat
-            remove_key (str): De naam van de sleutels die een timestamp waarde bevatten
+            pd_content (dict | list): Power Designer document data
 
         Returns:
-            dict: De dictionary zonder de sleutels
+            dict | list: Een kopie van de Power Designer document data, maar met geconverteerde timestamps
         """
-        if isinstance(d, dict):
-            logger.debug(
-                "object is dictionary; file:pd_transform_object; object:d in {self.file_pd_ldm}"
-            )
-            for key in list(d.keys()):
-                if key == convert_key:
-                    d[key] = datetime.fromtimestamp(int(d[key]))
-                else:
-                    self._convert_values_datetime(d[key], convert_key)
-            return d
-        elif isinstance(d, list):
-            logger.debug(
-                "object is list; file:pd_transform_object; object:d in {self.file_pd_ldm}"
-            )
-            for i in range(len(d)):
-                d[i] = self._convert_values_datetime(d[i], convert_key)
-            return d
+        return self._convert_values_datetime(pd_content, self._timestamp_fields)
 
-    def convert_timestamps(self, pd_content: dict) -> dict:
-        """Converteert alle unix time integers naar een datetime object op basis van de lijst van attribuutnamen gespecificeerd in de constructor
+    def parse_extended_attributes(self, extended_attrs_text: str) -> dict[str, str]:
+        """Zet de ExtendedAttributesText van een object om naar een dictionary met waardes per extended attribuut.
+
+        De tekst wordt per unieke tekst één keer ontleed; volgende opvragingen worden uit de cache bediend.
+        De dictionary mag daarom niet aangepast worden.
 
         Args:
-            pd_content (dict): Power Designer document data
+            extended_attrs_text (str): De ExtendedAttributesText van een Power Designer object
 
         Returns:
-            dict: Hetzelfde Power Designer document data, maar met geconverteerde timestamps
+            dict[str, str]: De waardes per extended attribuut, bijvoorbeeld {'mdde_JoinType': 'Left join'}
         """
-        for field in self._timestamp_fields:
-            pd_content = self._convert_values_datetime(pd_content, field)
-        return pd_content
+        return _parse_extended_attributes_text(extended_attrs_text)
 
     def extract_value_from_attribute_text(
         self, extended_attrs_text: str, preceded_by: str
     ) -> str:
-        """Extraheert de opgegeven tekst uit een tekst string. Deze tekst kan voorafgegaan worden door een specifieke tekst en wordt afgesloten door een \n of het zit aan het einde van de string
+        """Extraheert de waarde van een extended attribuut uit de ExtendedAttributesText.
 
         Args:
             extended_attrs_text (str): De tekst dat de waarde bevat waarop gezocht wordt
-            preceded_by (str): De tekst die de te vinden tekst voorafgaat
+            preceded_by (str): De naam van het extended attribuut, eventueel gevolgd door een komma (bijv. 'mdde_SqlExpression,')
 
         Returns:
-            str: De waarde die geassocieerd wordt met de voorafgaande tekst
+            str: De waarde van het extended attribuut in hoofdletters, of een lege string als deze niet voorkomt
         """
-        idx_check = extended_attrs_text.find(preceded_by)
-        if idx_check > 0:
-            logger.info(
-                f"'{idx_check}' Waardes gevonden in extended_attrs_text bij het gebruik van: '{preceded_by}' in {self.file_pd_ldm}"
-            )
-            idx_start = extended_attrs_text.find(preceded_by) + len(preceded_by)
-            idx_end = len(extended_attrs_text) + 1
-            value = extended_attrs_text[idx_start:idx_end]
-            idx_start = value.find("=") + 1
-            return value[idx_start:].upper()
-        else:
+        value = self.parse_extended_attributes(extended_attrs_text).get(
+            preceded_by.rstrip(",")
+        )
+        if value is None:
             logger.warning(
                 f"Geen waardes gevonden in extended_attrs_text bij het gebruik van: '{preceded_by}' in {self.file_pd_ldm}"
             )
             return ""
+        return value.upper()
 
     def _extract_value_from_attribute_text(self, text: str, preceded_by: str) -> str:
-        """Extraheert de opgegeven tekst uit een tekst string. Deze tekst kan voorafgegaan
-        worden door een specifieke tekst en wordt afgesloten door een \n of het zit aan het einde van de string
+        """Extraheert de waarde van een extended attribuut uit de ExtendedAttributesText, waarbij een ontbrekend
+        extended attribuut geen issue is.
 
         Args:
-            extended_attrs_text (str): De tekst dat de waarde bevat waarop gezocht wordt
-            preceded_by (str): De tekst die de te vinden tekst voorafgaat
+            text (str): De tekst dat de waarde bevat waarop gezocht wordt
+            preceded_by (str): De naam van het extended attribuut, eventueel gevolgd door een komma (bijv. 'mdde_JoinType,')
 
         Returns:
-            str: De waarde die geassocieerd wordt met de voorafgaande tekst
+            str: De waarde van het extended attribuut in hoofdletters, of een lege string als deze niet voorkomt
         """
-        idx_check = text.find(preceded_by)
-        if idx_check > 0:
-            logger.info(
-                f"'{idx_check}' waardes gevonden in extended_attrs_text bij het gebruik van: '{preceded_by}' in {self.file_pd_ldm}"
-            )
-            return self._extract_value_with_indices(text, preceded_by)
-        else:
-            logger.info(
-                f"Geen waardes gevonden in extended_attrs_text voor {self.file_pd_ldm} bij het gebruik van: '{preceded_by}' in {self.file_pd_ldm}"
-            )
-            return ""
+        value = self.parse_extended_attributes(text).get(preceded_by.rstrip(","))
+        return "" if value is None else value.upper()
 
-    def _extract_value_with_indices(
-        self, extended_attrs_text: str, preceded_by: str
-    ) -> str:
-        """Hulpmethode om de waarde te extraheren uit de tekst op basis van indices."""
-        idx_start = extended_attrs_text.find(preceded_by) + len(preceded_by)
-        idx_end = extended_attrs_text.find("\n", idx_start)
-        idx_end = idx_end if idx_end > -1 else len(extended_attrs_text) + 1
-        value = extended_attrs_text[idx_start:idx_end]
-        idx_start = value.find("=") + 1
-        return value[idx_start:].upper()
+
+# Begin van een extended attribuut in de ExtendedAttributesText: '{<GUID>},<naam>,<lengte>='
+_PATTERN_EXTENDED_ATTRIBUTE = re.compile(r"\{[0-9A-Fa-f-]{36}\},([^,\n]+),\d+=")
+
+
+@lru_cache(maxsize=4096)
+def _parse_extended_attributes_text(text: str) -> dict[str, str]:
+    """Ontleedt een ExtendedAttributesText in één doorloop naar een dictionary met waardes per extended attribuut.
+
+    De tekst bestaat uit blokken per extensie ('{<GUID>},MDDE_LDM,<lengte>=') met daarin regels per extended
+    attribuut ('{<GUID>},mdde_JoinType,<lengte>=<waarde>'). De opgegeven lengtes tellen regeleinden in het
+    oorspronkelijke bestand mee, daarom loopt een waarde tot het begin van het volgende extended attribuut.
+
+    Args:
+        text (str): De ExtendedAttributesText
+
+    Returns:
+        dict[str, str]: De waardes per extended attribuut
+    """
+    matches = list(_PATTERN_EXTENDED_ATTRIBUTE.finditer(text))
+    result = {}
+    for i, match in enumerate(matches):
+        idx_end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        result.setdefault(match.group(1), text[match.end() : idx_end].rstrip("\n"))
+    return result
@@ -1,19 +1,23 @@
 from datetime import datetime
-from copy import deepcopy
-import json
 from pathlib import Path
 
-import xmltodict
 from logtools import get_logger
 
 from .base_extractor import BaseExtractor
+from .document_index import DocumentIndex
+from .document_reader import DocumentReader
 from .domains_extractor import DomainsExtractor
 from .mapping_extractor import MappingExtractor
 from .model_extractor import ModelExtractor
+from .retw import write_RETW
 from .stereotype_extractor import StereotypeExtractor
 
 logger = get_logger(__name__)
 
+# Extractiescopes: 'all' extraheert het volledige document, 'models' alleen de modellen en 'mappings' alleen de
+# mappings met de filters en scalars die ze gebruiken
+EXTRACT_SCOPES = ("all", "models", "mappings")
+
 
 class PDDocument(BaseExtractor):
     """Representeert een logisch datamodel bestand gemaakt in Power Designer
@@ -21,65 +25,143 @@ class PDDocument(BaseExtractor):
     leesbare format. De output gemaakt op basis van dit bestand is input voor DDL- en ETL generatie.
     """
 
-    def __init__(self, file_pd_ldm: str):
+    def __init__(self, file_pd_ldm: str, workers_mappings: int = 1):
         """Extraheert data uit het Logisch datamodel uit Power Designer en zet dit om in een representatie van objecten
 
         Args:
             file_pd_ldm (str): Power Designer logisch data model document (.ldm)
+            workers_mappings (int): Aantal processen waarmee de mappings getransformeerd worden (1 is sequentieel)
         """
         super().__init__(file_pd_ldm=file_pd_ldm)
+        self.workers_mappings = workers_mappings
+        self.index = DocumentIndex()
 
-    def extract_to_json(self, path_file_output: Path):
+    def extract_to_json(
+        self,
+        path_file_output: Path,
+        encoding: str = "jsonl",
+        normalize: bool = True,
+        profile: str = "full",
+        scope: str = "all",
+        mappings: list[str] | None = None,
+    ):
         """Schrijft het geëxtraheerde en getransformeerde model, filters, scalars, aggregaten en mappings naar een outputbestand.
 
-        Deze functie verzamelt alle relevante data uit het logisch datamodel en schrijft deze als JSON naar het opgegeven bestandspad.
+        Deze functie verzamelt alle relevante data uit het logisch datamodel en schrijft deze als RETW-bestand naar het opgegeven bestandspad.
 
         Args:
             path_file_output (Path): Het pad waar het resultaatbestand wordt opgeslagen.
+            encoding (str): De encoding van het RETW-bestand: 'jsonl' of 'msgpack' (RETW v2) of 'json' (RETW v1).
+            normalize (bool): Of attributen en entiteiten eenmalig in een catalogus worden opgenomen (alleen RETW v2).
+            profile (str): Het extractieprofiel: 'full' voor alle velden of 'lean' voor alleen de velden die de afnemers gebruiken.
+            scope (str): De extractiescope: 'all', 'models' of 'mappings'.
+            mappings (list[str] | None): Namen van de mappings die geëxtraheerd worden; bij None alle mappings.
+        """
+        dict_extract = self.extract(scope=scope, mappings=mappings)
+        if dict_extract is None:
+            return None
+        write_RETW(
+            path_output=path_file_output,
+            dict_extract=dict_extract,
+            encoding=encoding,
+            normalize=normalize,
+            profile=profile,
+        )
+        logger.info(f"Document output is written to '{path_file_output}'")
+
+    def extract(
+        self, scope: str = "all", mappings: list[str] | None = None
+    ) -> dict | None:
+        """Extraheert en transformeert (een deel van) het logisch datamodel.
+
+        Bij een beperkte scope worden de afhankelijkheden alleen opgebouwd voor zover het gekozen deel ze
+        nodig heeft: voor de scope 'models' worden de mappings niet ingelezen en worden er geen filters en
+        scalars bepaald. Voor de scope 'mappings' worden de modellen wel getransformeerd, omdat de mappings
+        naar de entiteiten en attributen verwijzen, maar ze worden niet in het resultaat opgenomen. Als er
+        mapping namen zijn opgegeven worden alleen die mappings getransformeerd.
+
+        Args:
+            scope (str): De extractiescope: 'all', 'models' of 'mappings'. Met opgegeven mappings is 'all'
+                gelijk aan 'mappings'.
+            mappings (list[str] | None): Namen van de mappings die geëxtraheerd worden; bij None alle mappings.
+
+        Returns:
+            dict | None: Het geëxtraheerde document, of None als het document niet ingelezen kon worden.
+
+        Raises:
+            ValueError: Indien de scope onbekend is of mappings worden opgegeven bij de scope 'models'.
         """
-        pd_content = self._read_file_model()
+        if scope not in EXTRACT_SCOPES:
+            raise ValueError(
+                f"Onbekende extractiescope '{scope}', kies uit: {', '.join(EXTRACT_SCOPES)}"
+            )
+        if mappings is not None:
+            if scope == "models":
+                raise ValueError(
+                    "Bij de extractiescope 'models' kunnen geen mappings worden opgegeven"
+                )
+            scope = "mappings"
+
+        pd_content = self._read_file_model(
+            collections_skipped=frozenset({"c:Mappings"}) if scope == "models" else frozenset()
+        )
         if not pd_content:
             return None
         dict_extract = {"Info": self._get_document_info(pd_content=pd_content)}
         domains = self._get_domains(pd_content=pd_content)
+        # De entiteiten worden eenmalig naar stereotype ingedeeld voor filters, scalars, aggregaten en modellen
+        stereotypes = StereotypeExtractor(
+            pd_content=pd_content, file_pd_ldm=self.file_pd_ldm
+        )
 
-        filters = self._get_filters(pd_content=pd_content, domains=domains)
-        dict_extract["Filters"] = filters
+        if scope != "models":
+            filters = self._get_filters(stereotypes=stereotypes, domains=domains)
+            dict_extract["Filters"] = filters
 
-        scalars = self._get_scalars(pd_content=pd_content, domains=domains)
-        dict_extract["Scalars"] = scalars
+            scalars = self._get_scalars(stereotypes=stereotypes, domains=domains)
+            dict_extract["Scalars"] = scalars
 
-        models = self._get_models(pd_content=pd_content, domains=domains)
-        dict_extract["Models"] = models
+        models = self._get_models(
+            pd_content=pd_content, stereotypes=stereotypes, domains=domains
+        )
+        if scope != "mappings":
+            dict_extract["Models"] = models
+        if scope == "models":
+            return dict_extract
 
-        mappings = self._get_mappings(
+        dict_extract["Mappings"] = self._get_mappings(
             pd_content=pd_content,
+            stereotypes=stereotypes,
             models=models,
             filters=filters,
             scalars=scalars,
             domains=domains,
+            names=mappings,
         )
-        dict_extract["Mappings"] = mappings
+        return dict_extract
 
-        self._write_json(path_output=path_file_output, dict_extract=dict_extract)
-
-    def _read_file_model(self) -> dict | None:
+    def _read_file_model(self, collections_skipped: frozenset = frozenset()) -> dict | None:
         """Leest de XML van het Power Designer LDM in een dictionary
 
+        Het bestand wordt als stroom ingelezen, waarbij alleen de voor de extractie benodigde
+        onderdelen van het model worden opgebouwd. De index van alle objecten op 'Id' die tijdens
+        het inlezen wordt opgebouwd, is daarna beschikbaar via `index`.
+
         Args:
-            file_pd_ldm (str): Het pad naar Power Designer LDM file
+            collections_skipped (frozenset): Collecties van het model die niet ingelezen hoeven te worden.
 
         Returns:
             dict: De Power Designer data geconverteerd naar een dictionary
         """
         try:
-            with open(self.file_pd_ldm, encoding="utf8") as file_pd:
-                doc = file_pd.read()
-            dict_data = xmltodict.parse(doc)
-            dict_data = dict_data["Model"]["o:RootObject"]["c:Children"]["o:Model"]
+            reader = DocumentReader(
+                file_pd_ldm=self.file_pd_ldm, collections_skipped=collections_skipped
+            )
+            dict_data = reader.read()
         except (KeyError, TypeError) as e:
             logger.error(f"Onverwachte XML structuur in {self.file_pd_ldm}: {e}")
             return None
+        self.index = reader.index
         return dict_data
 
     def _get_document_info(self, pd_content: dict) -> dict:
@@ -92,17 +174,17 @@ class PDDocument(BaseExtractor):
         """
         document_info = {
             "Filename": str(self.file_pd_ldm),
-            "FilenameRepo": pd_content.get("a:RepositoryFilename"),
-            "Creator": pd_content.get("a:Creator"),
+            "FilenameRepo": pd_content.get("RepositoryFilename"),
+            "Creator": pd_content.get("Creator"),
             "DateCreated": datetime.fromtimestamp(
-                int(pd_content.get("a:CreationDate", 0))
+                int(pd_content.get("CreationDate", 0))
             ),
-            "Modifier": pd_content.get("a:Modifier"),
+            "Modifier": pd_content.get("Modifier"),
             "DateModified": datetime.fromtimestamp(
-                int(pd_content.get("a:ModificationDate", 0))
+                int(pd_content.get("ModificationDate", 0))
             ),
-            "ModelOptions": pd_content.get("a:ModelOptionsText", "").split("\n"),
-            "PackageOptions": pd_content.get("a:PackageOptionsText", "").split("\n"),
+            "ModelOptions": pd_content.get("ModelOptionsText", "").split("\n"),
+            "PackageOptions": pd_content.get("PackageOptionsText", "").split("\n"),
         }
         return document_info
 
@@ -113,82 +195,76 @@ class PDDocument(BaseExtractor):
         domains = extractor.get_domains()
         return domains
 
-    def _get_filters(self, pd_content: dict, domains: dict) -> list[dict]:
+    def _get_filters(self, stereotypes: StereotypeExtractor, domains: dict) -> list[dict]:
         """Haalt alle filter objecten op uit het logisch data model.
 
         Deze functie verwerkt het opgegeven Power Designer model en retourneert een lijst van filter dictionaries.
 
         Args:
-            pd_content (dict): De inhoud van het Power Designer LDM-bestand.
+            stereotypes (StereotypeExtractor): De gedeelde extractor van de stereotype objecten.
             dict_domains (dict): Dictionary met domeininformatie.
 
         Returns:
             list[dict]: Een lijst van dictionaries die de filters representeren.
         """
-        extractor = StereotypeExtractor(
-            pd_content=pd_content,
-            file_pd_ldm=self.file_pd_ldm,
-        )
-        filters = extractor.get_filters(dict_domains=domains)
+        filters = stereotypes.get_filters(dict_domains=domains)
         if not filters:
             logger.debug(f"Geen filters gevonden in '{self.file_pd_ldm}'")
         return filters
 
-    def _get_scalars(self, pd_content: dict, domains: dict) -> list[dict]:
+    def _get_scalars(self, stereotypes: StereotypeExtractor, domains: dict) -> list[dict]:
         """Haalt alle scalar objecten op uit het logisch data model.
 
         Deze functie verwerkt het opgegeven Power Designer model en retourneert een lijst van scalar dictionaries.
 
         Args:
-            pd_content (dict): De inhoud van het Power Designer LDM-bestand.
+            stereotypes (StereotypeExtractor): De gedeelde extractor van de stereotype objecten.
             dict_domains (dict): Dictionary met domeininformatie.
 
         Returns:
             list[dict]: Een lijst van dictionaries die de scalars representeren.
         """
-        extractor = StereotypeExtractor(
-            pd_content=pd_content,
-            file_pd_ldm=self.file_pd_ldm,
-        )
-        scalars = extractor.get_scalars(dict_domains=domains)
+        scalars = stereotypes.get_scalars(dict_domains=domains)
         if not scalars:
             logger.debug(f"Geen scalars gevonden in '{self.file_pd_ldm}'")
         return scalars
 
-    def _get_aggregates(self, pd_content: dict, domains: dict) -> list[dict]:
+    def _get_aggregates(
+        self, stereotypes: StereotypeExtractor, domains: dict
+    ) -> list[dict]:
         """Haalt alle aggregate objecten op uit het logisch data model.
 
         Deze functie verwerkt het opgegeven Power Designer model en retourneert een lijst van aggregate dictionaries.
 
         Args:
-            pd_content (dict): De inhoud van het Power Designer LDM-bestand.
+            stereotypes (StereotypeExtractor): De gedeelde extractor van de stereotype objecten.
             dict_domains (dict): Dictionary met domeininformatie.
 
         Returns:
             list[dict]: Een lijst van dictionaries die de aggregates representeren.
         """
-        extractor = StereotypeExtractor(
-            pd_content=pd_content,
-            file_pd_ldm=self.file_pd_ldm,
-        )
-        aggregates = extractor.get_aggregates(dict_domains=domains)
+        aggregates = stereotypes.get_aggregates(dict_domains=domains)
         return aggregates
 
-    def _get_models(self, pd_content: dict, domains: dict) -> list[dict]:
+    def _get_models(
+        self, pd_content: dict, stereotypes: StereotypeExtractor, domains: dict
+    ) -> list[dict]:
         """Haalt alle model objecten op uit het logisch data model.
 
         Deze functie verwerkt het opgegeven Power Designer model en retourneert een lijst van model dictionaries.
 
         Args:
             pd_content (dict): De inhoud van het Power Designer LDM-bestand.
+            stereotypes (StereotypeExtractor): De gedeelde extractor met de naar stereotype ingedeelde entiteiten.
+            domains (dict): Dictionary met domeininformatie.
 
         Returns:
             list[dict]: Een lijst van dictionaries die de modellen representeren.
         """
-        extractor = ModelExtractor(
-            pd_content=deepcopy(pd_content), file_pd_ldm=self.file_pd_ldm
+        extractor = ModelExtractor(pd_content=pd_content, file_pd_ldm=self.file_pd_ldm)
+        models = extractor.get_models(
+            dict_domains=domains, entities=stereotypes.get_entities_model()
         )
-        models = extractor.get_models(dict_domains=domains)
         if not models:
             logger.error(f"Geen modellen gevonden in '{self.file_pd_ldm}'")
         return models
@@ -196,10 +272,12 @@ class PDDocument(BaseExtractor):
     def _get_mappings(
         self,
         pd_content: dict,
+        stereotypes: StereotypeExtractor,
         models: list[dict],
         filters: list[dict],
         scalars: list[dict],
         domains: list[dict],
+        names: list[str] | None = None,
     ) -> list[dict]:
         """Haalt alle mapping objecten op uit het logisch data model.
 
@@ -207,56 +285,29 @@ class PDDocument(BaseExtractor):
 
         Args:
             pd_content (dict): De inhoud van het Power Designer LDM-bestand.
+            stereotypes (StereotypeExtractor): De gedeelde extractor van de stereotype objecten.
             models (list[dict]): Lijst van model dictionaries.
             filters (list[dict]): Lijst van filter dictionaries.
             scalars (list[dict]): Lijst van scalar dictionaries.
             aggregates (list[dict]): Lijst van aggregaat dictionaries.
+            names (list[str] | None): Namen van de te extraheren mappings; bij None alle mappings.
 
         Returns:
             list[dict]: Een lijst van dictionaries die de mappings representeren.
         """
         extractor = MappingExtractor(
-            pd_content=pd_content, file_pd_ldm=self.file_pd_ldm
+            pd_content=pd_content,
+            file_pd_ldm=self.file_pd_ldm,
+            workers=self.workers_mappings,
         )
-        aggregates = self._get_aggregates(pd_content=pd_content, domains=domains)
+        aggregates = self._get_aggregates(stereotypes=stereotypes, domains=domains)
         mappings = extractor.get_mappings(
-            models=models, filters=filters, scalars=scalars, aggregates=aggregates
+            models=models,
+            filters=filters,
+            scalars=scalars,
+            aggregates=aggregates,
+            names=names,
         )
         if not mappings:
             logger.warning(f"Geen mappings gevonden in '{self.file_pd_ldm}'")
         return mappings
-
-    def _write_json(self, path_output: Path, dict_extract: dict) -> None:
-        """Schrijft het opgegeven document als JSON naar het opgegeven bestandspad.
-
-        Deze functie zorgt ervoor dat de outputdirectory bestaat en schrijft het dictionary-object als JSON naar het bestand.
-
-        Args:
-            file_output (Path): Het pad waar het resultaatbestand wordt opgeslagen.
-            dict_document (dict): Het te schrijven document.
-        """
-        path = Path(path_output)
-        Path(path.parent).mkdir(parents=True, exist_ok=True)
-        with open(path_output, "w", encoding="utf-8") as outfile:
-            json.dump(
-                dict_extract, outfile, indent=4, default=self._serialize_datetime
-            )
-        logger.info(f"Document output is written to '{path_output}'")
-
-    def _serialize_datetime(self, obj: datetime) -> str:
-        """Converteert een datetime-object naar een ISO 8601 string.
-
-        Deze functie wordt gebruikt voor het serialiseren van datetime-objecten bij het schrijven naar JSON.
-
-        Args:
-            obj (datetime): Het te serialiseren object.
-
-        Returns:
-            str: De ISO 8601 stringrepresentatie van het datetime-object.
-
-        Raises:
-            TypeError: Indien het object geen datetime is.
-        """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError("Type not serializable")
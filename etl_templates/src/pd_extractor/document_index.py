@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class IndexEntry:
+    """Een object uit het Power Designer document met zijn type en het object waar het onder valt."""
+
+    object: dict
+    type: str
+    id_parent: str | None
+
+
+class DocumentIndex:
+    """Index van alle objecten in een Power Designer document op basis van hun 'Id'.
+
+    De index wordt tijdens het inlezen van het document in dezelfde doorloop opgebouwd door de
+    `DocumentReader`. Hierdoor kan iedere 'Ref' in constante tijd worden herleid naar het object,
+    het type van het object (bijvoorbeeld 'o:Entity' of 'o:Shortcut') en het object waar het onder valt,
+    zonder dat geneste paden in het document opnieuw doorlopen moeten worden.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def __contains__(self, id_object: str) -> bool:
+        return id_object in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, obj: dict, type_object: str, id_parent: str | None) -> None:
+        """Voegt een object toe aan de index.
+
+        Args:
+            obj (dict): Het object met een 'Id' sleutel
+            type_object (str): Het type van het object, bijvoorbeeld 'o:Entity'
+            id_parent (str | None): Het 'Id' van het object waar dit object onder valt
+        """
+        self._entries[obj["Id"]] = IndexEntry(
+            object=obj, type=type_object, id_parent=id_parent
+        )
+
+    def get(self, id_object: str) -> dict | None:
+        """Geeft het object met het opgegeven 'Id'.
+
+        Args:
+            id_object (str): Het 'Id' van het object
+
+        Returns:
+            dict | None: Het object, of None als het niet in het document voorkomt
+        """
+        entry = self._entries.get(id_object)
+        return entry.object if entry is not None else None
+
+    def get_type(self, id_object: str) -> str | None:
+        """Geeft het type van het object met het opgegeven 'Id'.
+
+        Args:
+            id_object (str): Het 'Id' van het object
+
+        Returns:
+            str | None: Het type van het object, of None als het niet in het document voorkomt
+        """
+        entry = self._entries.get(id_object)
+        return entry.type if entry is not None else None
+
+    def get_parent(self, id_object: str) -> dict | None:
+        """Geeft het object waar het object met het opgegeven 'Id' onder valt.
+
+        Args:
+            id_object (str): Het 'Id' van het object
+
+        Returns:
+            dict | None: Het bovenliggende object, of None als er geen bovenliggend object is
+        """
+        entry = self._entries.get(id_object)
+        if entry is None or entry.id_parent is None:
+            return None
+        return self.get(entry.id_parent)
+
+    def resolve(self, reference: dict | None) -> dict | None:
+        """Herleidt een referentie naar het object waarnaar verwezen wordt.
+
+        Args:
+            reference (dict | None): Een referentie, bijvoorbeeld `{"o:Entity": {"Ref": "o12"}}`
+
+        Returns:
+            dict | None: Het object waarnaar verwezen wordt, of None als de referentie niet herleid kan worden
+        """
+        if not isinstance(reference, dict):
+            return None
+        for value in reference.values():
+            if isinstance(value, dict) and "Ref" in value:
+                return self.get(value["Ref"])
+        return None
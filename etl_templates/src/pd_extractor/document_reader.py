@@ -0,0 +1,247 @@
+from lxml import etree
+
+from logtools import get_logger
+
+from .base_extractor import BaseExtractor
+from .document_index import DocumentIndex
+
+logger = get_logger(__name__)
+
+
+class DocumentReader(BaseExtractor):
+    """Leest een Power Designer LDM bestand in als stroom en bouwt alleen de benodigde delen op.
+
+    In plaats van het volledige XML document in één keer in het geheugen te laden, worden de
+    elementen met `lxml.etree.iterparse` doorlopen. Alleen de eigenschappen en collecties van het
+    model die door de extractors gebruikt worden, worden omgezet naar een dictionary. De structuur
+    van deze dictionary volgt die van `xmltodict`, maar wordt tijdens het inlezen genormaliseerd aan de
+    hand van een schema: de '@' en 'a:' prefixen worden van de sleutels verwijderd en de objecten in
+    de collecties uit `_collections_list` worden altijd als lijst opgenomen. Ieder object wordt zo
+    precies één keer genormaliseerd. Elementen worden na gebruik direct vrijgegeven. Tijdens dezelfde
+    doorloop wordt een index van alle objecten op 'Id' opgebouwd, zodat referenties ('Ref') zonder
+    zoeken herleid kunnen worden.
+    """
+
+    # Pad van de root van het XML document naar het model object
+    _path_model = ("Model", "o:RootObject", "c:Children", "o:Model")
+    # Collecties van het model object die gebruikt worden voor de extractie
+    _collections = (
+        "c:Domains",
+        "c:Entities",
+        "c:Relationships",
+        "c:TargetModels",
+        "c:Mappings",
+        "c:DataSources",
+        "c:Packages",
+        "c:GenerationOrigins",
+    )
+    # Collecties waarvan de objecten altijd als lijst worden opgenomen, ook als er maar één object is
+    _collections_list = frozenset(
+        (
+            "c:Attributes",
+            "c:DataSources",
+            "c:Domains",
+            "c:Entities",
+            "c:ExtendedCollections",
+            "c:ExtendedComposition.Content",
+            "c:ExtendedCompositions",
+            "c:Identifier.Attributes",
+            "c:Identifiers",
+            "c:Joins",
+            "c:Mappings",
+            "c:Relationships",
+            "c:SessionShortcuts",
+            "c:StructuralFeatureMaps",
+            "c:SubShortcuts",
+            "c:TargetModels",
+        )
+    )
+
+    def __init__(self, file_pd_ldm: str, collections_skipped: frozenset = frozenset()):
+        """Initialiseert de reader voor een Power Designer LDM bestand.
+
+        Args:
+            file_pd_ldm (str): Power Designer logisch data model document (.ldm)
+            collections_skipped (frozenset): Collecties van het model die niet nodig zijn en niet worden
+                opgebouwd, bijvoorbeeld 'c:Mappings' als alleen de modellen worden geëxtraheerd.
+        """
+        super().__init__(file_pd_ldm=file_pd_ldm)
+        if collections_skipped:
+            self._collections = tuple(
+                collection
+                for collection in self._collections
+                if collection not in collections_skipped
+            )
+        self._tag_names = {}
+        self._keys = {}
+        self.index = DocumentIndex()
+
+    def read(self) -> dict:
+        """Leest het model object uit het Power Designer LDM bestand.
+
+        Returns:
+            dict: Het model object van het Power Designer document in genormaliseerd `xmltodict` formaat
+
+        Raises:
+            KeyError: Indien het model object niet gevonden kan worden in het document.
+        """
+        depth_model = len(self._path_model)
+        path = []
+        model = None
+        skip = False
+        context = etree.iterparse(
+            self.file_pd_ldm, events=("start", "end"), remove_comments=True, remove_pis=True
+        )
+        for event, element in context:
+            if event == "start":
+                path.append(self._tag_name(element))
+                depth = len(path)
+                if depth == depth_model and tuple(path) == self._path_model:
+                    model = self._attributes(element)
+                    if "Id" in model:
+                        self.index.add(obj=model, type_object=path[-1], id_parent=None)
+                elif depth == depth_model + 1 and model is not None:
+                    tag = path[-1]
+                    skip = not (tag[:2] == "a:" or tag in self._collections)
+                continue
+
+            depth = len(path)
+            tag = path.pop()
+            if model is None:
+                continue
+            if depth == depth_model:
+                break
+            if depth == depth_model + 1:
+                if not skip:
+                    value = self._to_dict(element, id_parent=model.get("Id"))
+                    self._add_child(parent=model, key=self._key(tag), value=value)
+                skip = False
+                self._release(element)
+            elif skip:
+                element.clear()
+        del context
+        if model is None:
+            raise KeyError("o:Model")
+        return model
+
+    def _tag_name(self, element: etree._Element) -> str:
+        """Geeft de naam van een element met het namespace prefix zoals die in het document staat.
+
+        Args:
+            element (etree._Element): Het XML element
+
+        Returns:
+            str: De naam van het element, bijvoorbeeld 'a:Name'
+        """
+        tag = element.tag
+        name = self._tag_names.get(tag)
+        if name is None:
+            local_name = etree.QName(tag).localname
+            name = f"{element.prefix}:{local_name}" if element.prefix else local_name
+            self._tag_names[tag] = name
+        return name
+
+    def _key(self, name: str) -> str:
+        """Geeft de sleutel voor een element of attribuut zonder '@' en 'a:' prefix.
+
+        Args:
+            name (str): De naam van het element of attribuut, bijvoorbeeld 'a:Name' of '@Id'
+
+        Returns:
+            str: De sleutel, bijvoorbeeld 'Name' of 'Id'
+        """
+        key = self._keys.get(name)
+        if key is None:
+            key = name[1:] if name[:1] == "@" else name
+            key = key[2:] if key[:2] == "a:" else key
+            self._keys[name] = key
+        return key
+
+    def _attributes(self, element: etree._Element) -> dict:
+        """Zet de XML attributen van een element om naar sleutels zonder prefix.
+
+        Args:
+            element (etree._Element): Het XML element
+
+        Returns:
+            dict: De attributen van het element
+        """
+        if not element.attrib:
+            return {}
+        prefixes = {uri: prefix for prefix, uri in element.nsmap.items()}
+        attributes = {}
+        for key, value in element.attrib.items():
+            if key[:1] == "{":
+                qname = etree.QName(key)
+                key = f"{prefixes[qname.namespace]}:{qname.localname}"
+            attributes[self._key(key)] = value
+        return attributes
+
+    def _to_dict(
+        self, element: etree._Element, id_parent: str | None
+    ) -> dict | str | None:
+        """Zet een XML element en zijn onderliggende elementen recursief om naar een dictionary.
+
+        De omzetting volgt de conventies van `xmltodict`: herhaalde elementen worden een lijst, tekst
+        naast attributen of elementen komt onder '#text' en lege elementen worden None. Daarnaast
+        worden de '@' en 'a:' prefixen van de sleutels verwijderd en worden de objecten van collecties
+        uit `_collections_list` altijd een lijst. Elementen met een 'Id' worden toegevoegd aan de index.
+
+        Args:
+            element (etree._Element): Het XML element
+            id_parent (str | None): Het 'Id' van het dichtstbijzijnde bovenliggende object
+
+        Returns:
+            dict | str | None: De inhoud van het element
+        """
+        result = self._attributes(element)
+        tag = self._tag_name(element)
+        if "Id" in result:
+            self.index.add(obj=result, type_object=tag, id_parent=id_parent)
+            id_parent = result["Id"]
+        force_list = tag in self._collections_list
+        texts = [element.text] if element.text else []
+        for child in element:
+            self._add_child(
+                parent=result,
+                key=self._key(self._tag_name(child)),
+                value=self._to_dict(child, id_parent=id_parent),
+                force_list=force_list,
+            )
+            if child.tail:
+                texts.append(child.tail)
+        text = "".join(texts).strip()
+        if not result:
+            return text or None
+        if text:
+            result["#text"] = text
+        return result
+
+    def _add_child(
+        self, parent: dict, key: str, value: dict | str | None, force_list: bool = False
+    ) -> None:
+        """Voegt een onderliggend element toe, waarbij herhaalde elementen worden omgezet naar een lijst.
+
+        Args:
+            parent (dict): Het bovenliggende element
+            key (str): De naam van het onderliggende element
+            value (dict | str | None): De inhoud van het onderliggende element
+            force_list (bool): Neemt het element ook als lijst op als het maar één keer voorkomt
+        """
+        if key not in parent:
+            parent[key] = [value] if force_list else value
+        elif isinstance(parent[key], list):
+            parent[key].append(value)
+        else:
+            parent[key] = [parent[key], value]
+
+    def _release(self, element: etree._Element) -> None:
+        """Geeft het geheugen van een verwerkt element en zijn voorgaande broers vrij.
+
+        Args:
+            element (etree._Element): Het verwerkte XML element
+        """
+        element.clear()
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
@@ -14,7 +14,7 @@ class DomainsTransformer(BaseTransformer):
     def transform(self, domains: list[dict]) -> dict:
         """Verwerkt en schoont domein data uit het Power Designer model.
 
-        Deze functie converteert timestamps, maakt de domein data schoon en retourneert een dictionary met domeinen.
+        Deze functie converteert timestamps en retourneert een dictionary met domeinen.
 
         Args:
             domains (list[dict]): Lijst van domeinen uit het Power Designer model.
@@ -22,9 +22,7 @@ class DomainsTransformer(BaseTransformer):
         Returns:
             dict: Dictionary met domeinen, waarbij de sleutel het domein-ID is.
         """
-        domains = [domains] if isinstance(domains, dict) else domains
         domains = self.convert_timestamps(domains)
-        domains = self.clean_keys(domains)
         dict_domains = {
             domain["Id"]: domain for domain in domains if "Id" in domain
         }
@@ -1,4 +1,7 @@
-from logtools import get_logger
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from logtools import get_logger, issue_tracker
 
 from .base_extractor import BaseExtractor
 from .mapping_transformers.mapping import MappingTransformer
@@ -8,6 +11,56 @@ from .mapping_transformers.target import TargetEntityTransformer
 
 logger = get_logger(__name__)
 
+@dataclass(frozen=True)
+class MappingContext:
+    """Lookups die eenmalig per document worden opgebouwd en door alle mappings gedeeld worden.
+
+    De lookups worden door de mapping transformers alleen gelezen. Verrijkte records, bijvoorbeeld een
+    attribuut met een entiteit alias, worden als nieuwe dictionary opgebouwd in plaats van de records
+    in de lookup aan te passen.
+    """
+
+    objects: dict
+    attributes: dict
+    datasources: dict
+
+
+# Context van een worker proces voor het parallel transformeren van mappings, gevuld door _init_worker
+_worker_context = {}
+
+
+def _init_worker(file_pd_ldm: str, context: MappingContext) -> None:
+    """Zet een extractor en de gedeelde lookups klaar in een worker proces.
+
+    De lookups worden hierdoor eenmalig per worker proces overgedragen in plaats van per groep mappings.
+
+    Args:
+        file_pd_ldm (str): Power Designer logisch data model document (.ldm)
+        context (MappingContext): De lookups die gebruikt worden voor het transformeren van de mappings.
+    """
+    _worker_context["extractor"] = MappingExtractor(pd_content={}, file_pd_ldm=file_pd_ldm)
+    _worker_context["context"] = context
+
+
+def _transform_mappings(mappings: list[dict]) -> tuple[list[dict], list]:
+    """Transformeert een groep mappings in een worker proces.
+
+    Args:
+        mappings (list[dict]): De te transformeren mappings.
+
+    Returns:
+        tuple[list[dict], list]: De getransformeerde mappings en de issues die daarbij gelogd zijn.
+    """
+    idx_issues = len(issue_tracker.issues)
+    extractor = _worker_context["extractor"]
+    mappings_transformed = [
+        extractor._process_single_mapping(
+            mapping=mapping, context=_worker_context["context"]
+        )
+        for mapping in mappings
+    ]
+    return mappings_transformed, issue_tracker.issues[idx_issues:]
+
 
 class MappingExtractor(BaseExtractor):
     """Extraheert ETL specificaties (mappings) vanuit een Power Designer LDM waarin mappings zijn geïmplementeerd met behulp van de
@@ -16,14 +69,17 @@ class MappingExtractor(BaseExtractor):
     toe te voegen.
     """
 
-    def __init__(self, pd_content: dict, file_pd_ldm: str):
+    def __init__(self, pd_content: dict, file_pd_ldm: str, workers: int = 1):
         """Initialiseren voor het extraheren van de mapping informatie
 
         Args:
             pd_content (dict): Power Designer LDM bestand inhoud (gerepresenteerd als een dictionary)
+            file_pd_ldm (str): Power Designer logisch data model document (.ldm)
+            workers (int): Aantal processen waarmee de mappings getransformeerd worden (1 is sequentieel)
         """
         super().__init__(file_pd_ldm=file_pd_ldm)
         self.content = pd_content
+        self.workers = workers
 
     def get_mappings(
         self,
@@ -31,6 +87,7 @@ class MappingExtractor(BaseExtractor):
         filters: list[dict],
         scalars: list[dict],
         aggregates: list[dict],
+        names: list[str] | None = None,
     ) -> list[dict]:
         """Verwerkt modellen, filters, scalars en aggregaten tot een lijst van mappingdefinities.
 
@@ -41,6 +98,7 @@ class MappingExtractor(BaseExtractor):
             filters (list[dict]): Lijst van filter dictionaries.
             scalars (list[dict]): Lijst van scalar dictionaries.
             aggregates (list[dict]): Lijst van aggregaat dictionaries.
+            names (list[str] | None): Namen van de mappings die getransformeerd worden; bij None alle mappings.
 
         Returns:
             list[dict]: Een lijst van getransformeerde mappingdefinities.
@@ -54,42 +112,71 @@ class MappingExtractor(BaseExtractor):
         dict_attributes = self._create_attributes_lookup(models=models)
         dict_datasources = self._create_datasources_lookup(models=models)
 
-        mappings = self._get_relevant_mappings()
-        # mappings_transformed = []
+        context = MappingContext(
+            objects=dict_objects,
+            attributes=dict_attributes | dict_variables,
+            datasources=dict_datasources,
+        )
+
+        mappings = self._get_relevant_mappings(names=names)
         # FIXME: mappings now have an issue that joining on the same object gives wrong reference alias
-        mappings_transformed = [
-            self._process_single_mapping(
-                mapping=mapping,
-                dict_objects=dict_objects,
-                dict_attributes=dict_attributes,
-                dict_variables=dict_variables,
-                dict_datasources=dict_datasources,
+        workers = min(self.workers, len(mappings))
+        if workers > 1:
+            mappings_transformed = self._process_mappings_parallel(
+                mappings=mappings, context=context, workers=workers
             )
-            for mapping in mappings
-        ]
+        else:
+            mappings_transformed = [
+                self._process_single_mapping(mapping=mapping, context=context)
+                for mapping in mappings
+            ]
         return mappings_transformed
 
-    def _process_single_mapping(
-        self,
-        mapping: dict,
-        dict_objects: dict,
-        dict_attributes: dict,
-        dict_variables: dict,
-        dict_datasources: dict,
+    def _process_mappings_parallel(
+        self, mappings: list[dict], context: MappingContext, workers: int
     ) -> list[dict]:
+        """Transformeert de mappings in groepen verdeeld over meerdere processen.
+
+        De lookups worden alleen gelezen, waardoor de mappings onafhankelijk van elkaar getransformeerd
+        kunnen worden. De volgorde van de getransformeerde mappings is gelijk aan die van de invoer.
+
+        Args:
+            mappings (list[dict]): De te transformeren mappings.
+            context (MappingContext): De lookups die gebruikt worden voor het transformeren van de mappings.
+            workers (int): Het aantal processen.
+
+        Returns:
+            list[dict]: De getransformeerde mappings in de oorspronkelijke volgorde.
+        """
+        size_chunk = -(-len(mappings) // (workers * 4))
+        chunks = [
+            mappings[i : i + size_chunk] for i in range(0, len(mappings), size_chunk)
+        ]
+        logger.info(
+            f"Transformatie van {len(mappings)} mappings met {workers} processen voor '{self.file_pd_ldm}'"
+        )
+        mappings_transformed = []
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.file_pd_ldm, context)
+        ) as executor:
+            for mappings_chunk, issues in executor.map(_transform_mappings, chunks):
+                # Issues uit de worker processen samenvoegen met die van het hoofdproces
+                issue_tracker.add_issues(issues)
+                mappings_transformed.extend(mappings_chunk)
+        return mappings_transformed
+
+    def _process_single_mapping(self, mapping: dict, context: MappingContext) -> dict:
         """Verwerkt een enkele mapping en transformeert deze naar een gestructureerd formaat.
 
         Deze functie normaliseert de mappingnaam, bepaalt de target entiteiten, verwerkt de attributen en genereert de broncompositie.
 
         Args:
             mapping (dict): De mapping die verwerkt moet worden.
-            dict_objects (dict): Gecombineerde dictionary van entiteiten, filters, scalars en aggregaten.
-            dict_attributes (dict): Dictionary van attributen.
-            dict_variables (dict): Dictionary van variabelen.
-            dict_datasources (dict): Dictionary van datasources.
+            context (MappingContext): De gedeelde lookups van entiteiten, filters, scalars, aggregaten,
+                attributen, variabelen en datasources.
 
         Returns:
-            list[dict]: Een lijst met de getransformeerde broncompositie voor de mapping.
+            dict: De getransformeerde mapping.
         """
         trf_mapping = MappingTransformer(file_pd_ldm=self.file_pd_ldm)
         mapping = trf_mapping.transform(mapping=mapping)
@@ -99,18 +186,17 @@ class MappingExtractor(BaseExtractor):
             file_pd_ldm=self.file_pd_ldm, mapping=mapping
         )
         mapping = trf_target_entity.transform(
-            dict_objects=dict_objects,
+            dict_objects=context.objects,
         )
 
         # Transform source compositions
-        dict_attributes_combined = dict_attributes | dict_variables
         trf_source_composition = SourceCompositionTransformer(
             file_pd_ldm=self.file_pd_ldm, mapping=mapping
         )
         mapping = trf_source_composition.transform(
-            dict_attributes=dict_attributes_combined,
-            dict_objects=dict_objects,
-            dict_datasources=dict_datasources,
+            dict_attributes=context.attributes,
+            dict_objects=context.objects,
+            dict_datasources=context.datasources,
         )
 
         # Transform mapping attributes
@@ -118,7 +204,7 @@ class MappingExtractor(BaseExtractor):
             file_pd_ldm=self.file_pd_ldm, mapping=mapping
         )
         mapping = trf_attribute_mapping.transform(
-            dict_attributes=dict_attributes_combined,
+            dict_attributes=context.attributes,
         )
         return mapping
 
@@ -301,11 +387,14 @@ class MappingExtractor(BaseExtractor):
                 dict_result = model["DataSources"]
         return dict_result
 
-    def _get_relevant_mappings(self) -> list[dict]:
+    def _get_relevant_mappings(self, names: list[str] | None = None) -> list[dict]:
         """Selecteert en filtert relevante mappings uit het Power Designer LDM-bestand.
 
         Deze functie haalt alle mappings op, verwijdert te negeren mappings en retourneert de relevante mappings.
 
+        Args:
+            names (list[str] | None): Namen van de te selecteren mappings; bij None alle mappings.
+
         Returns:
             list[dict]: Een lijst van relevante mappings.
         """
@@ -327,8 +416,36 @@ class MappingExtractor(BaseExtractor):
         ]
         if not mappings:
             logger.warning(f"Geen mappings gevonden in '{self.file_pd_ldm}'")
-        elif isinstance(mappings, list):
-            mappings = [m for m in mappings if m["a:Name"] not in ignore_mappings]
         else:
-            mappings = [mappings] if mappings["a:Name"] not in ignore_mappings else []
-        return mappings
\ No newline at end of file
+            mappings = [m for m in mappings if m["Name"] not in ignore_mappings]
+        if names is not None:
+            mappings = self._select_mappings(mappings=mappings or [], names=names)
+        return mappings
+
+    def _select_mappings(self, mappings: list[dict], names: list[str]) -> list[dict]:
+        """Selecteert de mappings met de opgegeven namen.
+
+        Een naam mag zowel de naam uit Power Designer zijn als de naam uit het RETW-bestand, waarin spaties
+        door underscores zijn vervangen.
+
+        Args:
+            mappings (list[dict]): De relevante mappings van het document.
+            names (list[str]): De namen van de te selecteren mappings.
+
+        Returns:
+            list[dict]: De geselecteerde mappings, in de volgorde van het document.
+        """
+        names = set(names)
+        mappings_selected = []
+        names_found = set()
+        for mapping in mappings:
+            names_mapping = {mapping["Name"], mapping["Name"].replace(" ", "_")}
+            if names_mapping & names:
+                mappings_selected.append(mapping)
+                names_found |= names_mapping
+        if names_missing := names - names_found:
+            # Bij meerdere documenten staan de gezochte mappings meestal maar in één van de documenten
+            logger.info(
+                f"Mappings {', '.join(sorted(names_missing))} niet gevonden in '{self.file_pd_ldm}'"
+            )
+        return mappings_selected
\ No newline at end of file
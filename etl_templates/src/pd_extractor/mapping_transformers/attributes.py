@@ -33,13 +33,11 @@ class MappingAttributesTransformer(BaseTransformer):
             dict: Mapping met geschoonde en verrijkte attribuut mapping
         """
         if attr_mappings := self._get_attribute_mappings():
-            for j in range(len(attr_mappings)):
-                attr_map = attr_mappings[j].copy()
+            for j, attr_map in enumerate(attr_mappings):
                 attr_map["Order"] = j
                 self._handle_attribute_mapping(
                     attr_map=attr_map, dict_attributes=dict_attributes
                 )
-                attr_mappings[j] = attr_map.copy()
             self.mapping["AttributeMapping"] = attr_mappings
             self.mapping.pop("c:StructuralFeatureMaps", None)
         return self.mapping
@@ -55,11 +53,7 @@ class MappingAttributesTransformer(BaseTransformer):
         """
         key_path = ["c:StructuralFeatureMaps", "o:DefaultStructuralFeatureMapping"]
         if attr_mappings := self._get_nested(data=self.mapping, keys=key_path):
-            attr_mappings = (
-                [attr_mappings] if isinstance(attr_mappings, dict) else attr_mappings
-            )
-            attr_mappings = self.clean_keys(attr_mappings)
-            return attr_mappings
+            return [dict(attr_map) for attr_map in attr_mappings]
         else:
             logger.error(
                 f"Geen Attribute-mapping voor {self.mapping['Name']} van {self.file_pd_ldm} gevonden"
@@ -81,12 +75,12 @@ class MappingAttributesTransformer(BaseTransformer):
         key_path = [
             "c:BaseStructuralFeatureMapping.Feature",
             "o:EntityAttribute",
-            "@Ref",
+            "Ref",
         ]
         id_attr = self._get_nested(data=attr_map, keys=key_path)
         if id_attr in dict_attributes:
             # Set target attribute
-            attr_map["AttributeTarget"] = dict_attributes[id_attr].copy()
+            attr_map["AttributeTarget"] = dict_attributes[id_attr]
             attr_map.pop("c:BaseStructuralFeatureMapping.Feature")
             # Set source for an attribute (called features because they can contain scalar business rules as well)
             self._handle_source_feature(
@@ -147,9 +141,9 @@ class MappingAttributesTransformer(BaseTransformer):
             "o:ExtendedCollection",
             "c:Content",
             "o:ExtendedSubObject",
-            "@Ref",
+            "Ref",
         ]
-        id_alias = self._get_nested(data=attr_map, keys=path_keys)
+        id_alias = next(iter(self._get_nested_items(data=attr_map, keys=path_keys)), None)
         if id_alias:
             # FIXME logger info informatief maken
             logger.info(
@@ -170,9 +164,7 @@ class MappingAttributesTransformer(BaseTransformer):
         Returns:
             str: De referentie naar het bronattribuut.
         """
-        type_entity = self.determine_reference_type(data=attr_map["c:SourceFeatures"])
-        id_attr = attr_map["c:SourceFeatures"][type_entity]["@Ref"]
-        return id_attr
+        return self.get_reference(data=attr_map["c:SourceFeatures"])
 
     def _handle_regular_mapping(
         self, attr_map: dict, attribute: dict, id_composition: str
@@ -190,9 +182,11 @@ class MappingAttributesTransformer(BaseTransformer):
             "StereotypeEntity" not in attribute or attribute["StereotypeEntity"] is None
         )
         if is_regular_mapping:
-            attr_map["AttributesSource"] = attribute.copy()
-            if id_composition:
-                attr_map["AttributesSource"]["EntityAlias"] = id_composition
+            attr_map["AttributesSource"] = (
+                attribute | {"EntityAlias": id_composition}
+                if id_composition
+                else attribute
+            )
 
     def _handle_aggregate_expression(self, attr_map: dict) -> None:
         """Voegt een expressie toe aan de mapping als er een aggregate expressie aanwezig is.
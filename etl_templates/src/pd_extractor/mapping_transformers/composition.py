@@ -46,6 +46,7 @@ class SourceCompositionTransformer(BaseTransformer):
             dict_objects=dict_objects,
             dict_attributes=dict_attributes,
         )
+        self.mapping.pop("c:ExtendedCompositions", None)
 
         self._handle_datasource(dict_datasources=dict_datasources)
         return self.mapping
@@ -63,8 +64,6 @@ class SourceCompositionTransformer(BaseTransformer):
         """
         path_keys = ["c:ExtendedCompositions", "o:ExtendedComposition"]
         composition = self._get_nested(data=mapping, keys=path_keys)
-        composition = self.clean_keys(composition)
-        composition = [composition] if isinstance(composition, dict) else composition
         composition = self._remove_mdde_examples(composition)
         return composition
 
@@ -82,17 +81,12 @@ class SourceCompositionTransformer(BaseTransformer):
         """
         composition_items = []
         content = composition.get("c:ExtendedComposition.Content")
-        if (
-            "c:ExtendedCollections" in content["o:ExtendedSubObject"]
-            or "o:ExtendedSubObject" in content
-        ):
+        if "o:ExtendedSubObject" in content:
             composition_items = content["o:ExtendedSubObject"]
         elif "c:ExtendedCollections" in content:
             composition_items = content["c:ExtendedCollections"]
         else:
             logger.warning(f"Mapping zonder inhoud voor {self.file_pd_ldm}")
-        if isinstance(composition_items, dict):
-            composition_items = [composition_items]
         return composition_items
 
     def _handle_composition_items(
@@ -113,16 +107,18 @@ class SourceCompositionTransformer(BaseTransformer):
         Returns:
             list[dict]: Een lijst van getransformeerde en gefilterde compositie-items.
         """
-        for i, composition_item in enumerate(composition_items):
-            composition_item = self._handle_composition_item(
+        composition_items = [
+            self._handle_composition_item(
                 composition_item,
                 dict_objects=dict_objects,
                 dict_attributes=dict_attributes,
             )
+            for composition_item in composition_items
+        ]
+        for i, composition_item in enumerate(composition_items):
             composition_item["Order"] = i
             if "c:ExtendedCompositions" in composition_item:
                 composition_item.pop("c:ExtendedCompositions")
-            composition_items[i] = composition_item
         # composition_items = [
         #     item
         #     for item in composition_items
@@ -170,7 +166,7 @@ class SourceCompositionTransformer(BaseTransformer):
         Returns:
             dict: Geschoonde en verrijkte versie van de compositie
         """
-        composition = self.clean_keys(composition)
+        composition = dict(composition)
         self._handle_join_type_and_alias(composition)
         composition = self._handle_composition_entity(
             composition=composition, dict_objects=dict_objects
@@ -274,19 +270,19 @@ class SourceCompositionTransformer(BaseTransformer):
 
         path_keys_1 = ["c:ExtendedComposition.Content", "o:ExtendedSubObject"]
         path_keys_2 = ["c:ExtendedCollections", "o:ExtendedCollection"]
-        if entity := self._get_nested(data=composition, keys=path_keys_1):
+        if entities := self._get_nested(data=composition, keys=path_keys_1):
             root_data = "c:ExtendedComposition.Content"
-        elif entity := self._get_nested(data=composition, keys=path_keys_2):
+        elif entities := self._get_nested(data=composition, keys=path_keys_2):
             root_data = "c:ExtendedCollections"
         elif "c:Content" in composition:
             root_data = "c:Content"
-            entity = composition
+            entities = [composition]
         else:
             return composition
-        entity = self.clean_keys(entity)
+        # Een compositie item verwijst naar één entiteit
+        entity = entities[0]
         if "c:Content" in entity:
-            type_entity = self.determine_reference_type(data=entity["c:Content"])
-            id_entity = entity["c:Content"][type_entity]["@Ref"]
+            id_entity = self.get_reference(data=entity["c:Content"])
             entity = dict_objects[id_entity]
         composition["Entity"] = entity
         composition.pop(root_data)
@@ -301,7 +297,7 @@ class SourceCompositionTransformer(BaseTransformer):
         """
         if "c:DataSource" in self.mapping:
             datasource_alias_id = self.mapping["c:DataSource"]["o:DefaultDataSource"][
-                "@Ref"
+                "Ref"
             ]
             datasource_code = dict_datasources[datasource_alias_id]["Code"]
             self.mapping["DataSource"] = datasource_code
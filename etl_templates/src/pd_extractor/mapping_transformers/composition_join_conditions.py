@@ -1,5 +1,3 @@
-import copy
-
 from logtools import get_logger
 
 from ..base_transformer import BaseTransformer
@@ -32,7 +30,7 @@ class JoinConditionsTransformer(BaseTransformer):
             dict: De bijgewerkte compositie dictionary met getransformeerde join condities.
         """
         if conditions := self._get_conditions():
-            conditions = self.clean_keys(conditions)
+            conditions = [dict(condition) for condition in conditions]
             for i, condition in enumerate(conditions):
                 self._process_condition(
                     condition=condition, index=i, dict_attributes=dict_attributes
@@ -55,13 +53,12 @@ class JoinConditionsTransformer(BaseTransformer):
             "c:ExtendedComposition.Content",
             "o:ExtendedSubObject",
         ]
-        conditions = self._get_nested(data=self.composition, keys=path_keys)
+        conditions = self._get_nested_items(data=self.composition, keys=path_keys)
         if not conditions:
             logger.error(
                 f"Kan geen join condities vinden in mapping '{self.mapping['Name']}' in '{self.file_pd_ldm}'"
             )
             return []
-        conditions = [conditions] if isinstance(conditions, dict) else conditions
         return conditions
 
     def _process_condition(self, condition: dict, index: int, dict_attributes: dict):
@@ -119,15 +116,15 @@ class JoinConditionsTransformer(BaseTransformer):
             condition=condition, dict_attributes=dict_attributes
         )
 
+        # De attributen uit de lookup worden gedeeld door alle mappings, de alias komt op een nieuw record
         if dict_parent:
             if alias_parent is not None:
-                dict_parent.update({"EntityAlias": alias_parent})
-            dict_components["AttributeParent"] = copy.deepcopy(dict_parent)
-            # Deepcopy makes sure entityalias for child and parent are not the same
+                dict_parent = dict_parent | {"EntityAlias": alias_parent}
+            dict_components["AttributeParent"] = dict_parent
 
         if dict_child:
-            dict_child.update({"EntityAlias": self.composition["Id"]})
-            dict_components["AttributeChild"] = copy.deepcopy(dict_child)
+            dict_child = dict_child | {"EntityAlias": self.composition["Id"]}
+            dict_components["AttributeChild"] = dict_child
 
         condition["JoinConditionComponents"] = dict_components
         condition.pop("c:ExtendedCollections", None)
@@ -166,7 +163,7 @@ class JoinConditionsTransformer(BaseTransformer):
                 )
             else:
                 logger.warning(
-                    f"Ongeldige join item in conditie '{type_component}' voor mapping '{self.mapping['a:Name']}' in {self.file_pd_ldm}"
+                    f"Ongeldige join item in conditie '{type_component}' voor mapping '{self.mapping['Name']}' in {self.file_pd_ldm}"
                 )
         return dict_child, dict_parent, alias_parent
 
@@ -186,11 +183,9 @@ class JoinConditionsTransformer(BaseTransformer):
         )
         if not components:
             logger.error(
-                f"Kan geen join conditie componenten vinden voor mapping '{self.mapping['a:Name']}' in '{self.file_pd_ldm}'"
+                f"Kan geen join conditie componenten vinden voor mapping '{self.mapping['Name']}' in '{self.file_pd_ldm}'"
             )
             return
-        components = [components] if isinstance(components, dict) else components
-        components = self.clean_keys(components)
         return components
 
     def _handle_component_child_attribute(
@@ -206,17 +201,15 @@ class JoinConditionsTransformer(BaseTransformer):
             dict | None: Een kopie van het child attribute dictionary.
         """
         logger.debug(f"Child attribute toegevoegd voor {self.file_pd_ldm}")
-        type_entity = self.determine_reference_type(data=component["c:Content"])
-        path_keys = ["c:Content", type_entity, "@Ref"]
-        if id_attr := self._get_nested(data=component, keys=path_keys):
+        if id_attr := self.get_reference(data=component["c:Content"]):
             if attr := dict_attributes.get(id_attr):
                 return attr
             else:
                 logger.error(
-                    f"Kon attribuut niet vinden voor een child voor join condities voor mapping '{self.mapping['a:Name']}' uit '{self.file_pd_ldm}'"
+                    f"Kon attribuut niet vinden voor een child voor join condities voor mapping '{self.mapping['Name']}' uit '{self.file_pd_ldm}'"
                 )
         logger.error(
-            f"Geen attribuut referentie gevonden een child voor join condities voor mapping '{self.mapping['a:Name']}' uit '{self.file_pd_ldm}'"
+            f"Geen attribuut referentie gevonden een child voor join condities voor mapping '{self.mapping['Name']}' uit '{self.file_pd_ldm}'"
         )
         return None
 
@@ -231,12 +224,12 @@ class JoinConditionsTransformer(BaseTransformer):
         Returns:
             str | None: De parent entity alias als string, of None als deze niet gevonden is.
         """
-        path_keys = ["c:Content", "o:ExtendedSubObject", "@Ref"]
+        path_keys = ["c:Content", "o:ExtendedSubObject", "Ref"]
         logger.debug(f"Parent entity alias toegevoegd voor {self.file_pd_ldm}")
         parent_alias = self._get_nested(data=component, keys=path_keys)
         if not parent_alias:
             logger.error(
-                f"Kan geen parent alias vinden voor een join conditie in '{self.composition['Name']}' van mapping '{self.mapping['a:Name']}' uit '{self.file_pd_ldm}'"
+                f"Kan geen parent alias vinden voor een join conditie in '{self.composition['Name']}' van mapping '{self.mapping['Name']}' uit '{self.file_pd_ldm}'"
             )
         return parent_alias
 
@@ -255,18 +248,15 @@ class JoinConditionsTransformer(BaseTransformer):
         Returns:
             dict: Een kopie van het parent attribute dictionary.
         """
-        try:
-            content = component.get("c:Content")
-            type_entity = self.determine_reference_type(data=content)
-            id_attr = content[type_entity]["@Ref"]
-        except KeyError:
+        id_attr = self.get_reference(data=component.get("c:Content"))
+        if id_attr is None:
             logger.error(
-                f"Kan geen attribuut vinden voor '{self.mapping['a:Name']}' in '{self.file_pd_ldm}'"
+                f"Kan geen attribuut vinden voor '{self.mapping['Name']}' in '{self.file_pd_ldm}'"
             )
             return {}
         if attr := dict_attributes.get(id_attr):
             return attr
         else:
             logger.error(
-                f"Kan geen attribuut vinden voor referentie '{id_attr}' in mapping '{self.mapping['a:Name']}' in '{self.file_pd_ldm}'"
+                f"Kan geen attribuut vinden voor referentie '{id_attr}' in mapping '{self.mapping['Name']}' in '{self.file_pd_ldm}'"
             )
@@ -1,8 +1,7 @@
-import re
-
 from logtools import get_logger
 
 from ..base_transformer import BaseTransformer
+from ..sql_expression import parse_sql_expression
 
 logger = get_logger(__name__)
 
@@ -53,8 +52,7 @@ class ScalarTransform(BaseTransformer):
         Args:
             dict_attributes (dict): Alle attributen (intern en extern) die gebruikt worden voor verrijking.
         """
-        scalars = self._get_scalars()
-        scalars = self.clean_keys(scalars)
+        scalars = [dict(scalar) for scalar in self._get_scalars()]
         for i, scalar in enumerate(scalars):
             scalar["Order"] = i
             self._process_scalar(scalar=scalar, dict_attributes=dict_attributes)
@@ -75,9 +73,7 @@ class ScalarTransform(BaseTransformer):
             "c:ExtendedComposition.Content",
             "o:ExtendedSubObject",
         ]
-        scalars = self._get_nested(data=self.composition, keys=path_keys)
-        scalars = [scalars] if isinstance(scalars, dict) else scalars
-        return scalars
+        return self._get_nested_items(data=self.composition, keys=path_keys)
 
     def _process_sql_expression(self) -> None:
         """Vervangt variabelen in de SQL-expressie en werkt de compositie bij met de aangepaste expressie.
@@ -112,7 +108,6 @@ class ScalarTransform(BaseTransformer):
         components = self._get_nested(
             data=scalar, keys=["c:ExtendedCollections", "o:ExtendedCollection"]
         )
-        components = [components] if isinstance(components, dict) else components
         scalar["ScalarConditionVariable"] = self._handle_scalar_components(
             components=components, dict_attributes=dict_attributes
         )
@@ -143,7 +138,7 @@ class ScalarTransform(BaseTransformer):
         )
         if len(dict_parent) > 0:
             if alias_parent is not None:
-                dict_parent.update({"EntityAlias": alias_parent})
+                dict_parent = dict_parent | {"EntityAlias": alias_parent}
             dict_scalar_attribute["SourceAttribute"] = (
                 dict_parent["EntityAlias"] + "." + dict_parent["Code"]
             )
@@ -158,50 +153,35 @@ class ScalarTransform(BaseTransformer):
         Vervangt variabelen in een SQL-expressie door de bijbehorende source variabelen uit de scalar condities.
 
         Deze functie zoekt naar target variabelen in de SQL-expressie en vervangt deze door de juiste source variabelen,
-        op basis van de mapping in dict_scalar_conditions.
+        op basis van de mapping in dict_scalar_conditions. De expressie wordt per scalar maar één keer opgedeeld,
+        waarna alle variabelen in één doorloop worden vervangen.
 
         Args:
             sql_expression (str): De SQL-expressie waarin variabelen vervangen moeten worden.
             sql_expression_variables (tuple): Tuple van variabelen die in de expressie voorkomen.
-            dict_scalar_conditions (dict): Dictionary met target en source variabelen per conditie.
 
         Returns:
             str: De aangepaste SQL-expressie met vervangen variabelen.
         """
-
-        def _get_target_variable(condition: str) -> str:
-            return dict_scalar_conditions[condition]["TargetVariable"].upper()
-
-        def _get_source_variable(condition: str) -> str:
-            return dict_scalar_conditions[condition]["SourceVariable"]
-
-        def _find_matching_variable(
-            target_variable: str, sql_expression_variables: tuple
-        ) -> str | None:
-            for variable in sql_expression_variables:
-                variable_compare = variable[1:]
-                if target_variable == variable_compare:
-                    return variable
-            return None
-
         dict_scalar_conditions = self._create_scalar_lookup(
             scalars=self.composition["ScalarConditions"]
         )
-
-        for condition in dict_scalar_conditions:
-            target_variable = _get_target_variable(condition)
-            variable = _find_matching_variable(
-                target_variable, sql_expression_variables
-            )
-            if variable is not None:
-                source_variable = _get_source_variable(condition)
-                pattern = f"{variable}" + r"\b"
-                sql_expression = re.sub(pattern, source_variable, sql_expression)
+        dict_variables = {}
+        for variable in sql_expression_variables:
+            dict_variables.setdefault(variable[1:], variable)
+
+        replacements = {}
+        for scalar_condition in dict_scalar_conditions.values():
+            target_variable = scalar_condition["TargetVariable"].upper()
+            if variable := dict_variables.get(target_variable):
+                replacements.setdefault(variable, scalar_condition["SourceVariable"])
             else:
                 logger.info(
                     f"Er is geen sql_expression gevonden voor {self.file_pd_ldm}"
                 )
-        return sql_expression
+        if sql_expression is None:
+            return None
+        return parse_sql_expression(sql_expression).substitute(replacements)
 
     def _create_scalar_lookup(self, scalars: list[dict]) -> dict:
         """Maakt een lookup dictionary aan voor scalars op basis van scalar condities.
@@ -229,18 +209,17 @@ class ScalarTransform(BaseTransformer):
         """Haalt het child attribute dictionary op uit het opgegeven component.
 
         Deze functie zoekt het child attribute op dat wordt gerefereerd in het component en
-        retourneert een kopie van het dictionary uit dict_attributes.
+        retourneert het gedeelde dictionary uit dict_attributes.
 
         Args:
             component (dict): Het component dat de child attribute referentie bevat.
             dict_attributes (dict): Dictionary met alle beschikbare attributen.
 
         Returns:
-            dict: Een kopie van het child attribute dictionary.
+            dict: Het child attribute dictionary.
         """
-        type_entity = self.determine_reference_type(data=component["c:Content"])
-        id_attr = component["c:Content"][type_entity]["@Ref"]
-        return dict_attributes[id_attr].copy()
+        id_attr = self.get_reference(data=component["c:Content"])
+        return dict_attributes[id_attr]
 
     def _handle_child_attribute(
         self, components: list[dict], dict_attributes: dict
@@ -256,7 +235,6 @@ class ScalarTransform(BaseTransformer):
         Returns:
             dict: Het gevonden child attribute dictionary, of een lege dictionary als niet gevonden.
         """
-        components = self.clean_keys(content=components)
         return next(
             (
                 self._get_child_attribute(
@@ -282,10 +260,9 @@ class ScalarTransform(BaseTransformer):
         """
         dict_parent = {}
         alias_parent = None
-        components = self.clean_keys(components)
         for component in components:
             if component["Name"] == "mdde_ParentSourceObject":
-                alias_parent = component["c:Content"]["o:ExtendedSubObject"]["@Ref"]
+                alias_parent = component["c:Content"]["o:ExtendedSubObject"]["Ref"]
             elif component["Name"] == "mdde_ParentAttribute":
                 dict_parent = self._get_parent_attribute(
                     component=component, dict_attributes=dict_attributes
@@ -296,16 +273,15 @@ class ScalarTransform(BaseTransformer):
         """Haalt het parent attribute dictionary op uit het opgegeven component.
 
         Deze functie zoekt het parent attribute op dat wordt gerefereerd in het component en retourneert
-        een kopie van het dictionary uit dict_attributes.
+        het gedeelde dictionary uit dict_attributes.
 
         Args:
             component (dict): Het component dat de parent attribute referentie bevat.
             dict_attributes (dict): Dictionary met alle beschikbare attributen.
 
         Returns:
-            dict: Een kopie van het parent attribute dictionary.
+            dict: Het parent attribute dictionary.
         """
         logger.debug(f"ScalarConditionAttribute toegevoegd voor {self.file_pd_ldm}")
-        type_entity = self.determine_reference_type(data=component["c:Content"])
-        id_attr = component["c:Content"][type_entity]["@Ref"]
-        return dict_attributes[id_attr].copy()
+        id_attr = self.get_reference(data=component["c:Content"])
+        return dict_attributes[id_attr]
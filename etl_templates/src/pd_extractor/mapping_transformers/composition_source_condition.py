@@ -48,10 +48,8 @@ class SourceConditionTransform(BaseTransformer):
             "c:ExtendedComposition.Content",
             "o:ExtendedSubObject",
         ]
-        conditions = self._get_nested(data=self.composition, keys=path_keys)
-        conditions = [conditions] if isinstance(conditions, dict) else conditions
-        conditions = self.clean_keys(conditions)
-        return conditions
+        conditions = self._get_nested_items(data=self.composition, keys=path_keys)
+        return [dict(condition) for condition in conditions]
 
     def _handle_source_condition(
         self, index: int, dict_attributes: dict, condition: dict
@@ -99,7 +97,7 @@ class SourceConditionTransform(BaseTransformer):
     def _get_components(self, condition: dict) -> list[dict]:
         """Haalt de componenten op uit een source conditie.
 
-        Deze functie retourneert een lijst van componenten, ongeacht of de input een enkele dict of een lijst is.
+        Deze functie retourneert de lijst van componenten van de conditie.
 
         Args:
             condition (dict): De conditie waaruit de componenten worden gehaald.
@@ -109,12 +107,10 @@ class SourceConditionTransform(BaseTransformer):
         """
         path_keys = ["c:ExtendedCollections", "o:ExtendedCollection"]
         if components := self._get_nested(data=condition, keys=path_keys):
-            components = [components] if isinstance(components, dict) else components
-            components = self.clean_keys(components)
             return components
         else:
             logger.error(
-                f"Kan geen filter componenten vinden voor mapping '{self.mapping['a:Name']}' in '{self.file_pd_ldm}'"
+                f"Kan geen filter componenten vinden voor mapping '{self.mapping['Name']}' in '{self.file_pd_ldm}'"
             )
             return []
 
@@ -137,7 +133,7 @@ class SourceConditionTransform(BaseTransformer):
             condition["SourceConditionVariable"] = parent_literal
         else:
             logger.warning(
-                f"Geen SourceConditionVariable gevonden voor condition {condition.get('Code', '')} in mapping {self.mapping['a:Name']} voor {self.file_pd_ldm}"
+                f"Geen SourceConditionVariable gevonden voor condition {condition.get('Code', '')} in mapping {self.mapping['Name']} voor {self.file_pd_ldm}"
             )
 
     def _handle_components(
@@ -165,13 +161,12 @@ class SourceConditionTransform(BaseTransformer):
         )
         if dict_parent:
             if alias_parent is not None:
-                dict_parent.update({"EntityAlias": alias_parent})
+                dict_parent = dict_parent | {"EntityAlias": alias_parent}
             dict_source_condition_attribute["SourceAttribute"] = dict_parent
         if parent_literal != "" and dict_child:
-            dict_source_condition_attribute["SourceAttribute"] = dict_child
-            dict_source_condition_attribute["SourceAttribute"]["Expression"] = (
-                parent_literal
-            )
+            dict_source_condition_attribute["SourceAttribute"] = dict_child | {
+                "Expression": parent_literal
+            }
         return dict_source_condition_attribute
 
     def _get_source_parent_attribute_and_alias(
@@ -188,16 +183,14 @@ class SourceConditionTransform(BaseTransformer):
         """
         dict_parent = {}
         alias_parent = None
-        components = self.clean_keys(components)
         for component in components:
             if component["Name"] == "mdde_ParentSourceObject":
                 alias_parent = self._get_nested(
-                    data=component, keys=["c:Content", "o:ExtendedSubObject", "@Ref"]
+                    data=component, keys=["c:Content", "o:ExtendedSubObject", "Ref"]
                 )
             elif component["Name"] == "mdde_ParentAttribute":
-                type_entity = self.determine_reference_type(data=component["c:Content"])
-                id_attr = component["c:Content"][type_entity]["@Ref"]
-                dict_parent = dict_attributes[id_attr].copy()
+                id_attr = self.get_reference(data=component["c:Content"])
+                dict_parent = dict_attributes[id_attr]
         return dict_parent, alias_parent
 
     def _get_source_child_attribute(
@@ -210,12 +203,10 @@ class SourceConditionTransform(BaseTransformer):
             dict_attributes (dict): Dictionary met alle beschikbare attributen.
 
         Returns:
-            dict: Een kopie van het child attribute dictionary, of leeg dict als niet gevonden.
+            dict: Het child attribute dictionary, of leeg dict als niet gevonden.
         """
-        components = self.clean_keys(components)
         components = [x for x in components if x["Name"] == "mdde_ChildAttribute"]
         for component in components:
-            type_entity = self.determine_reference_type(data=component["c:Content"])
-            id_attr = component["c:Content"][type_entity]["@Ref"]
-            return dict_attributes[id_attr].copy()
+            id_attr = self.get_reference(data=component["c:Content"])
+            return dict_attributes[id_attr]
         return {}
@@ -24,7 +24,7 @@ class MappingTransformer(BaseTransformer):
         Returns:
             dict: De opgeschoonde en genormaliseerde mapping.
         """
-        mapping = self.clean_keys(mapping)
+        mapping = dict(mapping)
         mapping = self._normalize_names(mapping)
         return mapping
 
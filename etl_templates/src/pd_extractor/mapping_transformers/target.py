@@ -27,7 +27,7 @@ class TargetEntityTransformer(BaseTransformer):
             list: een mapping met geschoonde doelentiteit data.
         """
         # Target entity rerouting and enriching
-        path_keys = ["c:Classifier", "o:Entity", "@Ref"]
+        path_keys = ["c:Classifier", "o:Entity", "Ref"]
         if id_entity_target := self._get_nested(data=self.mapping, keys=path_keys):
             self.mapping["EntityTarget"] = dict_objects[id_entity_target]
         else:
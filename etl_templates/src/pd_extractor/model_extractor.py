@@ -17,16 +17,19 @@ class ModelExtractor(BaseExtractor):
         self.transform_model_internal = ModelInternalTransformer(file_pd_ldm)
         self.transform_models_external = ModelsExternalTransformer(file_pd_ldm)
 
-    def get_models(self, dict_domains: dict) -> list[dict]:
+    def get_models(self, dict_domains: dict, entities: list[dict]) -> list[dict]:
         """Haalt alle modellen en hun bijbehorende objecten op die gebruikt worden in het Power Designer LDM
 
         Args:
             dict_domains (dict): Domeinen die worden gebruikt om datatypes van kolommen te verrijken.
+            entities (list[dict]): De entiteiten van het model, zonder filters en scalars.
 
         Returns:
             list[dict]: lijst van modellen die gebruikt worden in het Power Designer LDM document
         """
-        internal_model = self._model_internal(dict_domains=dict_domains)
+        internal_model = self._model_internal(
+            dict_domains=dict_domains, entities=entities
+        )
         external_models = self._models_external()
         # Combine models
         models = (
@@ -34,43 +37,38 @@ class ModelExtractor(BaseExtractor):
         )
         return models
 
-    def _model_internal(self, dict_domains: dict) -> dict:
+    def _model_internal(self, dict_domains: dict, entities: list[dict]) -> dict:
         """Haalt alle vastgelegde data van het model op vanuit het geladen Power Designer document
 
         Args:
             dict_domains (dict): Domeinen
+            entities (list[dict]): De entiteiten van het model, zonder filters en scalars
 
         Returns:
             dict: In het Power Designer LDM ontworpen model (niet geïmporteerd voor ETL)
         """
         model = self.transform_model_internal.transform(content=self.content)
-        entities = self._entities_internal(dict_domains=dict_domains)
+        entities = self._entities_internal(entities=entities, dict_domains=dict_domains)
         model["Entities"] = entities
         model["Relationships"] = self._relationships(entities=entities)
         model["DataSources"] = self._datasources()
         return model
 
-    def _entities_internal(self, dict_domains: dict) -> list[dict]:
-        """Haalt alle interne entiteiten op uit het Power Designer model.
+    def _entities_internal(self, entities: list[dict], dict_domains: dict) -> list[dict]:
+        """Transformeert alle interne entiteiten uit het Power Designer model.
+
+        De entiteiten zijn al op stereotype ingedeeld door de StereotypeExtractor; filters en scalars
+        worden daar verwerkt en zitten niet in de opgegeven entiteiten.
 
-        Deze functie filtert entiteiten op basis van hun stereotype en transformeert ze met behulp van de interne transformer.
+        Args:
+            entities (list[dict]): De entiteiten van het model.
+            dict_domains (dict): Domeinen die worden gebruikt om datatypes van kolommen te verrijken.
 
         Returns:
             list[dict]: Lijst van interne entiteiten uit het model.
         """
-        entities = self.content["c:Entities"]["o:Entity"]
-
-        internal_entities = []
-        internal_entities.extend(
-            entity
-            for entity in entities
-            if (
-                "Stereotype" not in entity
-                or entity["Stereotype"] == "mdde_AggregateBusinessRule"
-            )
-        )
-        self.transform_model_internal.transform_entities(
-            entities=internal_entities, dict_domains=dict_domains
+        internal_entities = self.transform_model_internal.transform_entities(
+            entities=entities, dict_domains=dict_domains
         )
         return internal_entities
 
@@ -159,7 +157,6 @@ class ModelExtractor(BaseExtractor):
             else ["c:Entities", "o:Shortcut"]
         )
         entities = self._get_nested(data=self.content, keys=path_keys)
-        entities = [entities] if isinstance(entities, dict) else entities
         entities = self.transform_models_external.transform_entities(entities=entities)
         for entity in entities:
             logger.debug(
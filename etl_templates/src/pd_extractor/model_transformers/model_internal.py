@@ -20,28 +20,27 @@ class ModelInternalTransformer(BaseTransformer):
         Returns:
             dict: Geschoonde versie van de data op het niveau van het model
         """
-        content = self.convert_timestamps(content)
         path_keys = ["c:GenerationOrigins", "o:Shortcut"]
         model = self._get_nested(data=content, keys=path_keys)
         if not model:
             included_attributes = [
-                "@Id",
-                "@a:ObjectID",
-                "a:Name",
-                "a:Code",
-                "a:CreationDate",
-                "a:Creator",
-                "a:ModificationDate",
-                "a:Modifier",
-                "a:PackageOptionsText",
-                "a:ModelOptionsText",
-                "a:Author",
-                "a:Version",
-                "a:RepositoryFilename",
-                "a:ExtendedAttributesText",
+                "Id",
+                "ObjectID",
+                "Name",
+                "Code",
+                "CreationDate",
+                "Creator",
+                "ModificationDate",
+                "Modifier",
+                "PackageOptionsText",
+                "ModelOptionsText",
+                "Author",
+                "Version",
+                "RepositoryFilename",
+                "ExtendedAttributesText",
             ]
             model = {item: content[item] for item in content if item in included_attributes}
-        model = self.clean_keys(model)
+        model = self.convert_timestamps(model)
         model["IsDocumentModel"] = True
         return model
 
@@ -54,8 +53,6 @@ class ModelInternalTransformer(BaseTransformer):
         Returns:
             dict: Geschoonde datasource data (Id, naam en code) te gebruiken in model en mapping
         """
-        datasources = [datasources] if isinstance(datasources, dict) else datasources
-        datasources = self.clean_keys(datasources)
         dict_datasources = {
             datasource["Id"]: {
                 "Id": datasource.get("Id"),
@@ -76,7 +73,7 @@ class ModelInternalTransformer(BaseTransformer):
         Returns:
             list: Alle entities
         """
-        entities = self.clean_keys(entities)
+        entities = self.convert_timestamps(entities)
         for entity in entities:
             # Reroute attributes
             entity = self._handle_entity_attributes(
@@ -111,7 +108,6 @@ class ModelInternalTransformer(BaseTransformer):
             dict: Entiteit met geschoonde attribuut data
         """
         attrs = self._get_entity_attributes(entity)
-        attrs = self.clean_keys(attrs)
         for i, attr in enumerate(attrs):
             attr["Order"] = i
             attr = self._enrich_attribute_with_domain(attr, dict_domains)
@@ -137,8 +133,6 @@ class ModelInternalTransformer(BaseTransformer):
             attrs = entity["Variables"]
         else:
             attrs = []
-        if isinstance(attrs, dict):
-            attrs = [attrs]
         return attrs
 
     def _enrich_attribute_with_domain(self, attr: dict, dict_domains: dict) -> dict:
@@ -152,7 +146,7 @@ class ModelInternalTransformer(BaseTransformer):
             dict: Het verrijkte attribuut.
         """
         if id_domain := self._get_nested(
-            data=attr, keys=["c:Domain", "o:Domain", "@Ref"]
+            data=attr, keys=["c:Domain", "o:Domain", "Ref"]
         ):
             attr_domain = dict_domains[id_domain]
             keys_domain = {
@@ -233,7 +227,7 @@ class ModelInternalTransformer(BaseTransformer):
         primary_id = None
         msg_missing = f"Entiteit '{entity['Name']}' heeft geen primary key voor {self.file_pd_ldm}."
         if has_primary:
-            primary_id = entity["c:PrimaryIdentifier"]["o:Identifier"]["@Ref"]
+            primary_id = entity["c:PrimaryIdentifier"]["o:Identifier"]["Ref"]
             entity.pop("c:PrimaryIdentifier")
         elif "Stereotype" in entity:
             logger.warning(msg_missing)
@@ -242,21 +236,15 @@ class ModelInternalTransformer(BaseTransformer):
         return has_primary, primary_id
 
     def _get_identifiers(self, entity: dict) -> list[dict]:
-        """Bereidt de lijst van identifiers voor en maakt deze schoon.
-
-        Deze functie normaliseert de structuur van identifiers en past key-cleaning toe voor verdere verwerking.
+        """Haalt de lijst van identifiers van een entiteit op.
 
         Args:
             entity (dict): De entiteit met identifier data.
 
         Returns:
-            list[dict]: Een geschoonde lijst van identifier dictionaries.
+            list[dict]: De lijst van identifier dictionaries.
         """
-        identifiers = self._get_nested(
-            data=entity, keys=["c:Identifiers", "o:Identifier"]
-        )
-        identifiers = [identifiers] if isinstance(identifiers, dict) else identifiers
-        return self.clean_keys(identifiers)
+        return self._get_nested(data=entity, keys=["c:Identifiers", "o:Identifier"])
 
     def _has_identifier_attributes(self, identifier: dict, entity: dict) -> bool:
         """Controleert of de identifier attribuut-informatie bevat.
@@ -291,7 +279,6 @@ class ModelInternalTransformer(BaseTransformer):
         attr_ids = self._get_nested(
             data=identifier, keys=["c:Identifier.Attributes", "o:EntityAttribute"]
         )
-        attr_ids = [attr_ids] if isinstance(attr_ids, dict) else attr_ids
-        attr_ids = [dict_attrs[d["@Ref"]] for d in attr_ids if "@Ref" in d]
+        attr_ids = [dict_attrs[d["Ref"]] for d in attr_ids if "Ref" in d]
         identifier["Attributes"] = attr_ids
         identifier.pop("c:Identifier.Attributes")
@@ -22,16 +22,26 @@ class RelationshipsTransformer(BaseTransformer):
         Returns:
             list[dict]: Relaties tussen model entiteiten
         """
-        relationships = self.clean_keys(relationships)
-        relationships = (
-            [relationships] if isinstance(relationships, dict) else relationships
-        )
+        relationships = self.convert_timestamps(relationships)
+        # De lookups worden eenmalig per model opgebouwd en voor alle relaties gebruikt
+        dict_entities = self._create_entities_lookup()
+        dict_attributes = self._create_attributes_lookup()
+        dict_identifiers = self._create_identifiers_lookup()
         for i, relationship in enumerate(relationships):
-            relationship = self._process_relationship(relationship=relationship)
+            relationship = self._process_relationship(
+                relationship=relationship,
+                dict_entities=dict_entities,
+                dict_attributes=dict_attributes,
+                dict_identifiers=dict_identifiers,
+            )
             relationships[i] = relationship
         relationships = [x for x in relationships if x is not None]
         return relationships
 
+    def _create_entities_lookup(self) -> dict:
+        """Bouwt een dictionary van entiteiten op basis van hun Id."""
+        return {entity["Id"]: entity for entity in self.entities if "Id" in entity}
+
     def _create_attributes_lookup(self) -> dict:
         """Bouwt een dictionary van attributen op basis van hun Id."""
         return {
@@ -42,22 +52,26 @@ class RelationshipsTransformer(BaseTransformer):
             if "Id" in attr
         }
 
-    def _process_relationship(self, relationship: dict) -> dict:
+    def _process_relationship(
+        self,
+        relationship: dict,
+        dict_entities: dict,
+        dict_attributes: dict,
+        dict_identifiers: dict,
+    ) -> dict:
         """Verwerkt een enkele relatie en verrijkt deze met entiteit-, attribuut- en identifier-informatie.
 
         Deze functie koppelt entiteiten, voegt join-informatie toe en verrijkt de relatie met identifiers.
 
         Args:
             relationship (dict): De relatie die verwerkt moet worden.
+            dict_entities (dict): Lookup voor alle entiteiten van het model.
+            dict_attributes (dict): Lookup voor alle attributen van het model.
+            dict_identifiers (dict): Lookup voor alle identifiers van het model.
 
         Returns:
             dict: De verrijkte relatie, of None als de relatie naar een extern model verwijst.
         """
-        dict_entities = {
-            entity["Id"]: entity for entity in self.entities if "Id" in entity
-        }
-        dict_attributes = self._create_attributes_lookup()
-        dict_identifiers = self._create_identifiers_lookup()
         if relationship := self._handle_relationship_entities(
             relationship=relationship, dict_entities=dict_entities
         ):
@@ -95,7 +109,7 @@ class RelationshipsTransformer(BaseTransformer):
         """
         relationship_with_external = False
         id_entity = self._get_nested(
-            data=relationship, keys=["c:Object1", "o:Entity", "@Ref"]
+            data=relationship, keys=["c:Object1", "o:Entity", "Ref"]
         )
         if id_entity in dict_entities:
             relationship["Entity1"] = dict_entities[id_entity]
@@ -104,9 +118,9 @@ class RelationshipsTransformer(BaseTransformer):
             relationship_with_external = True
 
         if "o:Entity" in relationship["c:Object2"]:
-            id_entity = relationship["c:Object2"]["o:Entity"]["@Ref"]
+            id_entity = relationship["c:Object2"]["o:Entity"]["Ref"]
         elif "o:Shortcut" in relationship["c:Object2"]:
-            id_entity = relationship["c:Object2"]["o:Shortcut"]["@Ref"]
+            id_entity = relationship["c:Object2"]["o:Shortcut"]["Ref"]
         if id_entity in dict_entities:
             relationship["Entity2"] = dict_entities[id_entity]
             relationship.pop("c:Object2")
@@ -133,8 +147,6 @@ class RelationshipsTransformer(BaseTransformer):
         if joins := self._get_nested(
             data=relationship, keys=["c:Joins", "o:RelationshipJoin"]
         ):
-            joins = [joins] if isinstance(joins, dict) else joins
-            joins = self.clean_keys(joins)
             for i, join in enumerate(joins):
                 join = self._handle_join_entities(
                     join_data=join,
@@ -221,11 +233,11 @@ class RelationshipsTransformer(BaseTransformer):
             str | None: Het attribuut-ID voor Entity1, of None als niet gevonden.
         """
         if join_entity := self._get_nested(
-            join_data, keys=["c:Object1", "o:EntityAttribute", "@Ref"]
+            join_data, keys=["c:Object1", "o:EntityAttribute", "Ref"]
         ):
             return join_entity
         elif join_entity := self._get_nested(
-            data=join_data, keys=["c:Object1", "o:Shortcut", "@Ref"]
+            data=join_data, keys=["c:Object1", "o:Shortcut", "Ref"]
         ):
             logger.warning(
                 f"Relationship:{relationship['Name']}, join relatie ontbreekt in {self.file_pd_ldm}"
@@ -250,7 +262,7 @@ class RelationshipsTransformer(BaseTransformer):
             dict | None: Het attribuut voor Entity2, of None als niet gevonden.
         """
         id_attr = self._get_nested(
-            data=join_data, keys=["c:Object2", "o:EntityAttribute", "@Ref"]
+            data=join_data, keys=["c:Object2", "o:EntityAttribute", "Ref"]
         )
         if id_attr in dict_attributes:
             return dict_attributes[id_attr]
@@ -271,7 +283,7 @@ class RelationshipsTransformer(BaseTransformer):
         Returns:
             dict: Relatie verrijkt met geschoonde identifier data
         """
-        path_keys = ["c:ParentIdentifier", "o:Identifier", "@Ref"]
+        path_keys = ["c:ParentIdentifier", "o:Identifier", "Ref"]
         if identifier_ids := self._get_nested(data=relationship, keys=path_keys):
             identifier_ids = (
                 [identifier_ids] if isinstance(identifier_ids, str) else identifier_ids
@@ -22,7 +22,7 @@ class ModelsExternalTransformer(BaseTransformer):
             list[dict]: Doelmodellen met entiteit data
         """
         results = []
-        models = self.clean_keys(models)
+        models = self.convert_timestamps(models)
 
         for model in models:
             self._enrich_model_with_entities(model, dict_entities)
@@ -44,9 +44,7 @@ class ModelsExternalTransformer(BaseTransformer):
         """
         path_keys = ["c:SessionShortcuts", "o:Shortcut"]
         if shortcuts := self._get_nested(data=model, keys=path_keys):
-            if isinstance(shortcuts, dict):
-                shortcuts = [shortcuts]
-            shortcuts = [i["@Ref"] for i in shortcuts]
+            shortcuts = [i["Ref"] for i in shortcuts]
             model["Entities"] = [
                 dict_entities[id] for id in shortcuts if id in dict_entities
             ]
@@ -65,7 +63,7 @@ class ModelsExternalTransformer(BaseTransformer):
         if "c:FullShortcutModel" in model:
             model.pop("c:FullShortcutModel")
 
-    def transform_entities(self, entities: list[dict] | dict) -> list[dict]:
+    def transform_entities(self, entities: list[dict]) -> list[dict]:
         """
         Transformeert en schoont externe entiteiten uit het Power Designer model.
 
@@ -73,15 +71,12 @@ class ModelsExternalTransformer(BaseTransformer):
         transformeert de attribuutdata en retourneert een geschoonde lijst van entiteiten.
 
         Args:
-            entities (list[dict] | dict): Externe entiteiten of een enkele entiteit.
+            entities (list[dict]): Externe entiteiten.
 
         Returns:
             list[dict]: Geschoonde en getransformeerde entiteiten.
         """
-        entities = (
-            [entities] if isinstance(entities, dict) else entities
-        )
-        entities = self.clean_keys(entities)
+        entities = self.convert_timestamps(entities)
         for entity in entities:
             if "c:FullShortcutReplica" in entity:
                 entity.pop("c:FullShortcutReplica")
@@ -99,11 +94,9 @@ class ModelsExternalTransformer(BaseTransformer):
             dict: Entiteit data met omgevormde en geschoonde attribuut data
         """
         attributes = entity["c:SubShortcuts"]["o:Shortcut"]
-        attributes = [attributes] if isinstance(attributes, dict) else attributes
         for i, attr in enumerate(attributes):
             if "c:FullShortcutReplica" in attr:
                 attr.pop("c:FullShortcutReplica")
             attr["Order"] = i
-        attributes = self.clean_keys(attributes)
         entity["Attributes"] = attributes
         return entity
@@ -0,0 +1,390 @@
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import msgpack
+import orjson
+
+from logtools import get_logger
+
+from .retw_profile import prune_RETW
+
+logger = get_logger(__name__)
+
+# Versie van het RETW formaat dat geschreven wordt
+RETW_VERSION = 2
+# Bestandsextensie per encoding van een RETW-bestand: 'json' is het oorspronkelijke formaat (v1),
+# 'jsonl' en 'msgpack' zijn encodings van v2
+RETW_ENCODINGS = {"json": ".json", "jsonl": ".jsonl", "msgpack": ".msgpack"}
+RETW_SUFFIXES = frozenset(RETW_ENCODINGS.values())
+
+# Onderdeel van het RETW document met de gegevens van het Power Designer document, verplicht in ieder RETW-bestand
+_SECTION_INFO = "Info"
+# Onderdelen van het RETW document die als afzonderlijke records worden geschreven
+_SECTION_MODELS = "Models"
+_SECTION_ENTITIES = "Entities"
+_SECTION_CATALOG = "Catalog"
+# Sleutels waarmee in een genormaliseerd RETW-bestand naar de catalogus verwezen wordt
+_KEY_CATALOG_ID = "IdCatalog"
+_KEY_CATALOG_REMOVED = "KeysRemoved"
+_KEY_CATALOG_ORDER = "KeysOrder"
+_KEYS_CATALOG = (_KEY_CATALOG_ID, _KEY_CATALOG_REMOVED, _KEY_CATALOG_ORDER)
+
+
+def write_RETW(
+    path_output: Path,
+    dict_extract: dict,
+    encoding: str = "jsonl",
+    normalize: bool = True,
+    profile: str = "full",
+) -> None:
+    """Schrijft een geëxtraheerd document als RETW-bestand.
+
+    In RETW v2 bestaat het bestand uit een header record, gevolgd door een record per filter, scalar,
+    model, entiteit en mapping. De records worden met `orjson` als JSON Lines of met `msgpack` als
+    binaire stroom geschreven, waardoor het document nooit in één keer geserialiseerd hoeft te worden.
+    Met encoding 'json' wordt het oorspronkelijke formaat (v1) geschreven.
+
+    Bij een genormaliseerd v2 bestand worden objecten met een 'Id' die meerdere keren in het document
+    voorkomen, zoals attributen en entiteiten, eenmalig in de catalogus opgenomen. Op de plaatsen waar
+    ze gebruikt worden staat een verwijzing naar de catalogus met alleen de afwijkende sleutels.
+    Met het extractieprofiel 'lean' worden alleen de velden geschreven die de afnemers gebruiken.
+
+    Args:
+        path_output (Path): Het pad van het te schrijven RETW-bestand.
+        dict_extract (dict): Het geëxtraheerde document.
+        encoding (str): De encoding van het bestand: 'jsonl', 'msgpack' of 'json'.
+        normalize (bool): Of attributen en entiteiten via een catalogus worden opgenomen (alleen bij RETW v2).
+        profile (str): Het extractieprofiel: 'full' of 'lean'.
+
+    Raises:
+        ValueError: Indien de encoding of het profiel onbekend is.
+    """
+    if encoding not in RETW_ENCODINGS:
+        raise ValueError(
+            f"Onbekende RETW encoding '{encoding}', kies uit: {', '.join(RETW_ENCODINGS)}"
+        )
+    dict_extract = prune_RETW(dict_extract, profile=profile)
+    path = Path(path_output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as file:
+        if encoding == "json":
+            file.write(
+                orjson.dumps(
+                    dict_extract,
+                    default=_serialize_datetime,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        elif encoding == "jsonl":
+            for record in _to_records(dict_extract, normalize=normalize):
+                file.write(
+                    orjson.dumps(
+                        record,
+                        default=_serialize_datetime,
+                        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
+        else:
+            packer = msgpack.Packer(default=_serialize_datetime)
+            for record in _to_records(dict_extract, normalize=normalize):
+                file.write(packer.pack(record))
+
+
+def read_RETW(path_RETW: Path) -> dict:
+    """Leest een RETW-bestand in, ongeacht de versie en encoding.
+
+    Args:
+        path_RETW (Path): Het pad naar het RETW-bestand.
+
+    Returns:
+        dict: Het geëxtraheerde document zoals het geschreven is.
+
+    Raises:
+        ValueError: Indien de inhoud van het bestand geen geldig RETW document is, zoals een JSON-bestand
+            zonder RETW v2 header of zonder sectie 'Info'.
+    """
+    records = iter_RETW_records(path_RETW)
+    header = next(records, None)
+    if header is None:
+        raise ValueError(f"Leeg RETW bestand '{path_RETW}'")
+    if _SECTION_INFO not in header["Keys"]:
+        raise ValueError(f"Geen sectie '{_SECTION_INFO}' in RETW bestand '{path_RETW}'")
+    dict_RETW = {
+        key: header["Values"][key] if key in header["Values"] else []
+        for key in header["Keys"]
+    }
+    for record in records:
+        section = record["Section"]
+        if section == _SECTION_ENTITIES:
+            dict_RETW[_SECTION_MODELS][record["Model"]][_SECTION_ENTITIES].append(
+                record["Data"]
+            )
+        else:
+            dict_RETW[section].append(record["Data"])
+    return dict_RETW
+
+
+def iter_RETW_records(path_RETW: Path) -> Iterator[dict]:
+    """Leest de records van een RETW-bestand één voor één in.
+
+    Het eerste record is de header met de versie en de onderdelen van het document. Een v1 bestand wordt
+    volledig ingelezen en omgezet naar dezelfde records als v2, zodat oude bestanden ook gelezen kunnen worden.
+    De records van een genormaliseerd bestand worden opgelost tegen de catalogus, zodat elk record
+    dezelfde inhoud heeft als in een niet-genormaliseerd bestand.
+
+    Args:
+        path_RETW (Path): Het pad naar het RETW-bestand.
+
+    Yields:
+        dict: De records van het RETW-bestand, beginnend met de header.
+
+    Raises:
+        ValueError: Indien de inhoud van het bestand geen geldig RETW document is.
+    """
+    with open(path_RETW, "rb") as file:
+        start = file.read(1)
+        file.seek(0)
+        try:
+            if start == b"{":
+                line = file.readline()
+                header = _parse_header(line)
+                if header is None:
+                    # RETW v1: één JSON document
+                    dict_RETW = orjson.loads(line + file.read())
+                    if not isinstance(dict_RETW, dict):
+                        raise ValueError(f"Geen RETW document in bestand '{path_RETW}'")
+                    yield from _to_records(dict_RETW)
+                    return
+                records = (orjson.loads(line) for line in file if line.strip())
+                yield header
+                yield from _resolve_records(records)
+            else:
+                records = msgpack.Unpacker(file, raw=False)
+                if (header := next(records, None)) is not None:
+                    if not _is_header(header):
+                        raise ValueError(f"Geen RETW v2 header in bestand '{path_RETW}'")
+                    yield header
+                    yield from _resolve_records(records)
+        except (orjson.JSONDecodeError, msgpack.UnpackException) as e:
+            raise ValueError(f"Invalide inhoud in RETW bestand '{path_RETW}': {e}") from e
+
+
+def _parse_header(line: bytes) -> dict | None:
+    """Geeft de header van een RETW v2 JSON Lines bestand, of None als de regel geen v2 header is.
+
+    Args:
+        line (bytes): De eerste regel van het bestand.
+
+    Returns:
+        dict | None: De header record
+    """
+    try:
+        header = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    if _is_header(header):
+        return header
+    return None
+
+
+def _is_header(record) -> bool:
+    """Controleert of een record de header van een RETW v2 bestand is.
+
+    Args:
+        record: Het eerste record van het bestand.
+
+    Returns:
+        bool: True als het record een RETW v2 header is, anders False.
+    """
+    return (
+        isinstance(record, dict)
+        and record.get("Format") == "RETW"
+        and isinstance(record.get("Keys"), list)
+        and isinstance(record.get("Values"), dict)
+    )
+
+
+def _to_records(dict_extract: dict, normalize: bool = False) -> Iterator[dict]:
+    """Splitst een geëxtraheerd document in RETW v2 records.
+
+    De header bevat de volgorde van de onderdelen van het document en de onderdelen die geen lijst zijn,
+    zoals 'Info'. Elk item van een lijst wordt een eigen record; de entiteiten van een model worden
+    afzonderlijke records die naar de positie van het model verwijzen. Bij normalisatie volgen de
+    catalogus records direct na de header, zodat een lezer ze kent voordat ze gebruikt worden.
+
+    Args:
+        dict_extract (dict): Het geëxtraheerde document.
+        normalize (bool): Of objecten die meerdere keren voorkomen via de catalogus worden opgenomen.
+
+    Yields:
+        dict: De header, gevolgd door de records van het document.
+    """
+    catalog = _build_catalog(dict_extract) if normalize else {}
+    yield {
+        "Format": "RETW",
+        "Version": RETW_VERSION,
+        "Keys": list(dict_extract),
+        "Values": {
+            key: value for key, value in dict_extract.items() if not isinstance(value, list)
+        },
+    }
+    for id_catalog, item in catalog.items():
+        yield {
+            "Section": _SECTION_CATALOG,
+            "Id": id_catalog,
+            "Data": _normalize(item, catalog=catalog, is_catalog_item=True),
+        }
+    for section, items in dict_extract.items():
+        if not isinstance(items, list):
+            continue
+        for i, item in enumerate(items):
+            entities = None
+            if section == _SECTION_MODELS and isinstance(item.get(_SECTION_ENTITIES), list):
+                entities = item[_SECTION_ENTITIES]
+                item = item | {_SECTION_ENTITIES: []}
+            yield {"Section": section, "Data": _normalize(item, catalog=catalog)}
+            for entity in entities or []:
+                yield {
+                    "Section": _SECTION_ENTITIES,
+                    "Model": i,
+                    "Data": _normalize(entity, catalog=catalog),
+                }
+
+
+def _build_catalog(dict_extract: dict) -> dict[str, dict]:
+    """Bepaalt de objecten die in de catalogus van een genormaliseerd RETW-bestand komen.
+
+    Dit zijn de objecten met een 'Id' die meer dan eens in het document voorkomen, zoals de attributen
+    die in attribuut mappings, join condities en scalars gekopieerd zijn. Het eerste voorkomen met de
+    meest gebruikte set sleutels wordt de basis waar de andere voorkomens naar verwijzen.
+
+    Args:
+        dict_extract (dict): Het geëxtraheerde document.
+
+    Returns:
+        dict[str, dict]: De catalogus objecten per 'Id'.
+    """
+    shapes = {}
+    stack = [dict_extract]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            id_item = item.get("Id")
+            if isinstance(id_item, str):
+                shapes.setdefault(id_item, {}).setdefault(tuple(item), []).append(item)
+            stack.extend(reversed(item.values()))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+    return {
+        id_item: max(items_shape.values(), key=len)[0]
+        for id_item, items_shape in shapes.items()
+        if sum(len(items) for items in items_shape.values()) > 1
+    }
+
+
+def _normalize(item, catalog: dict[str, dict], is_catalog_item: bool = False):
+    """Vervangt de objecten uit de catalogus door een verwijzing met alleen de afwijkende sleutels.
+
+    Args:
+        item: Het (deel van het) document dat genormaliseerd wordt.
+        catalog (dict[str, dict]): De catalogus objecten per 'Id'.
+        is_catalog_item (bool): Of het item zelf een catalogus object is, dat dan niet naar zichzelf verwijst.
+
+    Returns:
+        Het genormaliseerde (deel van het) document.
+    """
+    if isinstance(item, list):
+        return [_normalize(value, catalog=catalog) for value in item]
+    if not isinstance(item, dict):
+        return item
+    id_item = item.get("Id")
+    if not is_catalog_item and isinstance(id_item, str) and id_item in catalog:
+        item_catalog = catalog[id_item]
+        keys_changed = [
+            key
+            for key, value in item.items()
+            if key not in item_catalog or item_catalog[key] != value
+        ]
+        keys_removed = [key for key in item_catalog if key not in item]
+        # Alleen verwijzen als er meer sleutels overgenomen worden dan er weggelaten worden
+        if len(item) - len(keys_changed) > len(keys_removed):
+            reference = {_KEY_CATALOG_ID: id_item}
+            for key in keys_changed:
+                reference[key] = _normalize(item[key], catalog=catalog)
+            if keys_removed:
+                reference[_KEY_CATALOG_REMOVED] = keys_removed
+            keys_resolved = [
+                key for key in item_catalog if key not in keys_removed
+            ] + [key for key in keys_changed if key not in item_catalog]
+            if keys_resolved != list(item):
+                reference[_KEY_CATALOG_ORDER] = list(item)
+            return reference
+    return {key: _normalize(value, catalog=catalog) for key, value in item.items()}
+
+
+def _resolve_records(records: Iterator[dict]) -> Iterator[dict]:
+    """Lost de records van een RETW v2 bestand op tegen de catalogus records.
+
+    Args:
+        records (Iterator[dict]): De records van het bestand na de header.
+
+    Yields:
+        dict: De records van het document, zonder de catalogus records.
+    """
+    catalog = {}
+    for record in records:
+        if record["Section"] == _SECTION_CATALOG:
+            catalog[record["Id"]] = record["Data"]
+        elif catalog:
+            yield record | {"Data": _resolve(record["Data"], catalog=catalog)}
+        else:
+            yield record
+
+
+def _resolve(item, catalog: dict[str, dict]):
+    """Vervangt de verwijzingen naar de catalogus door een eigen kopie van het catalogus object.
+
+    Args:
+        item: Het (deel van het) genormaliseerde document.
+        catalog (dict[str, dict]): De genormaliseerde catalogus objecten per 'Id'.
+
+    Returns:
+        Het (deel van het) document zoals het geschreven is.
+    """
+    if isinstance(item, list):
+        return [_resolve(value, catalog=catalog) for value in item]
+    if not isinstance(item, dict):
+        return item
+    if _KEY_CATALOG_ID not in item:
+        return {key: _resolve(value, catalog=catalog) for key, value in item.items()}
+    keys_removed = item.get(_KEY_CATALOG_REMOVED, ())
+    resolved = {}
+    for key, value in catalog[item[_KEY_CATALOG_ID]].items():
+        if key in item:
+            resolved[key] = _resolve(item[key], catalog=catalog)
+        elif key not in keys_removed:
+            resolved[key] = _resolve(value, catalog=catalog)
+    for key, value in item.items():
+        if key not in resolved and key not in _KEYS_CATALOG:
+            resolved[key] = _resolve(value, catalog=catalog)
+    if keys_order := item.get(_KEY_CATALOG_ORDER):
+        resolved = {key: resolved[key] for key in keys_order}
+    return resolved
+
+
+def _serialize_datetime(obj: datetime) -> str:
+    """Converteert een datetime-object naar een ISO 8601 string.
+
+    Args:
+        obj (datetime): Het te serialiseren object.
+
+    Returns:
+        str: De ISO 8601 stringrepresentatie van het datetime-object.
+
+    Raises:
+        TypeError: Indien het object geen datetime is.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError("Type not serializable")
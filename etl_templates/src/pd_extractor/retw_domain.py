@@ -0,0 +1,288 @@
+import sys
+from collections.abc import MutableMapping
+
+# Velden met codes en namen die op veel objecten terugkomen; de waarden worden geïnterneerd zodat
+# gelijke strings maar één keer in het geheugen staan
+_KEYS_INTERNED = frozenset(
+    {
+        "Code",
+        "CodeEntity",
+        "CodeModel",
+        "Creator",
+        "DataType",
+        "DataTypeSQL",
+        "EntityAlias",
+        "Id",
+        "IdEntity",
+        "IdModel",
+        "JoinAlias",
+        "JoinAliasName",
+        "JoinType",
+        "Modifier",
+        "Name",
+        "NameEntity",
+        "NameModel",
+        "Operator",
+        "Stereotype",
+        "StereotypeEntity",
+    }
+)
+# Velden die op (vrijwel) alle Power Designer objecten voorkomen
+_FIELDS_OBJECT = (
+    "Id",
+    "ObjectID",
+    "Name",
+    "Code",
+    "CreationDate",
+    "Creator",
+    "ModificationDate",
+    "Modifier",
+    "Stereotype",
+    "Order",
+)
+
+
+class RETWObject(MutableMapping):
+    """Basis voor de compacte objecten waarmee de inhoud van een RETW-bestand in het geheugen staat.
+
+    De bekende velden van een object staan in slots, alle overige velden in een dictionary met extra velden, zodat de
+    omzetting van en naar RETW verliesvrij is. Een object gedraagt zich als een dictionary (ook in Jinja templates),
+    maar de velden zijn ook als attribuut op te vragen.
+    """
+
+    __slots__ = ("_extra",)
+    # Velden die zelf uit objecten (of lijsten van objecten) bestaan, met de bijbehorende klasse
+    _nested: dict = {}
+    _fields: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = frozenset(cls.__slots__)
+
+    def __init__(self, **fields):
+        self._extra = None
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_RETW(cls, data: dict) -> "RETWObject":
+        """Zet een object uit een RETW-bestand om naar een compact object.
+
+        Args:
+            data (dict): Het object zoals het in het RETW-bestand staat.
+
+        Returns:
+            RETWObject: Het compacte object.
+        """
+        obj = cls()
+        for key, value in data.items():
+            if (cls_nested := cls._nested.get(key)) is not None:
+                value = from_RETW(cls_nested, value)
+            obj[key] = value
+        return obj
+
+    def to_RETW(self) -> dict:
+        """Zet het object om naar de vorm waarin het in een RETW-bestand staat.
+
+        Returns:
+            dict: Het object als dictionary.
+        """
+        return {key: to_RETW(value) for key, value in self.items()}
+
+    def __getitem__(self, key: str):
+        if key in self._fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value) -> None:
+        if key in self._fields:
+            if key in _KEYS_INTERNED and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._fields:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key) -> bool:
+        if key in self._fields:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for key in self.__slots__:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def from_RETW(cls: type, value):
+    """Zet een (lijst van) object(en) uit een RETW-bestand om naar compacte objecten van de opgegeven klasse.
+
+    Args:
+        cls (type): De klasse van de compacte objecten.
+        value: Een object of een lijst van objecten uit een RETW-bestand.
+
+    Returns:
+        Het compacte object of de lijst met compacte objecten.
+    """
+    if isinstance(value, list):
+        return [cls.from_RETW(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return cls.from_RETW(value)
+    return value
+
+
+def to_RETW(value):
+    """Zet compacte objecten, ook als onderdeel van lijsten en dictionaries, terug naar de RETW vorm.
+
+    Args:
+        value: Een waarde die compacte objecten kan bevatten.
+
+    Returns:
+        De waarde met alle compacte objecten omgezet naar dictionaries.
+    """
+    if isinstance(value, RETWObject):
+        return value.to_RETW()
+    if isinstance(value, list):
+        return [to_RETW(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_RETW(item) for key, item in value.items()}
+    return value
+
+
+class Attribute(RETWObject):
+    """Attribuut van een entiteit, of een verwijzing naar een attribuut vanuit een mapping"""
+
+    __slots__ = _FIELDS_OBJECT + (
+        "DataType",
+        "Length",
+        "Precision",
+        "Domain",
+        "IdModel",
+        "NameModel",
+        "CodeModel",
+        "IsDocumentModel",
+        "IdEntity",
+        "NameEntity",
+        "CodeEntity",
+        "StereotypeEntity",
+        "EntityAlias",
+        "DataTypeSQL",
+        "is_on_name",
+    )
+
+
+class Entity(RETWObject):
+    """Entiteit uit een model, of een verwijzing naar een entiteit vanuit een mapping"""
+
+    __slots__ = _FIELDS_OBJECT + (
+        "Number",
+        "IdModel",
+        "NameModel",
+        "CodeModel",
+        "IsDocumentModel",
+        "Attributes",
+        "Variables",
+        "KeyPrimary",
+        "KeysForeign",
+        "SqlVariable",
+        "SqlExpression",
+        "SqlExpressionVariables",
+    )
+    _nested = {"Attributes": Attribute, "Variables": Attribute}
+
+
+class Model(RETWObject):
+    """Model uit een Power Designer document"""
+
+    __slots__ = _FIELDS_OBJECT + (
+        "IsDocumentModel",
+        "Author",
+        "Version",
+        "DataSources",
+        "Entities",
+    )
+    _nested = {"Entities": Entity}
+
+
+class JoinConditionComponents(RETWObject):
+    """Het parent en child attribuut van een join conditie"""
+
+    __slots__ = ("AttributeParent", "AttributeChild")
+    _nested = {"AttributeParent": Attribute, "AttributeChild": Attribute}
+
+
+class JoinCondition(RETWObject):
+    """Join conditie van een entiteit in de broncompositie van een mapping"""
+
+    __slots__ = _FIELDS_OBJECT + ("Operator", "ParentLiteral", "JoinConditionComponents")
+    _nested = {"JoinConditionComponents": JoinConditionComponents}
+
+
+class Composition(RETWObject):
+    """Entiteit in de broncompositie van een mapping, met de join en de condities"""
+
+    __slots__ = _FIELDS_OBJECT + (
+        "JoinAlias",
+        "JoinAliasName",
+        "JoinType",
+        "Entity",
+        "JoinConditions",
+        "SourceConditions",
+        "Expression",
+    )
+    _nested = {"Entity": Entity, "JoinConditions": JoinCondition}
+
+
+class AttributeMapping(RETWObject):
+    """Mapping van bronattributen of een expressie naar een attribuut van de doelentiteit"""
+
+    __slots__ = _FIELDS_OBJECT + ("AttributeTarget", "AttributesSource", "Expression")
+    _nested = {"AttributeTarget": Attribute, "AttributesSource": Attribute}
+
+
+class Mapping(RETWObject):
+    """Mapping van bronentiteiten naar een doelentiteit"""
+
+    __slots__ = _FIELDS_OBJECT + (
+        "DataSource",
+        "EntityTarget",
+        "SourceComposition",
+        "AttributeMapping",
+        "X_Hashkey",
+    )
+    _nested = {
+        "EntityTarget": Entity,
+        "SourceComposition": Composition,
+        "AttributeMapping": AttributeMapping,
+    }
@@ -0,0 +1,95 @@
+from logtools import get_logger
+
+logger = get_logger(__name__)
+
+# Extractieprofielen: 'full' bevat alles wat uit het Power Designer document is geëxtraheerd, 'lean'
+# alleen de velden die de afnemers van het RETW-bestand (Integrator, Generator en Deployment) gebruiken
+RETW_PROFILES = ("full", "lean")
+
+# Velden die in het 'lean' profiel overal worden weggelaten omdat geen enkele afnemer ze gebruikt
+RETW_FIELDS_PRUNED_LEAN = frozenset(
+    {
+        "Annotation",
+        "AutoMigrated",
+        "Comment",
+        "Description",
+        "Domain",
+        "ExtendedAttributesText",
+        "History",
+        "ModelOptions",
+        "ModelOptionsText",
+        "ObjectID",
+        "PackageOptions",
+        "PackageOptionsText",
+        "Relationships",
+        "RepositoryFilename",
+        "TargetClassID",
+        "TargetID",
+        "TargetModelClassID",
+        "TargetModelID",
+        "TargetModelLastModificationDate",
+        "TargetModelURL",
+        "TargetPackagePath",
+        "TargetStereotype",
+    }
+)
+# Audit velden worden alleen gebruikt voor de document informatie en de knopen van de graaf (modellen,
+# entiteiten en mappings) en worden in het 'lean' profiel bij alle onderliggende objecten weggelaten
+RETW_FIELDS_AUDIT = frozenset({"CreationDate", "Creator", "ModificationDate", "Modifier"})
+# Sleutels waaronder de document informatie en de objecten staan die een knoop in de graaf worden
+_KEYS_VERTEX = frozenset(
+    {"Info", "Models", "Entities", "Mappings", "Entity", "EntityTarget", "Entity1", "Entity2"}
+)
+# Prefixen van sleutels uit de Power Designer XML die na de transformatie zijn blijven staan
+_PREFIXES_POWER_DESIGNER = ("c:", "o:")
+
+
+def prune_RETW(dict_extract: dict, profile: str = "full") -> dict:
+    """Beperkt een geëxtraheerd document tot de velden van het opgegeven extractieprofiel.
+
+    Het document zelf wordt niet gewijzigd; bij het 'lean' profiel wordt een ingekorte kopie teruggegeven.
+
+    Args:
+        dict_extract (dict): Het geëxtraheerde document.
+        profile (str): Het extractieprofiel: 'full' of 'lean'.
+
+    Returns:
+        dict: Het document met alleen de velden van het profiel.
+
+    Raises:
+        ValueError: Indien het profiel onbekend is.
+    """
+    if profile not in RETW_PROFILES:
+        raise ValueError(
+            f"Onbekend RETW profiel '{profile}', kies uit: {', '.join(RETW_PROFILES)}"
+        )
+    if profile == "full":
+        return dict_extract
+    return {
+        key: _prune(value, is_vertex=key in _KEYS_VERTEX)
+        for key, value in dict_extract.items()
+        if key not in RETW_FIELDS_PRUNED_LEAN
+    }
+
+
+def _prune(item, is_vertex: bool = False):
+    """Laat de velden weg die niet tot het 'lean' profiel behoren.
+
+    Args:
+        item: Het (deel van het) document dat ingekort wordt.
+        is_vertex (bool): Of het item (of de items van de lijst) een knoop in de graaf wordt, waarvoor de audit velden behouden blijven.
+
+    Returns:
+        Het ingekorte (deel van het) document.
+    """
+    if isinstance(item, list):
+        return [_prune(value, is_vertex=is_vertex) for value in item]
+    if not isinstance(item, dict):
+        return item
+    return {
+        key: _prune(value, is_vertex=key in _KEYS_VERTEX)
+        for key, value in item.items()
+        if key not in RETW_FIELDS_PRUNED_LEAN
+        and not key.startswith(_PREFIXES_POWER_DESIGNER)
+        and (is_vertex or key not in RETW_FIELDS_AUDIT)
+    }
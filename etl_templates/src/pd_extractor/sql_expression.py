@@ -0,0 +1,67 @@
+import re
+from functools import lru_cache
+
+# Tokens van een SQL-expressie: systeemvariabelen (@@...) blijven tekst, @variabelen worden vervangen
+_PATTERN_TOKEN = re.compile(r"(@@\w+)|(@\w+)")
+
+
+class SqlExpression:
+    """Een SQL-expressie van een scalar of filter die eenmalig in tekst en @variabelen is opgedeeld.
+
+    Na het opdelen kunnen alle variabelen in één doorloop vervangen worden, ongeacht het aantal variabelen.
+    """
+
+    __slots__ = ("text", "variables", "_tokens")
+
+    def __init__(self, text: str):
+        """Deelt de SQL-expressie op in tekst en variabelen.
+
+        Args:
+            text (str): De SQL-expressie.
+        """
+        self.text = text
+        tokens = []
+        variables = []
+        pos = 0
+        for match in _PATTERN_TOKEN.finditer(text):
+            if match.group(2) is None:
+                continue
+            tokens.append(text[pos : match.start()])
+            tokens.append(match.group(2))
+            variables.append(match.group(2))
+            pos = match.end()
+        tokens.append(text[pos:])
+        # Tekst en variabelen wisselen elkaar af: de tokens op de oneven posities zijn de variabelen
+        self._tokens = tuple(tokens)
+        self.variables = tuple(variables)
+
+    def substitute(self, replacements: dict[str, str]) -> str:
+        """Vervangt de variabelen in de expressie in één doorloop.
+
+        Args:
+            replacements (dict[str, str]): De vervangende tekst per variabele (inclusief '@');
+                variabelen zonder vervanging blijven ongewijzigd.
+
+        Returns:
+            str: De expressie met de vervangen variabelen.
+        """
+        if not replacements:
+            return self.text
+        tokens = list(self._tokens)
+        for i in range(1, len(tokens), 2):
+            tokens[i] = replacements.get(tokens[i], tokens[i])
+        return "".join(tokens)
+
+
+@lru_cache(maxsize=1024)
+def parse_sql_expression(text: str) -> SqlExpression:
+    """Geeft de opgedeelde SQL-expressie; een expressie wordt maar één keer opgedeeld en daarna hergebruikt
+    voor alle mappings die dezelfde scalar of filter toepassen.
+
+    Args:
+        text (str): De SQL-expressie.
+
+    Returns:
+        SqlExpression: De opgedeelde SQL-expressie.
+    """
+    return SqlExpression(text)
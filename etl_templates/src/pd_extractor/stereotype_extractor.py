@@ -7,7 +7,15 @@ logger = get_logger(__name__)
 
 
 class StereotypeExtractor(BaseExtractor):
-    """Extraheert Power Designer document objecten die filters, aggregaten en scalars representeren"""
+    """Extraheert Power Designer document objecten die filters, aggregaten en scalars representeren
+
+    De entiteiten van het document worden eenmalig doorlopen en naar stereotype ingedeeld. Iedere groep wordt
+    bij het eerste gebruik één keer getransformeerd, waarna het resultaat gedeeld wordt door alle aanroepen.
+    """
+
+    STEREOTYPE_FILTER = "mdde_FilterBusinessRule"
+    STEREOTYPE_SCALAR = "mdde_ScalarBusinessRule"
+    STEREOTYPE_AGGREGATE = "mdde_AggregateBusinessRule"
 
     def __init__(self, pd_content: dict, file_pd_ldm: str):
         """Initialiseert StereotypeExtractor
@@ -19,22 +27,63 @@ class StereotypeExtractor(BaseExtractor):
         super().__init__(file_pd_ldm=file_pd_ldm)
         self.content = pd_content
         self.transform_stereotype = StereotypeTransformer(file_pd_ldm)
+        self._partitions = None
+        self._objects = {}
 
     def get_scalars(self, dict_domains: dict) -> list[dict]:
         return self._get_objects(
-            stereotype="mdde_ScalarBusinessRule", dict_domains=dict_domains
+            stereotype=self.STEREOTYPE_SCALAR, dict_domains=dict_domains
         )
 
     def get_aggregates(self, dict_domains: dict) -> list[dict]:
         return self._get_objects(
-            stereotype="mdde_AggregateBusinessRule", dict_domains=dict_domains
+            stereotype=self.STEREOTYPE_AGGREGATE, dict_domains=dict_domains
         )
 
     def get_filters(self, dict_domains: dict) -> list[dict]:
         return self._get_objects(
-            stereotype="mdde_FilterBusinessRule", dict_domains=dict_domains
+            stereotype=self.STEREOTYPE_FILTER, dict_domains=dict_domains
         )
 
+    def get_entities_model(self) -> list[dict]:
+        """Haalt de entiteiten op die tot het model behoren, in de volgorde van het document.
+
+        Filters en scalars worden door deze extractor verwerkt en maken geen deel uit van het model;
+        aggregaten zijn ook entiteiten van het model.
+
+        Returns:
+            list[dict]: De (ongewijzigde) entiteiten van het model
+        """
+        return self._partition_entities()[None]
+
+    def _partition_entities(self) -> dict[str | None, list[dict]]:
+        """Deelt de entiteiten van het document in één doorloop in naar stereotype.
+
+        Onder de sleutel None staan de entiteiten van het model, onder de stereotypes van filters, scalars
+        en aggregaten de betreffende objecten.
+
+        Returns:
+            dict[str | None, list[dict]]: De entiteiten per stereotype
+        """
+        if self._partitions is not None:
+            return self._partitions
+        entities = self.content["c:Entities"]["o:Entity"]
+        stereotypes_excluded = [self.STEREOTYPE_FILTER, self.STEREOTYPE_SCALAR]
+        partitions = {
+            None: [],
+            self.STEREOTYPE_FILTER: [],
+            self.STEREOTYPE_SCALAR: [],
+            self.STEREOTYPE_AGGREGATE: [],
+        }
+        for entity in entities:
+            stereotype = entity.get("Stereotype")
+            if stereotype not in stereotypes_excluded:
+                partitions[None].append(entity)
+            if stereotype is not None and stereotype in partitions:
+                partitions[stereotype].append(entity)
+        self._partitions = partitions
+        return partitions
+
     def _get_objects(self, stereotype: str, dict_domains: dict) -> list[dict]:
         """Haalt alle objecten van het opgegeven stereotype op gespecificeerd in de initialisatie
 
@@ -45,57 +94,41 @@ class StereotypeExtractor(BaseExtractor):
         Returns:
             list[dict]: Lijst van geschoonde objecten van het opgegeven stereotype
         """
-        objects_input = self.content["c:Entities"]["o:Entity"]
-        if isinstance(objects_input, dict):
-            objects_input = [objects_input]
-        model = self.content["a:Code"]
-
-        objects = []
-        for stereotype_object in objects_input:
-            if self._is_matching_stereotype(
-                stereotype_expected=stereotype, stereotype_object=stereotype_object
-            ):
-                self._clean_stereotype_object(
-                    stereotype_object=stereotype_object, model=model
-                )
-                objects.append(stereotype_object)
+        if stereotype in self._objects:
+            return self._objects[stereotype]
+        model = self.content["Code"]
+        objects = [
+            self._clean_stereotype_object(
+                stereotype_object=stereotype_object, model=model
+            )
+            for stereotype_object in self._partition_entities()[stereotype]
+        ]
         logger.debug(f"Start met transformaties voor stereotype uit {self.file_pd_ldm}")
-        self.transform_stereotype.transform(objects, dict_domains=dict_domains)
+        objects = self.transform_stereotype.transform(objects, dict_domains=dict_domains)
+        self._objects[stereotype] = objects
         return objects
 
-    def _is_matching_stereotype(
-        self, stereotype_expected: str, stereotype_object: dict
-    ) -> bool:
-        """Controleert of het object het opgegeven stereotype heeft.
+    def _clean_stereotype_object(self, stereotype_object: dict, model: str) -> dict:
+        """Maakt een geschoonde kopie van een stereotype object door overbodige velden weg te laten en het model toe te voegen.
 
-        Deze functie vergelijkt het stereotype van het object met het opgegeven stereotype en retourneert True als deze overeenkomen.
-
-        Args:
-            stereotype_object (dict): Het object waarvan het stereotype gecontroleerd wordt.
-
-        Returns:
-            bool: True als het stereotype overeenkomt, anders False.
-        """
-        return (
-            "a:Stereotype" in stereotype_object
-            and stereotype_object["a:Stereotype"] == stereotype_expected
-        )
-
-    def _clean_stereotype_object(self, stereotype_object: dict, model: str):
-        """Maakt een stereotype object schoon door overbodige velden te verwijderen en het model toe te voegen.
-
-        Deze functie voegt het model toe aan het object en verwijdert attributen die niet relevant zijn voor het opgegeven stereotype.
+        Deze functie voegt het model toe aan het object en laat attributen weg die niet relevant zijn voor het opgegeven stereotype.
 
         Args:
             stereotype_object (dict): Het object dat opgeschoond moet worden.
             model (str): De code van het model waartoe het object behoort.
+
+        Returns:
+            dict: Het geschoonde stereotype object.
         """
-        stereotype_object["CodeModel"] = model
         keys_to_remove = [
             "c:ExtendedCollections",
             "c:ExtendedCompositions",
             "c:DefaultMapping",
         ]
-        for key in keys_to_remove:
-            if key in stereotype_object:
-                stereotype_object.pop(key)
+        stereotype_object = {
+            key: value
+            for key, value in stereotype_object.items()
+            if key not in keys_to_remove
+        }
+        stereotype_object["CodeModel"] = model
+        return stereotype_object
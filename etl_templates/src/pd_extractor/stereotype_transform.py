@@ -1,8 +1,7 @@
-import re
-
 from logtools import get_logger
 
 from .base_transformer import BaseTransformer
+from .sql_expression import parse_sql_expression
 
 logger = get_logger(__name__)
 
@@ -23,7 +22,6 @@ class StereotypeTransformer(BaseTransformer):
         Returns:
             list: Geschoonde en verrijkte stereotype objecten
         """
-        stereo_types = self.clean_keys(stereo_types)
         for stereo_type in stereo_types:
             logger.debug(f"Start met het definiëren van object '{stereo_type['Name']}' in {self.file_pd_ldm}")
             stereo_type = self._object_variables(stereo_type=stereo_type, dict_domains=dict_domains)
@@ -110,18 +108,16 @@ class StereotypeTransformer(BaseTransformer):
         return stereo_type
 
     def _extract_and_clean_variables(self, stereo_type: dict) -> list[dict]:
-        """Extraheert en schoont de variabelen van een object.
+        """Extraheert de variabelen van een object als kopie, zodat deze verrijkt kunnen worden.
 
         Args:
             stereo_type (dict): Stereotype object
 
         Returns:
-            list[dict]: Geschoonde variabelen
+            list[dict]: Variabelen
         """
         variables = stereo_type["c:Attributes"]["o:EntityAttribute"]
-        variables = [variables] if isinstance(variables, dict) else variables
-        variables = self.clean_keys(variables)
-        return variables
+        return [dict(variable) for variable in variables]
 
     def _enrich_variables_with_domains(
         self, variables: list[dict], dict_domains: dict
@@ -137,7 +133,7 @@ class StereotypeTransformer(BaseTransformer):
         """
         for i, variable in enumerate(variables):
             variable["Order"] = i
-            path_keys = ["c:Domain", "o:Domain", "@Ref"]
+            path_keys = ["c:Domain", "o:Domain", "Ref"]
             if id_domain := self._get_nested(data=variable, keys=path_keys):
                 attr_domain = dict_domains[id_domain]
                 keys_domain = {"Id", "Name", "Code", "DataType", "Length", "Precision"}
@@ -162,7 +158,7 @@ class StereotypeTransformer(BaseTransformer):
         has_primary, primary_id = self._check_primary_identifier(stereo_type)
         logger.debug(f"Start met het verzamelen van identifiers voor object {stereo_type['Name']} for {self.file_pd_ldm}")
         if identifiers := self._extract_identifiers(stereo_type):
-            identifiers = self.clean_keys(identifiers)
+            identifiers = [dict(identifier) for identifier in identifiers]
             self._process_identifiers(
                 identifiers, stereo_type, dict_vars, has_primary, primary_id
             )
@@ -185,7 +181,7 @@ class StereotypeTransformer(BaseTransformer):
         has_primary = "c:PrimaryIdentifier" in stereo_type
         primary_id = None
         if has_primary:
-            primary_id = stereo_type["c:PrimaryIdentifier"]["o:Identifier"]["@Ref"]
+            primary_id = stereo_type["c:PrimaryIdentifier"]["o:Identifier"]["Ref"]
         return has_primary, primary_id
 
     def _extract_identifiers(self, stereo_type: dict) -> list | None:
@@ -200,11 +196,7 @@ class StereotypeTransformer(BaseTransformer):
             list | None: Lijst van identifiers of None als er geen identifiers zijn gevonden.
         """
         path_keys = ["c:Identifiers", "o:Identifier"]
-        if identifiers := self._get_nested(data=stereo_type, keys=path_keys):
-            if isinstance(identifiers, dict):
-                identifiers = [identifiers]
-            return identifiers
-        return None
+        return self._get_nested(data=stereo_type, keys=path_keys)
 
     def _process_identifiers(
         self,
@@ -231,8 +223,7 @@ class StereotypeTransformer(BaseTransformer):
             identifier["EntityCode"] = stereo_type["Code"]
             path_keys = ["c:Identifier.Attributes", "o:EntityAttribute"]
             if var_id := self._get_nested(data=identifier, keys=path_keys):
-                var_id = [var_id] if isinstance(var_id, dict) else var_id
-                var_id = [dict_vars[d["@Ref"]] for d in var_id]
+                var_id = [dict_vars[d["Ref"]] for d in var_id]
                 identifier["Variables"] = var_id
             else:
                 logger.error(
@@ -250,17 +241,4 @@ class StereotypeTransformer(BaseTransformer):
         Returns:
             list[str]: de individuele variabelen die samen de sql-expressie vormen
         """
-        expression_variables = []
-        k = sql_expression.count("@") # Count the number of placeholder variables in the SqlExpression
-        expression_variable = None
-        for _ in range(k):
-            idx_start = sql_expression.find("@", 1)
-            # Look for the first non word character after idx_start to not find the @ from the variable
-            find_non_alpha = re.search("[\W]", sql_expression[idx_start + 1 :])
-            # Idx_end is the start_position plus the position of the first alphanumeric character
-            idx_end = idx_start + find_non_alpha.start()
-            expression_variable = sql_expression[idx_start : idx_end + 1]
-            expression_variables = (*expression_variables, expression_variable)
-            # remove the variable from the sql_expression string
-            sql_expression = sql_expression[idx_end + 1 :]
-        return expression_variables
+        return list(parse_sql_expression(sql_expression).variables)
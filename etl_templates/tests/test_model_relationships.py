@@ -0,0 +1,95 @@
+import time
+
+from pd_extractor.model_transformers.model_relationships import RelationshipsTransformer
+
+# Aantal attributen per entiteit van het synthetische model
+QTY_ATTRIBUTES = 10
+
+
+def _create_model(qty_relationships: int) -> tuple[list[dict], list[dict]]:
+    """Maakt een synthetisch model met een entiteit per relatie, waarbij elke relatie een entiteit aan de volgende koppelt.
+
+    Args:
+        qty_relationships (int): Het aantal relaties (en entiteiten) van het model.
+
+    Returns:
+        tuple[list[dict], list[dict]]: De entiteiten en de relaties in de vorm van het Power Designer document.
+    """
+    entities = [
+        {
+            "Id": f"e{i}",
+            "Attributes": [{"Id": f"e{i}a{j}"} for j in range(QTY_ATTRIBUTES)],
+            "KeyPrimary": {"Id": f"e{i}k"},
+        }
+        for i in range(qty_relationships + 1)
+    ]
+    relationships = [
+        {
+            "Name": f"relationship_{i}",
+            "CreationDate": "1700000000",
+            "c:Object1": {"o:Entity": {"Ref": f"e{i + 1}"}},
+            "c:Object2": {"o:Entity": {"Ref": f"e{i}"}},
+            "c:Joins": {
+                "o:RelationshipJoin": [
+                    {
+                        "c:Object1": {"o:EntityAttribute": {"Ref": f"e{i + 1}a0"}},
+                        "c:Object2": {"o:EntityAttribute": {"Ref": f"e{i}a0"}},
+                    }
+                ]
+            },
+            "c:ParentIdentifier": {"o:Identifier": {"Ref": f"e{i}k"}},
+        }
+        for i in range(qty_relationships)
+    ]
+    return entities, relationships
+
+
+def _time_transform(qty_relationships: int, repeats: int = 5) -> float:
+    """Geeft de snelste doorlooptijd van het transformeren van de relaties van een synthetisch model."""
+    timings = []
+    for _ in range(repeats):
+        entities, relationships = _create_model(qty_relationships)
+        transformer = RelationshipsTransformer(file_pd_ldm="synthetic.ldm", entities=entities)
+        start = time.perf_counter()
+        transformer.transform(relationships)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_transform_relationships():
+    """De relaties worden verrijkt met de entiteiten, de join attributen en de identifiers van het model."""
+    entities, relationships = _create_model(qty_relationships=2)
+    transformer = RelationshipsTransformer(file_pd_ldm="synthetic.ldm", entities=entities)
+    relationships = transformer.transform(relationships)
+    assert len(relationships) == 2
+    assert relationships[0]["Entity1"]["Id"] == "e1"
+    assert relationships[0]["Entity2"]["Id"] == "e0"
+    assert relationships[0]["Identifiers"] == [{"Id": "e0k"}]
+
+
+def test_transform_relationships_builds_lookups_once(monkeypatch):
+    """De lookups van entiteiten, attributen en identifiers worden eenmalig per model opgebouwd, niet per relatie."""
+    calls = []
+    create_lookup = RelationshipsTransformer._create_attributes_lookup
+
+    def create_lookup_counted(self):
+        calls.append(1)
+        return create_lookup(self)
+
+    monkeypatch.setattr(RelationshipsTransformer, "_create_attributes_lookup", create_lookup_counted)
+    entities, relationships = _create_model(qty_relationships=100)
+    RelationshipsTransformer(file_pd_ldm="synthetic.ldm", entities=entities).transform(relationships)
+    assert len(calls) == 1
+
+
+def test_transform_relationships_scales_linearly():
+    """Een model met twee keer zoveel relaties (en entiteiten) kost ongeveer twee keer zoveel tijd.
+
+    Bij lookups die per relatie over alle entiteiten worden opgebouwd zou de doorlooptijd kwadratisch groeien
+    (factor 4); de ruime grens van factor 3 vangt meetruis op.
+    """
+    qty_relationships = 2000
+    _time_transform(qty_relationships)  # opwarmen
+    duration = _time_transform(qty_relationships)
+    duration_double = _time_transform(2 * qty_relationships)
+    assert duration_double < 3 * duration
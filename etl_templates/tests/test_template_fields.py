@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from generator.template_fields import get_template_fields
+from pd_extractor import RETW_FIELDS_PRUNED_LEAN
+
+DIR_TEMPLATES = Path(__file__).parents[1] / "src" / "generator" / "templates"
+
+
+@pytest.mark.parametrize(
+    "dir_platform",
+    sorted(path for path in DIR_TEMPLATES.iterdir() if path.is_dir()),
+    ids=lambda path: path.name,
+)
+def test_templates_use_no_fields_pruned_lean(dir_platform: Path):
+    """De templates mogen geen velden gebruiken die in het 'lean' extractieprofiel worden weggelaten."""
+    templates_fields = get_template_fields(dir_templates=dir_platform)
+    assert templates_fields
+    fields_pruned = {
+        name_template: sorted(fields & RETW_FIELDS_PRUNED_LEAN)
+        for name_template, fields in templates_fields.items()
+        if fields & RETW_FIELDS_PRUNED_LEAN
+    }
+    assert not fields_pruned, f"Templates gebruiken velden uit het 'lean' profiel: {fields_pruned}"
+
+
+def test_template_fields_detects_pruned_field(tmp_path: Path):
+    """Een template dat een weggelaten veld gebruikt wordt gevonden, zodat de controle niet ongemerkt leeg blijft."""
+    (tmp_path / "create_table.sql").write_text(
+        "{% for attribute in entity.Attributes %}{{ attribute['Comment'] }}"
+        "{% if 'Domain' in attribute %}{% endif %}{% endfor %}"
+    )
+    fields = get_template_fields(dir_templates=tmp_path)["create_table.sql"]
+    assert {"Comment", "Domain"} <= fields & RETW_FIELDS_PRUNED_LEAN